@@ -0,0 +1,42 @@
+"""
+Compare build time and archive size for every archive format and a few compression levels.
+
+Usage: python -m benchmarks.bench_archive_formats [config.json]
+"""
+import json
+import sys
+import timeit
+
+from benchmarks.bench_render_context import SAMPLE_CONFIG
+from generator.archive import ARCHIVE_FORMATS, available_formats
+from generator.skeleton import SkeletonEngine
+from models.config_model import ProjectConfig
+
+LEVELS = {
+    'zip': (0, 1, 6, 9),
+    'tar.gz': (1, 6, 9),
+    'tar.zst': (1, 3, 10, 19),
+}
+
+
+def main():
+    data = json.load(open(sys.argv[1])) if len(sys.argv) > 1 else SAMPLE_CONFIG
+    config = ProjectConfig(**data)
+    engine = SkeletonEngine()
+    # Warm the skeleton so that only archive assembly and compression differ between rows
+    engine.build_bytes(config)
+
+    print(f"{'format':<10} {'level':>5} {'build ms':>10} {'size KB':>10}")
+    for name in ARCHIVE_FORMATS:
+        if name not in available_formats():
+            print(f"{name:<10} {'-':>5} {'unavailable (optional dependency missing)':>22}")
+            continue
+        for level in LEVELS[name]:
+            fmt = ARCHIVE_FORMATS[name](level)
+            size = len(engine.build_bytes(config, fmt))
+            seconds = min(timeit.repeat(lambda: engine.build_bytes(config, fmt), number=3, repeat=3)) / 3
+            print(f"{name:<10} {level:>5} {seconds * 1e3:>10.1f} {size / 1024:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare rendering with the raw pydantic config against the flattened RenderContext.
+
+Usage: python -m benchmarks.bench_render_context [config.json]
+"""
+import json
+import sys
+import timeit
+
+from jinja2 import Environment
+
+from generator.context import RenderContext
+from models.config_model import ProjectConfig
+
+# The same checks expressed against the raw config and against the render context
+CHECKS = [
+    ("config.configuration.dependencyInjection.value == 'hilt'", "ctx.use_hilt"),
+    ("config.configuration.dependencyInjection.value == 'koin'", "ctx.use_koin"),
+    ("config.configuration.networking.value == 'retrofit'", "ctx.use_retrofit"),
+    ("config.configuration.networking.value == 'ktor'", "ctx.use_ktor"),
+    ("config.configuration.serialization.value == 'kotlinx-serialization'", "ctx.use_kotlinx_serialization"),
+    ("config.configuration.serialization.value == 'gson'", "ctx.use_gson"),
+    ("config.configuration.uiToolkit.value == 'jetpack-compose'", "ctx.is_compose"),
+    ("config.configuration.uiTheme.value == 'material3'", "ctx.is_material3"),
+    ("config.configuration.language.value == 'kotlin'", "ctx.is_kotlin"),
+    ("config.configuration.enableRoom", "ctx.enable_room"),
+    ("'camera' in config.configuration.permissions", "'camera' in ctx.permissions"),
+    ("config.configuration.localStorage.value == 'datastore'", "ctx.use_datastore"),
+]
+VALUES = [
+    ("config.project.package", "ctx.package"),
+    ("config.project.name.replace(' ', '')", "ctx.pascal_name"),
+    ("config.configuration.javaVersion.value", "ctx.java_version"),
+]
+# Roughly the number of checks a single build evaluates across all templates
+REPEAT = 10
+
+SAMPLE_CONFIG = {
+    "project": {"name": "Bench App", "package": "com.example.bench", "minSdk": 24, "targetSdk": 34, "compileSdk": 34},
+    "configuration": {
+        "projectName": "Bench App", "projectId": "com.example.bench", "uiToolkit": "jetpack-compose",
+        "networking": "retrofit", "serialization": "gson", "dependencyInjection": "hilt",
+        "localStorage": "datastore", "enableRoom": True, "uiTheme": "material3", "permissions": ["camera", "internet"],
+        "internationalization": {"enabled": False, "languages": []}, "lightDark": True, "httpNetworking": False,
+        "viewBinding": False, "language": "kotlin", "javaVersion": "17", "buildFormat": "kts",
+        "themeColors": {"primary": "#6750A4", "secondary": "#625B71", "tertiary": "#7D5260"},
+        "fontName": "roboto", "navigation": "compose-navigation", "useLibsVersionsToml": True,
+    },
+}
+
+
+def make_template(env: Environment, index: int) -> str:
+    body = ''.join(f'{{% if {check[index]} %}}x{{% endif %}}' for check in CHECKS)
+    body += ''.join(f'{{{{ {value[index]} }}}}' for value in VALUES)
+    return env.from_string(body * REPEAT)
+
+
+def main():
+    data = json.load(open(sys.argv[1])) if len(sys.argv) > 1 else SAMPLE_CONFIG
+    config = ProjectConfig(**data)
+    env = Environment()
+    raw_template = make_template(env, 0)
+    ctx_template = make_template(env, 1)
+    ctx = RenderContext(config)
+    assert raw_template.render(config=config) == ctx_template.render(ctx=ctx)
+
+    number = 2000
+    raw = min(timeit.repeat(lambda: raw_template.render(config=config), number=number, repeat=5)) / number
+    flat = min(timeit.repeat(lambda: ctx_template.render(ctx=ctx), number=number, repeat=5)) / number
+    build = min(timeit.repeat(lambda: RenderContext(config), number=number, repeat=5)) / number
+
+    print(f"raw config render:      {raw * 1e6:8.1f} us")
+    print(f"render context render:  {flat * 1e6:8.1f} us")
+    print(f"per-render saving:      {(raw - flat) * 1e6:8.1f} us ({(1 - flat / raw) * 100:.0f}%)")
+    print(f"RenderContext build:    {build * 1e6:8.1f} us (once per build)")
+
+
+if __name__ == '__main__':
+    main()
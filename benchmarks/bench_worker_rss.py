@@ -0,0 +1,100 @@
+"""
+Measure per-worker memory with and without preloading (PREFORK_PRELOAD) before the workers fork.
+
+Forks WORKERS processes per mode, the way gunicorn does, and has each one build every font family in a few
+project shapes before all of them report RSS, PSS (shared pages split between the processes that map them)
+and USS (pages only that worker holds). Linux only, since the figures come from /proc/self/smaps_rollup.
+
+Usage: python -m benchmarks.bench_worker_rss [workers]
+"""
+import copy
+import gc
+import multiprocessing
+import sys
+
+from benchmarks.bench_render_context import SAMPLE_CONFIG
+from models.config_model import ProjectConfig
+from models.enums import FontName
+
+SHAPES = [
+    {'uiToolkit': 'jetpack-compose', 'language': 'kotlin'},
+    {'uiToolkit': 'xml', 'language': 'kotlin'},
+    {'uiToolkit': 'xml', 'language': 'java'},
+]
+
+
+def _memory() -> dict:
+    """RSS, PSS and USS of the calling process in MB"""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return {
+        'rss': fields['Rss'],
+        'pss': fields['Pss'],
+        'uss': fields['Private_Clean'] + fields['Private_Dirty'],
+    }
+
+
+def _worker(engine, ready, results):
+    for font in FontName:
+        for shape in SHAPES:
+            data = copy.deepcopy(SAMPLE_CONFIG)
+            data['configuration'].update(shape, fontName=font.value)
+            engine.build_bytes(ProjectConfig(**data))
+    # Measure while every worker is alive, so shared pages are split between all of them
+    ready.wait()
+    results.put(_memory())
+    ready.wait()
+
+
+def run(preload: bool, workers: int) -> dict:
+    from generator.builder import compile_templates
+    from generator.fonts import use_asset_store
+    from generator.presets import PresetRegistry
+    from generator.skeleton import SkeletonEngine
+
+    if preload:
+        use_asset_store()
+        PresetRegistry().warm()
+        compile_templates()
+        gc.freeze()
+    engine = SkeletonEngine()
+
+    context = multiprocessing.get_context('fork')
+    ready = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=_worker, args=(engine, ready, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    samples = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {key: sum(sample[key] for sample in samples) / len(samples) for key in ('rss', 'pss', 'uss')}
+
+
+def main():
+    if len(sys.argv) > 2:
+        # Child run of one mode, so neither mode inherits the other's caches
+        print(run(sys.argv[2] == 'preload', int(sys.argv[1])))
+        return
+
+    import ast
+    import subprocess
+
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    print(f"{workers} workers, mean per worker")
+    print(f"{'mode':<16} {'RSS MB':>8} {'PSS MB':>8} {'USS MB':>8}")
+    for mode, label in (('lazy', 'no preload'), ('preload', 'preload')):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_worker_rss', str(workers), mode],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        figures = ast.literal_eval(output.strip().splitlines()[-1])
+        print(f"{label:<16} {figures['rss']:>8.1f} {figures['pss']:>8.1f} {figures['uss']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .readiness import BuildTracker
+
+# Request tiers with separate rate limit budgets
+CHEAP = 'cheap'
+EXPENSIVE = 'expensive'
+
+# Endpoints that build archives; everything else (health, previews, preset listing) is cheap
+_EXPENSIVE_ROUTES = (
+    ('POST', '/generate'),
+    ('POST', '/generate/diff'),
+)
+_EXPENSIVE_PREFIXES = (
+    ('GET', '/presets/'),
+)
+
+# Probes from the load balancer; limiting them would report overload as an unhealthy instance
+_EXEMPT_PATHS = ('/health', '/ready')
+
+
+def request_tier(method: str, path: str) -> str:
+    """Rate limit tier of a request"""
+    path = path.rstrip('/') or '/'
+    if (method, path) in _EXPENSIVE_ROUTES:
+        return EXPENSIVE
+    if any(method == m and path.startswith(prefix) for m, prefix in _EXPENSIVE_PREFIXES):
+        return EXPENSIVE
+    return CHEAP
+
+
+def _key_digest(key: bytes) -> str:
+    return hashlib.sha256(key).hexdigest()[:32]
+
+
+def load_api_keys(keys: Iterable[str] = (), path: Optional[str] = None) -> FrozenSet[str]:
+    """Digests of the API keys given and of those in path (one per line, # comments), for client_identity"""
+    keys = list(keys)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            keys += [line.split('#', 1)[0] for line in f]
+    return frozenset(_key_digest(key.strip().encode('utf-8')) for key in keys if key.strip())
+
+
+def client_identity(scope: dict, api_keys: FrozenSet[str] = frozenset()) -> str:
+    """
+    API key (hashed, so keys are not kept in memory) if it is one of api_keys, else the client address
+    of an ASGI request. Any other key is ignored, so sending a fresh key per request cannot get a fresh budget.
+    """
+    if api_keys:
+        for name, value in scope.get('headers') or ():
+            if name == b'x-api-key' and value:
+                digest = _key_digest(value)
+                if digest in api_keys:
+                    return 'key:' + digest
+                break
+    client = scope.get('client')
+    return 'ip:' + (client[0] if client else 'unknown')
+
+
+class RateLimiter:
+    """
+    Token bucket per client: rate tokens per second up to burst. The least recently seen clients are
+    forgotten beyond max_clients, which only ever gives them a full bucket again.
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.max_clients = max_clients
+        self.limited = 0
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def acquire(self, client: str, now: Optional[float] = None) -> float:
+        """Take a token for client; return 0 if admitted, else the seconds until a token is available"""
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, last = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1.0:
+                wait = 0.0
+                tokens -= 1.0
+            else:
+                wait = (1.0 - tokens) / self.rate
+                self.limited += 1
+            self._buckets[client] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def stats(self) -> dict:
+        return {'rate': self.rate, 'burst': self.burst, 'clients': len(self._buckets), 'limited': self.limited}
+
+
+class LoadShedder:
+    """
+    Tracks how long requests wait before they are served, as the lag of a periodic event loop probe
+    (archive builds run on the loop, so a busy loop is the request queue), smoothed with an EWMA.
+    Expensive requests are shed while the smoothed delay exceeds max_delay.
+    """
+
+    def __init__(self, max_delay: float = 1.0, interval: float = 0.1, smoothing: float = 0.2):
+        self.max_delay = max_delay
+        self.interval = interval
+        self.smoothing = smoothing
+        self.delay = 0.0
+        self.shed = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_delay > 0
+
+    @property
+    def overloaded(self) -> bool:
+        return self.enabled and self.delay > self.max_delay
+
+    def record(self, delay: float):
+        """Add one queue delay sample (seconds)"""
+        self.delay += self.smoothing * (max(delay, 0.0) - self.delay)
+
+    def retry_after(self) -> int:
+        """0 if a request can be admitted, else the whole seconds a client should wait before retrying"""
+        if not self.overloaded:
+            return 0
+        self.shed += 1
+        return max(1, math.ceil(self.delay))
+
+    def start(self):
+        """Start the event loop probe on the running loop"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _probe(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - start - self.interval)
+
+    def stats(self) -> dict:
+        return {'queue_delay_ms': round(self.delay * 1000, 1), 'max_delay_ms': self.max_delay * 1000, 'shed': self.shed}
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that sheds expensive requests under load and rate limits every request per client;
+    admitted expensive requests are counted by the tracker until their response is sent
+    """
+
+    def __init__(self, app, limiters: Dict[str, RateLimiter], shedder: LoadShedder,
+                 tracker: Optional[BuildTracker] = None, api_keys: FrozenSet[str] = frozenset()):
+        self.app = app
+        self.limiters = limiters
+        self.shedder = shedder
+        self.tracker = tracker
+        # Digests of the API keys that get a budget of their own (see load_api_keys)
+        self.api_keys = api_keys
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] in _EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        tier = request_tier(scope['method'], scope['path'])
+        if tier == EXPENSIVE:
+            retry_after = self.shedder.retry_after()
+            if retry_after:
+                await _reject(send, 503, retry_after, "Server is overloaded, retry later")
+                return
+
+        wait = self.limiters[tier].acquire(client_identity(scope, self.api_keys))
+        if wait:
+            await _reject(send, 429, max(1, math.ceil(wait)), "Rate limit exceeded")
+            return
+        if tier != EXPENSIVE or self.tracker is None:
+            await self.app(scope, receive, send)
+            return
+
+        self.tracker.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.tracker.request_finished()
+
+
+async def _reject(send, status: int, retry_after: int, detail: str):
+    body = json.dumps({'detail': detail}).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('ascii')),
+            (b'retry-after', str(retry_after).encode('ascii')),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
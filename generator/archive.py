@@ -0,0 +1,287 @@
+import abc
+import gzip
+import hashlib
+import io
+import struct
+import tarfile
+import time
+import zlib
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # tar.zst is only offered when zstandard is installed
+    zstandard = None
+
+DEFAULT_ZIP_LEVEL = 6
+
+# ZIP general purpose flag: file names are UTF-8
+_UTF8_FLAG = 0x0800
+_EXTERNAL_ATTR = 0o100644 << 16
+
+
+def _dos_datetime(timestamp: Optional[float] = None):
+    t = time.localtime(timestamp)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+class ZipEntry:
+    """A single ZIP member whose payload is compressed once and can be reused across archives"""
+
+    __slots__ = ('name', 'payload', 'crc', 'size', 'method', '_sha256')
+
+    def __init__(self, name: str, payload: bytes, crc: int, size: int, method: int,
+                 sha256: Optional[str] = None):
+        self.name = name
+        self.payload = payload
+        self.crc = crc
+        self.size = size
+        self.method = method
+        self._sha256 = sha256
+
+    @classmethod
+    def from_bytes(cls, name: str, data: bytes, level: int = DEFAULT_ZIP_LEVEL) -> 'ZipEntry':
+        """Compress data with raw deflate (or store it when level is 0)"""
+        if level == 0:
+            return cls(name, data, zlib.crc32(data), len(data), 0)
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        payload = compressor.compress(data) + compressor.flush()
+        return cls(name, payload, zlib.crc32(data), len(data), 8)
+
+    @property
+    def mapped(self) -> bool:
+        """Whether the payload is a view of a shared mapping (see AssetStore) rather than bytes of its own"""
+        return isinstance(self.payload, memoryview)
+
+    def renamed(self, name: str) -> 'ZipEntry':
+        """Return the same compressed payload under a different archive name"""
+        return ZipEntry(name, self.payload, self.crc, self.size, self.method, self._sha256)
+
+    def data(self) -> bytes:
+        """Return the uncompressed content"""
+        if self.method == 0:
+            return self.payload
+        return zlib.decompress(self.payload, -zlib.MAX_WBITS)
+
+    def sha256(self) -> str:
+        """Return the hex SHA-256 of the uncompressed content, computed once per entry"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data()).hexdigest()
+        return self._sha256
+
+
+class ZipLayer:
+    """
+    Prebuilt start of a ZIP archive: the local headers and payloads of a fixed run of entries plus their
+    central directory records, so archives that begin with those entries only append the rest
+    """
+
+    __slots__ = ('body', 'central', 'count', 'names')
+
+    def __init__(self, body: bytes, central: bytes, count: int, names: frozenset):
+        self.body = body
+        self.central = central
+        self.count = count
+        self.names = names
+
+    @classmethod
+    def build(cls, entries: Iterable[ZipEntry], timestamp: Optional[float] = None) -> 'ZipLayer':
+        """Serialize entries once, stamped with timestamp (now by default)"""
+        entries = list(entries)
+        body, central = bytearray(), bytearray()
+        _append_entries(body, central, entries, *_dos_datetime(timestamp))
+        return cls(bytes(body), bytes(central), len(entries), frozenset(entry.name for entry in entries))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.body) + len(self.central)
+
+
+def _append_entries(body: bytearray, central: bytearray, entries: Iterable[ZipEntry], dos_time: int, dos_date: int) -> int:
+    """Append local records to body and central directory records to central; return the entry count"""
+    count = 0
+    for entry in entries:
+        name = entry.name.encode('utf-8')
+        offset = len(body)
+        body += struct.pack(
+            '<IHHHHHIIIHH', 0x04034b50, 20, _UTF8_FLAG, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.payload), entry.size, len(name), 0,
+        )
+        body += name
+        body += entry.payload
+        central += struct.pack(
+            '<IHHHHHHIIIHHHHHII', 0x02014b50, 0x0314, 20, _UTF8_FLAG, entry.method, dos_time, dos_date,
+            entry.crc, len(entry.payload), entry.size, len(name), 0, 0, 0, 0, _EXTERNAL_ATTR, offset,
+        )
+        central += name
+        count += 1
+    return count
+
+
+def write_zip(entries: Iterable[ZipEntry], timestamp: Optional[float] = None, base: Optional[ZipLayer] = None) -> bytes:
+    """
+    Assemble a ZIP archive from already-compressed entries. With a base layer the archive starts with the
+    layer's entries (copied as bytes) and entries are appended after them; entries must not repeat its names.
+    """
+    body = bytearray(base.body) if base is not None else bytearray()
+    central = bytearray(base.central) if base is not None else bytearray()
+    count = base.count if base is not None else 0
+    count += _append_entries(body, central, entries, *_dos_datetime(timestamp))
+
+    central_offset = len(body)
+    body += central
+    body += struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, count, count, len(central), central_offset, 0)
+    return bytes(body)
+
+
+class ArchiveFormat(abc.ABC):
+    """Serializes rendered project entries into one downloadable archive"""
+
+    name = ''
+    media_type = ''
+    extension = ''
+    levels = range(0)
+    default_level = 0
+
+    def __init__(self, level: Optional[int] = None):
+        level = self.default_level if level is None else level
+        if level not in self.levels:
+            raise ValueError(
+                f"Invalid {self.name} compression level {level}; expected {self.levels.start}-{self.levels.stop - 1}"
+            )
+        self.level = level
+
+    @property
+    def is_default(self) -> bool:
+        return isinstance(self, ZipFormat) and self.level == DEFAULT_ZIP_LEVEL
+
+    def cache_key(self, key: str) -> str:
+        """Artifact cache key of an archive in this format; the default ZIP keeps the bare config key"""
+        return key if self.is_default else f'{key}:{self.name}:{self.level}'
+
+    @abc.abstractmethod
+    def write(self, entries: Iterable[ZipEntry]) -> bytes:
+        """The archive of entries"""
+
+
+class ZipFormat(ArchiveFormat):
+    """ZIP, stored (level 0) or deflated"""
+
+    name = 'zip'
+    media_type = 'application/zip'
+    extension = '.zip'
+    levels = range(0, 10)
+    default_level = DEFAULT_ZIP_LEVEL
+
+    def write(self, entries: Iterable[ZipEntry]) -> bytes:
+        if self.level != DEFAULT_ZIP_LEVEL:
+            # Entries arrive compressed at the default level
+            entries = (ZipEntry.from_bytes(entry.name, entry.data(), self.level) for entry in entries)
+        return write_zip(entries)
+
+
+class TarFormat(ArchiveFormat):
+    """Uncompressed tar stream, wrapped by the compressed subclasses"""
+
+    def write(self, entries: Iterable[ZipEntry]) -> bytes:
+        buffer = io.BytesIO()
+        mtime = int(time.time())
+        with tarfile.open(fileobj=buffer, mode='w', format=tarfile.PAX_FORMAT) as tar:
+            for entry in entries:
+                data = entry.data()
+                info = tarfile.TarInfo(entry.name)
+                info.size = len(data)
+                info.mtime = mtime
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+        return self.compress(buffer.getvalue())
+
+    @abc.abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """The compressed tar stream"""
+
+
+class TarGzFormat(TarFormat):
+    name = 'tar.gz'
+    media_type = 'application/gzip'
+    extension = '.tar.gz'
+    levels = range(1, 10)
+    default_level = 6
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level)
+
+
+class TarZstFormat(TarFormat):
+    name = 'tar.zst'
+    media_type = 'application/zstd'
+    extension = '.tar.zst'
+    levels = range(1, 23)
+    default_level = 10
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+
+ARCHIVE_FORMATS = {fmt.name: fmt for fmt in (ZipFormat, TarGzFormat, TarZstFormat)}
+
+# Accept header media types mapped to formats
+_MEDIA_TYPES = {
+    'application/zip': 'zip',
+    'application/x-zip-compressed': 'zip',
+    'application/gzip': 'tar.gz',
+    'application/x-gzip': 'tar.gz',
+    'application/x-gtar': 'tar.gz',
+    'application/x-tar+gzip': 'tar.gz',
+    'application/zstd': 'tar.zst',
+    'application/x-zstd': 'tar.zst',
+    'application/x-tar+zstd': 'tar.zst',
+}
+
+
+def available_formats() -> List[str]:
+    """Names of the archive formats this installation can produce"""
+    return [name for name in ARCHIVE_FORMATS if name != 'tar.zst' or zstandard is not None]
+
+
+def get_format(name: str, level: Optional[int] = None) -> ArchiveFormat:
+    """Return the named archive format, raising ValueError if it is unknown or unavailable"""
+    if name not in available_formats():
+        raise ValueError(f"Unsupported archive format {name!r}; available: {', '.join(available_formats())}")
+    return ARCHIVE_FORMATS[name](level)
+
+
+def _parse_accept(accept: str) -> List[Tuple[float, str]]:
+    ranges = []
+    for index, part in enumerate(accept.split(',')):
+        media, *params = [item.strip() for item in part.split(';')]
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if media and quality > 0:
+            ranges.append((-quality, index, media.lower()))
+    return [(-quality, media) for quality, _, media in sorted(ranges)]
+
+
+def negotiate_format(accept: Optional[str], name: Optional[str] = None,
+                     level: Optional[int] = None) -> Optional[ArchiveFormat]:
+    """
+    Pick the archive format from an explicit name, else from the Accept header. An Accept header that names
+    no available archive type (e.g. application/json) gets the default ZIP. Returns None only when the
+    explicit name is unknown or unavailable; ValueError for an invalid level.
+    """
+    if name:
+        return get_format(name, level) if name in available_formats() else None
+    available = available_formats()
+    for _, media in _parse_accept(accept or ''):
+        if media in ('*/*', 'application/*'):
+            break
+        if _MEDIA_TYPES.get(media) in available:
+            return get_format(_MEDIA_TYPES[media], level)
+    return get_format('zip', level)
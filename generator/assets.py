@@ -0,0 +1,152 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .archive import DEFAULT_ZIP_LEVEL, ZipEntry
+
+try:
+    import fcntl
+except ImportError:  # No cross-process lock (Windows); concurrent packers still replace the file atomically
+    fcntl = None
+
+# Built at image build time by `python -m generator.assets`
+BUNDLE_FILE = Path(__file__).parent / 'assets.bin'
+
+_MAGIC = b'APGASSETS1\n'
+_HEADER = struct.Struct('<I')
+
+
+def _fingerprint(sources: Dict[str, Path]) -> str:
+    """Changes whenever a source file is added, removed or modified"""
+    parts = []
+    for name in sorted(sources):
+        stat = sources[name].stat()
+        parts.append(f'{name}:{stat.st_size}:{stat.st_mtime_ns}')
+    return str(zlib.crc32('\n'.join(parts).encode('utf-8')))
+
+
+class AssetStore:
+    """
+    Binary assets packed into one file, each stored raw and as a raw deflate payload, and mapped read-only.
+    The mapping is backed by the page cache, so every process that maps the file shares one copy of it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        if bytes(view[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError(f"Not an asset store: {self.path}")
+        start = len(_MAGIC) + _HEADER.size
+        (index_size,) = _HEADER.unpack_from(view, len(_MAGIC))
+        index = json.loads(bytes(view[start:start + index_size]))
+        # Offsets in the index are relative to the data that follows it
+        data = view[start + index_size:]
+        self.fingerprint: str = index['fingerprint']
+        # name -> (raw view, shared ZipEntry)
+        self._assets: Dict[str, Tuple[memoryview, ZipEntry]] = {}
+        # (size, crc) -> name, to recognise asset content handed around as plain bytes
+        self._by_content: Dict[Tuple[int, int], str] = {}
+        self._sizes = set()
+        for name, (offset, size, payload_offset, payload_size, crc) in index['assets'].items():
+            raw = data[offset:offset + size]
+            payload = data[payload_offset:payload_offset + payload_size]
+            self._assets[name] = raw, ZipEntry(name, payload, crc, size, 8)
+            self._by_content[(size, crc)] = name
+            self._sizes.add(size)
+
+    @classmethod
+    def pack(cls, path: Path, sources: Dict[str, Path], level: int = DEFAULT_ZIP_LEVEL):
+        """Write sources (asset name -> file) to path, replacing any previous store atomically"""
+        path = Path(path)
+        chunks, assets, offset = [], {}, 0
+        for name in sorted(sources):
+            data = sources[name].read_bytes()
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+            payload = compressor.compress(data) + compressor.flush()
+            assets[name] = [offset, len(data), offset + len(data), len(payload), zlib.crc32(data)]
+            chunks += [data, payload]
+            offset += len(data) + len(payload)
+
+        header = json.dumps({'fingerprint': _fingerprint(sources), 'assets': assets}).encode('utf-8')
+
+        temp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        with open(temp, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_HEADER.pack(len(header)))
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp, path)
+
+    @classmethod
+    def open(cls, path: Path, sources: Dict[str, Path]) -> 'AssetStore':
+        """
+        Map the store at path, packing it first when it is missing or its sources changed. Packing holds
+        an exclusive lock, so workers starting together pack once and map the same file.
+        """
+        path = Path(path)
+        fingerprint = _fingerprint(sources)
+        store = cls._open_current(path, fingerprint)
+        if store is not None:
+            return store
+        with open(path.with_name(path.name + '.lock'), 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            store = cls._open_current(path, fingerprint)
+            if store is None:
+                cls.pack(path, sources)
+                store = cls(path)
+        return store
+
+    @classmethod
+    def _open_current(cls, path: Path, fingerprint: str) -> Optional['AssetStore']:
+        try:
+            store = cls(path)
+        except (OSError, ValueError):
+            return None
+        return store if store.fingerprint == fingerprint else None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._assets
+
+    def raw(self, name: str) -> memoryview:
+        """Uncompressed content of an asset, without copying it out of the mapping"""
+        return self._assets[name][0]
+
+    def entry(self, name: str, path: str) -> ZipEntry:
+        """The asset's shared compressed ZIP entry, named path"""
+        return self._assets[name][1].renamed(path)
+
+    def entry_for(self, path: str, data: bytes) -> Optional[ZipEntry]:
+        """The shared ZIP entry for data if it is the content of an asset, else None"""
+        if len(data) not in self._sizes:
+            return None
+        name = self._by_content.get((len(data), zlib.crc32(data)))
+        if name is None or self._assets[name][0] != data:
+            return None
+        return self.entry(name, path)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._map)
+
+
+def main():
+    """Pack every binary asset into BUNDLE_FILE, or the path given"""
+    from .fonts import font_sources
+
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else BUNDLE_FILE
+    sources = font_sources()
+    AssetStore.pack(path, sources)
+    print(f"Packed {len(sources)} assets into {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,67 @@
-import glob
 import os
-import shutil
 import tempfile
-import zipfile
-from pathlib import Path
+import threading
+from pathlib import Path, PurePosixPath
+from typing import Callable, Dict, Optional
 from jinja2 import Environment, FileSystemLoader
 from models.config_model import ProjectConfig
-from models.enums import Language, UIToolkit
+from models.enums import Permission
+from .archive import ArchiveFormat, ZipFormat
+from .context import RenderContext
+from .dependencies import DEPENDENCY_FILTERS
+from .fonts import font_files, zip_entry
+from .icons import launcher_icon_files
+from .modules import ANDROID_LIBRARY_CONVENTION, JVM_LIBRARY_CONVENTION
+from .room import schema_json
 from .utils import ProjectUtils
 from .template.compose_templates import ComposeTemplates
 from .template.xml_templates import XmlTemplates
 from .template.gradle_templates import GradleTemplates
 from .template.common_templates import CommonTemplates
 from .template.test_templates import TestTemplates
+from .template.proguard_templates import ProguardTemplates
+from .template.benchmark_templates import BenchmarkTemplates
+from .template.module_templates import ModuleTemplates
+from .template.room_templates import RoomTemplates
+from .template.startup_templates import StartupTemplates
+from .template.api_templates import ApiTemplates
+
+_TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+# One environment per process, so every builder (and every module of a project) reuses the compiled
+# templates; the template files only change on deploy, so they are not re-checked on each lookup
+_jinja_env: Optional[Environment] = None
+_jinja_lock = threading.Lock()
+
+
+def templates_loaded() -> bool:
+    """Whether the shared Jinja2 environment (the template registry) has been created"""
+    return _jinja_env is not None
+
+
+def compile_templates():
+    """Compile every template of the shared environment, e.g. in a server's master process before it forks"""
+    if _jinja_env is not None:
+        for name in _jinja_env.list_templates():
+            _jinja_env.get_template(name)
+
+
+def template_environment(config: ProjectConfig) -> Environment:
+    """The shared Jinja2 environment, for files rendered outside a builder (e.g. from an uploaded OpenAPI document)"""
+    return _jinja_env if _jinja_env is not None else AndroidProjectBuilder(config).jinja_env
+
 
 class AndroidProjectBuilder:
     """Main builder class for generating Android projects"""
     
-    def __init__(self, config: ProjectConfig):
+    def __init__(self, config: ProjectConfig, ctx: Optional[RenderContext] = None, launcher_icons: bool = True):
         self.utils = ProjectUtils()
         self.config = config
-        
-        # Setup Jinja2 environment
-        template_dir = Path(__file__).parent / 'templates'
-        template_dir.mkdir(exist_ok=True)
-        self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self.ctx = ctx or RenderContext(config)
+        self.launcher_icons = launcher_icons
+        self.files: Dict[str, bytes] = {}
+        self._plan: Dict[str, Callable[[], bytes]] = {}
+        self._rendered: Dict[tuple, bytes] = {}
         
         # Initialize template handlers
         self.compose_templates = ComposeTemplates(self.config)
@@ -32,13 +69,30 @@ class AndroidProjectBuilder:
         self.gradle_templates = GradleTemplates(self.config)
         self.common_templates = CommonTemplates(self.config)
         self.test_templates = TestTemplates(self.config)
+        self.proguard_templates = ProguardTemplates(self.config)
+        self.benchmark_templates = BenchmarkTemplates(self.config)
+        self.module_templates = ModuleTemplates(self.config)
+        self.room_templates = RoomTemplates(self.config)
+        self.startup_templates = StartupTemplates(self.config)
+        self.api_templates = ApiTemplates(self.config)
         
-        # Create templates directory and files if they don't exist
-        self._create_default_templates()
+        # Setup the shared Jinja2 environment, creating missing template files on first use
+        self.jinja_env = self._shared_environment()
+
+    def _shared_environment(self) -> Environment:
+        """Return the process-wide Jinja2 environment, creating it on first use"""
+        global _jinja_env
+        with _jinja_lock:
+            if _jinja_env is None:
+                self._create_default_templates()
+                env = Environment(loader=FileSystemLoader(str(_TEMPLATE_DIR)), auto_reload=False)
+                env.filters.update(DEPENDENCY_FILTERS)
+                _jinja_env = env
+            return _jinja_env
     
     def _create_default_templates(self):
         """Create default templates if they don't exist"""
-        templates_dir = Path(__file__).parent / 'templates'
+        templates_dir = _TEMPLATE_DIR
         templates_dir.mkdir(exist_ok=True)
         
         # Get all template files from different handlers
@@ -48,6 +102,11 @@ class AndroidProjectBuilder:
         template_files.update(self.compose_templates.get_templates())
         template_files.update(self.common_templates.get_templates())
         template_files.update(self.test_templates.get_templates())
+        template_files.update(self.benchmark_templates.get_templates())
+        template_files.update(self.module_templates.get_templates())
+        template_files.update(self.room_templates.get_templates())
+        template_files.update(self.startup_templates.get_templates())
+        template_files.update(self.api_templates.get_templates())
         
         for filename, content in template_files.items():
             template_path = templates_dir / filename
@@ -57,263 +116,351 @@ class AndroidProjectBuilder:
     
     def build(self) -> str:
         """Build the Android project and return ZIP file path"""
-        # Create temporary directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir) / self.utils.sanitize_project_name(self.config.project.name)
-            
-            # Create project structure
-            self._create_project_structure(project_dir)
-            
-            # Generate files
-            self._generate_root_files(project_dir)
-            self._generate_app_files(project_dir)
-            self._generate_test_files(project_dir)
-            
-            self._copy_font_files(project_dir)
-
-            # Create ZIP file
-            zip_path = tempfile.mktemp(suffix='.zip')
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(project_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        archive_name = file_path.relative_to(project_dir.parent)
-                        zipf.write(file_path, archive_name)
-            
-            return zip_path
-    
-    def _create_project_structure(self, project_dir: Path):
-        """Create the basic Android project directory structure"""
-        package_path = self.utils.package_to_path(self.config.project.package)
-        language_dir = self.config.configuration.language.value
-        directories = [
-            'app/src/main',
-            f'app/src/main/{language_dir}/{package_path}',
-            f'app/src/test/{language_dir}/{package_path}',
-            f'app/src/androidTest/{language_dir}/{package_path}',
-            'app/src/main/res/layout',
-            'app/src/main/res/values',
-            'app/src/main/res/values-night',
-            'app/src/main/res/drawable',
-            'app/src/main/res/mipmap-hdpi',
-            'app/src/main/res/mipmap-mdpi',
-            'app/src/main/res/mipmap-xhdpi',
-            'app/src/main/res/mipmap-xxhdpi',
-            'app/src/main/res/mipmap-xxxhdpi',
-            'app/src/main/res/xml',
-            'gradle/wrapper',
-            'app/src/main/res/font'
-        ]
-        
-        # Add internationalization directories
-        if self.config.configuration.internationalization.enabled:
-            for lang in self.config.configuration.internationalization.languages, []:
-                if lang != 'en':
-                    directories.append(f'app/src/main/res/values-{lang}')
-        
-        # Add compose theme directory if using Jetpack Compose
-        if self.config.configuration.uiToolkit == UIToolkit.compose:
-            directories.append(f'app/src/main/{language_dir}/{package_path}/ui/theme')
-        
-        self.utils.create_directories(project_dir, directories)
-    
-    def _copy_font_files(self, project_dir : str):
+        fd, zip_path = tempfile.mkstemp(suffix='.zip')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.build_bytes())
+        return zip_path
+
+    def build_bytes(self, archive_format: Optional[ArchiveFormat] = None) -> bytes:
+        """Build the Android project and return the archive bytes (ZIP by default)"""
+        return (archive_format or ZipFormat()).write(
+            zip_entry(name, data) for name, data in self.render_files().items()
+        )
+
+    def render_files(self) -> Dict[str, bytes]:
+        """Render every project file in memory, keyed by archive path"""
+        self.files = {path: render() for path, render in self.plan_files().items()}
+        return self.files
+
+    def render_file(self, path: str) -> bytes:
+        """Render a single project file without rendering the others; KeyError if the project has no such file"""
+        return self.plan_files()[path]()
+
+    def plan_files(self) -> Dict[str, Callable[[], bytes]]:
+        """Map every project file to a callable that renders it, without rendering anything"""
+        self._plan = {}
+        self._rendered = {}
+        project_dir = PurePosixPath(self.ctx.project_dir)
+
+        # Generate files
+        self._generate_root_files(project_dir)
+        self._generate_app_files(project_dir)
+        self._generate_test_files(project_dir)
+        if self.ctx.benchmark_module:
+            self._generate_benchmark_files(project_dir)
+        if self.ctx.has_modules:
+            self._generate_module_files(project_dir)
+
+        self._copy_font_files(project_dir)
+        if self.launcher_icons:
+            self._generate_launcher_icons(project_dir)
+
+        return self._plan
+
+    def _add_template(self, file_path: PurePosixPath, template_name: str, **context):
         """
-        Actually copies font .ttf files from selected font family directory 
-        to app/src/main/res/font.
+        Add a file rendered from a template, deferring the render until its content is needed.
+        Files with the same template and context (e.g. untranslated locales) are rendered once.
         """
-        font_source_path = f"fontfamilies/{self.config.configuration.fontName}"
-        font_dest_path = f"{project_dir}/app/src/main/res/font"
-
+        key = (template_name, tuple(sorted(context.items())))
         try:
-            # Check if source directory exists
-            if not os.path.exists(font_source_path):
-                return
+            hash(key)
+        except TypeError:  # Unhashable context values, e.g. lists; render every time
+            key = None
+
+        def render() -> bytes:
+            if key is None:
+                return self.jinja_env.get_template(template_name).render(**context).encode('utf-8')
+            if key not in self._rendered:
+                self._rendered[key] = self.jinja_env.get_template(template_name).render(**context).encode('utf-8')
+            return self._rendered[key]
 
-            # Create destination directory
-            os.makedirs(font_dest_path, exist_ok=True)
+        self._plan[str(file_path)] = render
 
-            # Find and copy all .ttf files
-            ttf_files = glob.glob(os.path.join(font_source_path, "*.ttf"))
+    def _add_generated(self, file_path: PurePosixPath, generate: Callable[[], str]):
+        """Add a text file produced by a function, deferring the call until its content is needed"""
+        self._plan[str(file_path)] = lambda: generate().encode('utf-8')
 
-            if not ttf_files:
-                return
+    def _write_file(self, file_path: PurePosixPath, content: str):
+        """Add a text file whose content is already known"""
+        self._add_bytes(file_path, content.encode('utf-8'))
 
-            for ttf_file in ttf_files:
-                filename = os.path.basename(ttf_file)
-                dest_file = os.path.join(font_dest_path, filename)
-                shutil.copy2(ttf_file, dest_file)
+    def _add_bytes(self, file_path: PurePosixPath, data: bytes):
+        """Add a binary file whose content is already known; views of shared assets are copied only when rendered"""
+        self._plan[str(file_path)] = lambda: bytes(data)
 
+    def _copy_font_files(self, project_dir: PurePosixPath):
+        """
+        Adds the selected weights of the font family to app/src/main/res/font,
+        subset to the requested character sets (which needs fontTools).
+        """
+        font_dest_path = project_dir / 'app/src/main/res/font'
+
+        try:
+            for file_name, data in font_files(self.config.configuration.fontName, self.ctx.font_weights,
+                                              self.ctx.font_subsets):
+                self._add_bytes(font_dest_path / file_name, data)
 
+        except ValueError:
+            raise  # Subsets requested without fontTools: the config cannot be served, not a missing file
         except Exception as e:
             print(f"Error copying fonts: {str(e)}")
 
-    def _generate_root_files(self, project_dir: Path):
+    def _generate_launcher_icons(self, project_dir: PurePosixPath):
+        """Adds the adaptive launcher icon and its legacy PNGs for every mipmap density"""
+        res_dir = project_dir / 'app/src/main/res'
+        for path, data in launcher_icon_files(self.ctx.name, self.ctx.primary_color).items():
+            self._add_bytes(res_dir / path, data)
+
+    def _generate_root_files(self, project_dir: PurePosixPath):
         """Generate root-level project files"""
-        build_format = self.config.configuration.buildFormat
-        
         # Generate build.gradle or build.gradle.kts
-        if build_format == 'kts':
-            template = self.jinja_env.get_template('build_gradle_kts.j2')
-            self.utils.write_file(project_dir / 'build.gradle.kts', template.render(config=self.config))
+        if self.ctx.is_kts:
+            self._add_template(project_dir / 'build.gradle.kts', 'build_gradle_kts.j2', ctx=self.ctx)
             
-            template = self.jinja_env.get_template('settings_gradle_kts.j2')
-            self.utils.write_file(project_dir / 'settings.gradle.kts', template.render(config=self.config))
+            self._add_template(project_dir / 'settings.gradle.kts', 'settings_gradle_kts.j2', ctx=self.ctx)
         else:
-            template = self.jinja_env.get_template('build_gradle.j2')
-            self.utils.write_file(project_dir / 'build.gradle', template.render(config=self.config))
+            self._add_template(project_dir / 'build.gradle', 'build_gradle.j2', ctx=self.ctx)
             
-            template = self.jinja_env.get_template('settings_gradle.j2')
-            self.utils.write_file(project_dir / 'settings.gradle', template.render(config=self.config))
+            self._add_template(project_dir / 'settings.gradle', 'settings_gradle.j2', ctx=self.ctx)
         
         # Generate libs.versions.toml if enabled
-        if self.config.configuration.useLibsVersionsToml:
-            template = self.jinja_env.get_template('libs_versions_toml.j2')
-            self.utils.write_file(project_dir / 'gradle/libs.versions.toml', template.render(config=self.config))
+        if self.ctx.use_version_catalog:
+            self._add_template(project_dir / 'gradle/libs.versions.toml', 'libs_versions_toml.j2', ctx=self.ctx)
         
         # Generate gradle.properties
-        template = self.jinja_env.get_template('gradle_properties.j2')
-        self.utils.write_file(project_dir / 'gradle.properties', template.render(config=self.config))
+        self._add_template(project_dir / 'gradle.properties', 'gradle_properties.j2', ctx=self.ctx)
     
-    def _generate_app_files(self, project_dir: Path):
+    def _generate_app_files(self, project_dir: PurePosixPath):
         """Generate app-level files"""
         app_dir = project_dir / 'app'
-        build_format = self.config.configuration.buildFormat
         
         # Generate app build.gradle
-        if build_format == 'kts':
-            template = self.jinja_env.get_template('app_build_gradle_kts.j2')
-            self.utils.write_file(app_dir / 'build.gradle.kts', template.render(config=self.config))
+        if self.ctx.is_kts:
+            self._add_template(app_dir / 'build.gradle.kts', 'app_build_gradle_kts.j2', ctx=self.ctx)
         else:
-            template = self.jinja_env.get_template('app_build_gradle.j2')
-            self.utils.write_file(app_dir / 'build.gradle', template.render(config=self.config))
+            self._add_template(app_dir / 'build.gradle', 'app_build_gradle.j2', ctx=self.ctx)
+        
+        # Generate proguard-rules.pro referenced by the release build type
+        self._write_file(app_dir / 'proguard-rules.pro', self.proguard_templates.get_rules())
         
         # Generate AndroidManifest.xml
-        permissions = self.utils.get_permission_manifest_entries(self.config.configuration.permissions)
-        template = self.jinja_env.get_template('android_manifest.j2')
+        # Canonical (enum) order so that configs with the same ConfigKey render identically
+        permissions = self.utils.get_permission_manifest_entries([p.value for p in Permission if p.value in self.ctx.permissions])
         manifest_context = {
-            'config': self.config,
+            'ctx': self.ctx,
             'permissions': permissions,
-            'use_network_config': self.config.configuration.httpNetworking
+            'use_network_config': self.ctx.http_networking
         }
-        self.utils.write_file(app_dir / 'src/main/AndroidManifest.xml', template.render(**manifest_context))
+        self._add_template(app_dir / 'src/main/AndroidManifest.xml', 'android_manifest.j2', **manifest_context)
         
         # Generate MainActivity
-        package_path = self.utils.package_to_path(self.config.project.package)
-        language_dir = self.config.configuration.language.value
+        package_path = self.ctx.package_path
+        language_dir = self.ctx.language_dir
         
-        if self.config.configuration.language == Language.kotlin:
-            template = self.jinja_env.get_template('main_activity_kotlin.j2')
-            self.utils.write_file(
+        if self.ctx.is_kotlin:
+            self._add_template(
                 app_dir / f'src/main/{language_dir}/{package_path}/MainActivity.kt',
-                template.render(config=self.config)
+                'main_activity_kotlin.j2', ctx=self.ctx
             )
         else:
-            template = self.jinja_env.get_template('main_activity_java.j2')
-            self.utils.write_file(
+            self._add_template(
                 app_dir / f'src/main/{language_dir}/{package_path}/MainActivity.java',
-                template.render(config=self.config)
+                'main_activity_java.j2', ctx=self.ctx
             )
         
+        # Generate the Application class and its startup scaffolding
+        self._generate_startup_files(app_dir)
+
+        # Generate the Room database from the configured schema
+        if self.ctx.room_database:
+            self._generate_room_files(app_dir)
+
         # Generate resources
         self._generate_resources(app_dir)
         
         # Generate Compose theme if using Jetpack Compose
-        if self.config.configuration.uiToolkit == UIToolkit.compose:
+        if self.ctx.is_compose:
             self._generate_compose_theme(app_dir, package_path, language_dir)
     
-    def _generate_test_files(self, project_dir: Path):
+    def _generate_test_files(self, project_dir: PurePosixPath):
         """Generate test files"""
         test_dir = project_dir / 'app'
 
         # Generate MainActivityTest
-        package_path = self.utils.package_to_path(self.config.project.package)
-        language_dir = self.config.configuration.language.value
+        package_path = self.ctx.package_path
+        language_dir = self.ctx.language_dir
         
-        if self.config.configuration.language == Language.kotlin:
-            template = self.jinja_env.get_template('unit_test_kt.j2')
-            self.utils.write_file(
+        if self.ctx.is_kotlin:
+            self._add_template(
                 test_dir / f'src/test/{language_dir}/{package_path}/ExampleUnitTest.kt',
-                template.render(config=self.config)
+                'unit_test_kt.j2', ctx=self.ctx
             )
         else:
-            template = self.jinja_env.get_template('unit_test_java.j2')
-            self.utils.write_file(
+            self._add_template(
                 test_dir / f'src/test/{language_dir}/{package_path}/ExampleUnitTest.java',
-                template.render(config=self.config)
+                'unit_test_java.j2', ctx=self.ctx
             )
         
-        if self.config.configuration.language == Language.kotlin:
-            template = self.jinja_env.get_template('example_instrumented_test_kt.j2')
-            self.utils.write_file(
+        if self.ctx.is_kotlin:
+            self._add_template(
                 test_dir / f'src/androidTest/{language_dir}/{package_path}/ExampleInstrumentedTest.kt',
-                template.render(config=self.config)
+                'example_instrumented_test_kt.j2', ctx=self.ctx
             )
         else:
-            template = self.jinja_env.get_template('example_instrumented_test_java.j2')
-            self.utils.write_file(
+            self._add_template(
                 test_dir / f'src/androidTest/{language_dir}/{package_path}/ExampleInstrumentedTest.java',
-                template.render(config=self.config)
+                'example_instrumented_test_java.j2', ctx=self.ctx
+            )
+
+
+    def _generate_benchmark_files(self, project_dir: PurePosixPath):
+        """Generate the baseline profile / macrobenchmark test module"""
+        module_dir = project_dir / self.ctx.benchmark_module
+
+        if self.ctx.is_kts:
+            self._add_template(module_dir / 'build.gradle.kts', 'benchmark_build_gradle_kts.j2', ctx=self.ctx)
+        else:
+            self._add_template(module_dir / 'build.gradle', 'benchmark_build_gradle.j2', ctx=self.ctx)
+
+        self._add_template(module_dir / 'src/main/AndroidManifest.xml', 'benchmark_manifest.j2', ctx=self.ctx)
+
+        # The test module is always Kotlin; the Kotlin plugin is declared at the root for every project
+        source_dir = module_dir / f'src/main/kotlin/{self.ctx.benchmark_package_path}'
+        self._add_template(source_dir / 'StartupBenchmark.kt', 'startup_benchmark_kt.j2', ctx=self.ctx)
+
+        self._add_template(source_dir / 'BaselineProfileGenerator.kt', 'baseline_profile_generator_kt.j2', ctx=self.ctx)
+
+    def _generate_startup_files(self, app_dir: PurePosixPath):
+        """
+        Generate the Application class and, with Hilt or Koin, the DI module and the androidx.startup
+        initializers that start Koin and warm up heavy singletons off the main thread
+        """
+        extension = 'kt' if self.ctx.is_kotlin else 'java'
+        source_dir = app_dir / f'src/main/{self.ctx.language_dir}/{self.ctx.package_path}'
+
+        self._add_template(
+            source_dir / f'{self.ctx.application_class}.{extension}', f'application_{extension}.j2', ctx=self.ctx
+        )
+        if self.ctx.use_hilt:
+            self._add_template(source_dir / f'di/AppModule.{extension}', f'hilt_module_{extension}.j2', ctx=self.ctx)
+        elif self.ctx.use_koin and self.ctx.is_kotlin:
+            self._add_template(source_dir / 'di/AppModule.kt', 'koin_module_kt.j2', ctx=self.ctx)
+            self._add_template(source_dir / 'startup/KoinInitializer.kt', 'koin_initializer_kt.j2', ctx=self.ctx)
+        if self.ctx.warm_up:
+            self._add_template(
+                source_dir / f'startup/WarmUpInitializer.{extension}', f'warm_up_initializer_{extension}.j2',
+                ctx=self.ctx,
             )
-           
-    def _generate_resources(self, app_dir: Path):
+
+    def _generate_room_files(self, app_dir: PurePosixPath):
+        """
+        Generate an entity and a DAO per table of the Room schema, the database class and its exported
+        schema. Each entity is a separate lazy render of the same compiled template.
+        """
+        database = self.ctx.room_database
+        extension = 'kt' if self.ctx.is_kotlin else 'java'
+        source_dir = app_dir / f'src/main/{self.ctx.language_dir}/{database.package_path}'
+
+        self._add_template(
+            source_dir / f'{database.class_name}.{extension}', f'room_database_{extension}.j2', database=database
+        )
+        for entity in database.entities:
+            self._add_template(
+                source_dir / f'entity/{entity.class_name}.{extension}', f'room_entity_{extension}.j2',
+                package=database.package, entity=entity,
+            )
+            self._add_template(
+                source_dir / f'dao/{entity.dao_name}.{extension}', f'room_dao_{extension}.j2',
+                package=database.package, entity=entity,
+            )
+
+        # Where room.schemaLocation (set in the app build script) points
+        self._add_generated(
+            app_dir / f'schemas/{database.package}.{database.class_name}/{database.version}.json',
+            lambda: schema_json(database),
+        )
+
+    def _generate_module_files(self, project_dir: PurePosixPath):
+        """
+        Generate the library modules of the module graph and the build-logic included build whose
+        convention plugins hold their shared configuration, so each module script stays a few lines
+        """
+        build_logic_dir = project_dir / 'build-logic'
+        self._add_template(build_logic_dir / 'settings.gradle.kts', 'build_logic_settings_gradle_kts.j2', ctx=self.ctx)
+        self._add_template(
+            build_logic_dir / 'convention/build.gradle.kts', 'build_logic_build_gradle_kts.j2', ctx=self.ctx,
+            android_convention=ANDROID_LIBRARY_CONVENTION, jvm_convention=JVM_LIBRARY_CONVENTION,
+        )
+        convention_dir = build_logic_dir / 'convention/src/main/kotlin'
+        if self.ctx.has_android_modules:
+            self._add_template(
+                convention_dir / 'AndroidLibraryConventionPlugin.kt', 'android_library_convention_kt.j2', ctx=self.ctx
+            )
+        if self.ctx.has_jvm_modules:
+            self._add_template(
+                convention_dir / 'JvmLibraryConventionPlugin.kt', 'jvm_library_convention_kt.j2', ctx=self.ctx
+            )
+
+        build_script = ('build.gradle.kts', 'module_build_gradle_kts.j2') if self.ctx.is_kts \
+            else ('build.gradle', 'module_build_gradle.j2')
+        source = ('kt', 'module_source_kt.j2') if self.ctx.is_kotlin else ('java', 'module_source_java.j2')
+        for module in self.ctx.modules:
+            module_dir = project_dir / module.dir
+            self._add_template(module_dir / build_script[0], build_script[1], module=module)
+            if module.is_android:
+                # Identical for every module, so it is rendered once
+                self._add_template(module_dir / 'src/main/AndroidManifest.xml', 'module_manifest.j2')
+            self._add_template(
+                module_dir / f'src/main/{self.ctx.language_dir}/{module.package_path}/{module.class_name}.{source[0]}',
+                source[1], module=module,
+            )
+
+    def _generate_resources(self, app_dir: PurePosixPath):
         """Generate resource files"""
         res_dir = app_dir / 'src/main/res'
         
         # Generate strings.xml
-        template = self.jinja_env.get_template('strings_xml.j2')
-        self.utils.write_file(res_dir / 'values/strings.xml', template.render(config=self.config))
+        self._add_template(res_dir / 'values/strings.xml', 'strings_xml.j2', ctx=self.ctx)
         
         # Generate internationalization strings
-        if self.config.configuration.internationalization.enabled:
-            for lang in self.config.configuration.internationalization.languages, []:
+        if self.ctx.i18n_enabled:
+            for lang in self.ctx.languages:
                 if lang != 'en':
-                    self.utils.write_file(
-                        res_dir / f'values-{lang}/strings.xml',
-                        template.render(config=self.config, language=lang)
-                    )
+                    self._add_template(res_dir / f'values-{lang}/strings.xml', 'strings_xml.j2', ctx=self.ctx)
         
-        # Generate colors.xml
-        template = self.jinja_env.get_template('colors_xml.j2')
-        self.utils.write_file(res_dir / 'values/colors.xml', template.render(config=self.config))
+        # Generate colors.xml, with the dark scheme overriding it in values-night
+        self._add_template(res_dir / 'values/colors.xml', 'colors_xml.j2', ctx=self.ctx)
         
-        # Generate themes.xml
-        template = self.jinja_env.get_template('themes_xml.j2')
-        self.utils.write_file(res_dir / 'values/themes.xml', template.render(config=self.config))
+        if self.ctx.light_dark:
+            self._add_template(res_dir / 'values-night/colors.xml', 'colors_xml.j2', ctx=self.ctx, is_dark=True)
         
-        if self.config.configuration.lightDark:
-            self.utils.write_file(res_dir / 'values-night/themes.xml', template.render(config=self.config, is_dark=True))
+        # Generate themes.xml
+        self._add_template(res_dir / 'values/themes.xml', 'themes_xml.j2', ctx=self.ctx)
         
         # Generate network_security_config.xml if HTTP networking is enabled
-        if self.config.configuration.httpNetworking:
-            template = self.jinja_env.get_template('network_config_xml.j2')
-            self.utils.write_file(res_dir / 'xml/network_security_config.xml', template.render(config=self.config))
+        if self.ctx.http_networking:
+            self._add_template(res_dir / 'xml/network_security_config.xml', 'network_config_xml.j2', ctx=self.ctx)
         
         # Generate activity_main.xml if using XML views
-        if self.config.configuration.uiToolkit != UIToolkit.compose:
-            template = self.jinja_env.get_template('activity_main_xml.j2')
-            self.utils.write_file(res_dir / 'layout/activity_main.xml', template.render(config=self.config))
+        if not self.ctx.is_compose:
+            self._add_template(res_dir / 'layout/activity_main.xml', 'activity_main_xml.j2', ctx=self.ctx)
 
-        template = self.jinja_env.get_template('data_extraction_rules_xml.j2')
-        self.utils.write_file(res_dir / 'xml/data_extraction_rules.xml', template.render(config=self.config))        
+        self._add_template(res_dir / 'xml/data_extraction_rules.xml', 'data_extraction_rules_xml.j2', ctx=self.ctx)        
 
-        template = self.jinja_env.get_template('backup_rules_xml.j2')
-        self.utils.write_file(res_dir / 'xml/backup_rules.xml', template.render(config=self.config)) 
+        self._add_template(res_dir / 'xml/backup_rules.xml', 'backup_rules_xml.j2', ctx=self.ctx) 
 
-    def _generate_compose_theme(self, app_dir: Path, package_path: str, language_dir: str):
+    def _generate_compose_theme(self, app_dir: PurePosixPath, package_path: str, language_dir: str):
         """Generate Jetpack Compose theme files"""
         theme_dir = app_dir / f'src/main/{language_dir}/{package_path}/ui/theme'
         
         # Generate Theme.kt
-        if self.config.configuration.language == Language.kotlin:
+        if self.ctx.is_kotlin:
             # Load and render Theme.kt
-            theme_template = self.jinja_env.get_template('compose_theme.j2')
-            self.utils.write_file(theme_dir / 'Theme.kt', theme_template.render(config=self.config))
+            self._add_template(theme_dir / 'Theme.kt', 'compose_theme.j2', ctx=self.ctx)
             
             # Load and render Color.kt
-            color_template = self.jinja_env.get_template('compose_color.j2')
-            self.utils.write_file(theme_dir / 'Color.kt', color_template.render(config=self.config))
+            self._add_template(theme_dir / 'Color.kt', 'compose_color.j2', ctx=self.ctx)
             
             # Load and render Type.kt
-            type_template = self.jinja_env.get_template('compose_typography.j2')
-            self.utils.write_file(theme_dir / 'Type.kt', type_template.render(config=self.config))
\ No newline at end of file
+            self._add_template(theme_dir / 'Type.kt', 'compose_typography.j2', ctx=self.ctx)
\ No newline at end of file
@@ -0,0 +1,138 @@
+import base64
+import hashlib
+import json
+from enum import Enum
+from typing import List, Tuple, Type
+
+from models.config_model import Configuration, ProjectConfig, ProjectInfo
+from models.enums import (
+    BuildFormat, DILib, FontName, JavaVersion, Language, LocalStorage, Navigation, NetworkingLib, Permission,
+    SerializationLib, UITheme, UIToolkit,
+)
+
+KEY_VERSION = 1
+
+
+class _BitLayout:
+    """Fixed bit positions for the enum, flag and SDK fields of a Configuration"""
+
+    def __init__(self):
+        self.fields: List[Tuple[str, str, int, int, object]] = []  # (section, attr, shift, bits, codec)
+        self.width = 0
+
+    def add(self, section: str, attr: str, bits: int, codec=None):
+        self.fields.append((section, attr, self.width, bits, codec))
+        self.width += bits
+
+    def add_enum(self, attr: str, enum: Type[Enum]):
+        codes = {member: index for index, member in enumerate(enum)}
+        self.add('configuration', attr, max(1, (len(codes) - 1).bit_length()), codes)
+
+
+_LAYOUT = _BitLayout()
+_LAYOUT.add_enum('uiToolkit', UIToolkit)
+_LAYOUT.add_enum('networking', NetworkingLib)
+_LAYOUT.add_enum('serialization', SerializationLib)
+_LAYOUT.add_enum('dependencyInjection', DILib)
+_LAYOUT.add_enum('localStorage', LocalStorage)
+_LAYOUT.add_enum('uiTheme', UITheme)
+_LAYOUT.add_enum('language', Language)
+_LAYOUT.add_enum('javaVersion', JavaVersion)
+_LAYOUT.add_enum('buildFormat', BuildFormat)
+_LAYOUT.add_enum('fontName', FontName)
+_LAYOUT.add_enum('navigation', Navigation)
+for _flag in ('enableRoom', 'lightDark', 'httpNetworking', 'viewBinding', 'useLibsVersionsToml'):
+    _LAYOUT.add('configuration', _flag, 1)
+_LAYOUT.add('configuration', 'permissions', len(Permission), {member: 1 << i for i, member in enumerate(Permission)})
+for _sdk in ('minSdk', 'targetSdk', 'compileSdk'):
+    _LAYOUT.add('project', _sdk, 16)
+
+PACKED_BYTES = (_LAYOUT.width + 7) // 8
+
+# Free-text fields carried verbatim after the packed integer (they appear as-is in the output)
+_TEXT_FIELDS = {'project': ('name', 'package'), 'configuration': ('projectName', 'projectId')}
+
+# Anything not covered above is appended as canonical JSON so that new config sections
+# always take part in the key
+_COVERED = {
+    'project': {attr for section, attr, *_ in _LAYOUT.fields if section == 'project'} | set(_TEXT_FIELDS['project']),
+    'configuration': (
+        {attr for section, attr, *_ in _LAYOUT.fields if section == 'configuration'}
+        | set(_TEXT_FIELDS['configuration'])
+        | {'themeColors', 'internationalization'}
+    ),
+}
+_EXTRA_FIELDS = {
+    'project': tuple(sorted(set(ProjectInfo.model_fields) - _COVERED['project'])),
+    'configuration': tuple(sorted(set(Configuration.model_fields) - _COVERED['configuration'])),
+}
+
+
+class ConfigKey:
+    """Compact canonical identity of a ProjectConfig: bit-packed enums plus normalized free text"""
+
+    __slots__ = ('packed', 'text', '_digest')
+
+    def __init__(self, config: ProjectConfig):
+        sections = {'project': config.project, 'configuration': config.configuration}
+
+        packed = 0
+        for section, attr, shift, bits, codec in _LAYOUT.fields:
+            value = getattr(sections[section], attr)
+            if isinstance(value, list):
+                code = 0
+                for member in value:
+                    code |= codec[member]
+            elif codec is not None:
+                code = codec[value]
+            else:
+                code = int(value)
+            if code >> bits:
+                raise ValueError(f"{attr}={value!r} does not fit in {bits} bits")
+            packed |= code << shift
+
+        configuration = config.configuration
+        colors = configuration.themeColors
+        i18n = configuration.internationalization
+        text = [getattr(sections[section], attr) for section, attrs in _TEXT_FIELDS.items() for attr in attrs]
+        text += [colors.primary, colors.secondary, colors.tertiary]
+        text.append('1' if i18n.enabled else '0')
+        text.append(','.join(sorted(set(i18n.languages))))
+        for section, attrs in _EXTRA_FIELDS.items():
+            if attrs:
+                extra = sections[section].model_dump(mode='json', include=set(attrs))
+                text.append(json.dumps(extra, sort_keys=True, separators=(',', ':')))
+
+        self.packed = packed
+        self.text = tuple(text)
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """Short, URL-safe, versioned digest of the key"""
+        if self._digest is None:
+            # Length-prefixed so that no choice of free text can collide with another
+            text = ''.join(f'{len(value)}:{value}' for value in self.text)
+            payload = self.packed.to_bytes(PACKED_BYTES, 'big') + text.encode('utf-8')
+            raw = hashlib.blake2b(payload, digest_size=16).digest()
+            self._digest = f'v{KEY_VERSION}.' + base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+        return self._digest
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConfigKey):
+            return NotImplemented
+        return self.packed == other.packed and self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash((self.packed, self.text))
+
+    def __str__(self) -> str:
+        return self.digest
+
+    def __repr__(self) -> str:
+        return f'ConfigKey({self.digest})'
+
+
+def config_key(config: ProjectConfig) -> str:
+    """Return the versioned digest identifying config"""
+    return ConfigKey(config).digest
@@ -0,0 +1,184 @@
+from typing import Optional
+
+from models.config_model import ProjectConfig
+from models.enums import (
+    BuildFormat, DILib, FontSubset, Language, LocalStorage, Navigation, NetworkingLib, SerializationLib, UIToolkit,
+    UITheme,
+)
+from models.naming import class_name
+from .dependencies import resolve_dependencies
+from .fonts import COMPOSE_WEIGHTS, resource_prefix, selected_weights
+from .modules import app_module_dependencies, module_contexts
+from .palette import ColorScheme, argb_literal, color_scheme
+from .room import database_context
+from .utils import ProjectUtils
+
+
+class RenderContext:
+    """Immutable, flattened view of a ProjectConfig computed once per build and shared by every template"""
+
+    __slots__ = (
+        'config',
+        # Project identity
+        'name', 'pascal_name', 'theme_name', 'project_dir', 'project_name', 'project_id',
+        'package', 'package_path', 'min_sdk', 'target_sdk', 'compile_sdk',
+        # Language and build
+        'language', 'language_dir', 'is_kotlin', 'is_java', 'java_version',
+        'build_format', 'is_kts', 'use_version_catalog',
+        'build_performance', 'annotation_processor', 'use_ksp_plugin', 'use_kapt',
+        'minify_enabled', 'shrink_resources', 'r8_full_mode',
+        'benchmark_module', 'benchmark_package', 'benchmark_package_path', 'dependencies',
+        # Module graph
+        'modules', 'app_modules', 'has_modules', 'has_android_modules', 'has_jvm_modules',
+        # UI
+        'ui_toolkit', 'is_compose', 'is_xml', 'ui_theme', 'is_material3', 'is_material3_expressive',
+        'light_dark', 'view_binding', 'font_name', 'font_title', 'font_file_prefix',
+        'font_weights', 'font_subsets', 'font_faces',
+        'primary_color', 'secondary_color', 'tertiary_color', 'primary_argb', 'secondary_argb', 'tertiary_argb',
+        'color_scheme',
+        'navigation', 'use_compose_navigation', 'use_fragment_navigation',
+        # Libraries
+        'networking', 'use_retrofit', 'use_ktor', 'use_networking', 'http_networking',
+        'serialization', 'use_gson', 'use_moshi', 'use_kotlinx_serialization',
+        'dependency_injection', 'use_hilt', 'use_koin',
+        'local_storage', 'use_datastore', 'use_shared_preferences', 'enable_room', 'room_database',
+        # Application startup
+        'application_class', 'use_startup', 'warm_up',
+        # Permissions and i18n
+        'permissions', 'i18n_enabled', 'languages',
+    )
+
+    def __init__(self, config: ProjectConfig, scheme: Optional[ColorScheme] = None):
+        project = config.project
+        configuration = config.configuration
+        font_name = configuration.fontName.value
+        fonts = configuration.fonts
+        font_weights = selected_weights(fonts.weights if fonts else None)
+        font_prefix = resource_prefix(configuration.fontName)
+        performance = configuration.buildPerformance
+        benchmark_module = configuration.benchmarkModule.value if configuration.benchmarkModule else None
+        benchmark_package = f'{project.package}.{benchmark_module}' if benchmark_module else None
+        package_path = ProjectUtils.package_to_path(project.package)
+        modules = module_contexts(configuration.modules, project.package, package_path)
+        minify_enabled = configuration.minify is not None and configuration.minify.enabled
+        needs_processor = configuration.dependencyInjection == DILib.hilt or configuration.enableRoom
+        if configuration.language == Language.java:
+            # KSP needs the Kotlin plugin and only processes Kotlin sources
+            annotation_processor = 'annotationProcessor'
+        elif performance is None:
+            annotation_processor = 'ksp'
+        else:
+            annotation_processor = 'ksp' if performance.useKsp else 'kapt'
+        values = {
+            'config': config,
+
+            'name': project.name,
+            'pascal_name': project.name.replace(' ', ''),
+            'theme_name': project.name.replace(' ', '').replace('-', '').replace('_', ''),
+            'project_dir': ProjectUtils.sanitize_project_name(project.name),
+            'project_name': configuration.projectName,
+            'project_id': configuration.projectId,
+            'package': project.package,
+            'package_path': package_path,
+            'min_sdk': project.minSdk,
+            'target_sdk': project.targetSdk,
+            'compile_sdk': project.compileSdk,
+
+            'language': configuration.language.value,
+            'language_dir': configuration.language.value,
+            'is_kotlin': configuration.language == Language.kotlin,
+            'is_java': configuration.language == Language.java,
+            'java_version': configuration.javaVersion.value,
+            'build_format': configuration.buildFormat.value,
+            'is_kts': configuration.buildFormat == BuildFormat.kts,
+            'use_version_catalog': configuration.useLibsVersionsToml,
+            'build_performance': performance,
+            'annotation_processor': annotation_processor,
+            'use_ksp_plugin': annotation_processor == 'ksp' and (
+                configuration.enableRoom if performance is None else needs_processor
+            ),
+            'use_kapt': needs_processor and annotation_processor == 'kapt',
+            'minify_enabled': minify_enabled,
+            'shrink_resources': minify_enabled and configuration.minify.shrinkResources,
+            'r8_full_mode': minify_enabled and configuration.minify.fullMode,
+            'benchmark_module': benchmark_module,
+            'benchmark_package': benchmark_package,
+            'benchmark_package_path': ProjectUtils.package_to_path(benchmark_package) if benchmark_module else None,
+
+            'modules': modules,
+            'app_modules': app_module_dependencies(modules),
+            'has_modules': bool(modules),
+            'has_android_modules': any(module.is_android for module in modules),
+            'has_jvm_modules': any(not module.is_android for module in modules),
+
+            'ui_toolkit': configuration.uiToolkit.value,
+            'is_compose': configuration.uiToolkit == UIToolkit.compose,
+            'is_xml': configuration.uiToolkit == UIToolkit.xml,
+            'ui_theme': configuration.uiTheme.value,
+            'is_material3': configuration.uiTheme == UITheme.material3,
+            'is_material3_expressive': configuration.uiTheme == UITheme.material3_expressive,
+            'light_dark': configuration.lightDark,
+            'view_binding': configuration.viewBinding,
+            'font_name': font_name,
+            'font_title': font_name.title().replace(' ', ''),
+            'font_file_prefix': font_prefix,
+            'font_weights': font_weights,
+            'font_subsets': tuple(subset for subset in FontSubset if fonts and subset in fonts.subsets),
+            'font_faces': tuple((f'{font_prefix}_{weight.value}', COMPOSE_WEIGHTS[weight]) for weight in font_weights),
+            'primary_color': configuration.themeColors.primary,
+            'secondary_color': configuration.themeColors.secondary,
+            'tertiary_color': configuration.themeColors.tertiary,
+            'primary_argb': argb_literal(configuration.themeColors.primary),
+            'secondary_argb': argb_literal(configuration.themeColors.secondary),
+            'tertiary_argb': argb_literal(configuration.themeColors.tertiary),
+            'color_scheme': scheme or color_scheme(
+                configuration.themeColors.primary, configuration.themeColors.secondary,
+                configuration.themeColors.tertiary,
+            ),
+            'navigation': configuration.navigation.value,
+            'use_compose_navigation': configuration.navigation == Navigation.compose,
+            'use_fragment_navigation': configuration.navigation == Navigation.fragment,
+
+            'networking': configuration.networking.value,
+            'use_retrofit': configuration.networking == NetworkingLib.retrofit,
+            'use_ktor': configuration.networking == NetworkingLib.ktor,
+            'use_networking': configuration.networking != NetworkingLib.none,
+            'http_networking': configuration.httpNetworking,
+            'serialization': configuration.serialization.value,
+            'use_gson': configuration.serialization == SerializationLib.gson,
+            'use_moshi': configuration.serialization == SerializationLib.moshi,
+            'use_kotlinx_serialization': configuration.serialization == SerializationLib.kotlinx,
+            'dependency_injection': configuration.dependencyInjection.value,
+            'use_hilt': configuration.dependencyInjection == DILib.hilt,
+            'use_koin': configuration.dependencyInjection == DILib.koin,
+            'local_storage': configuration.localStorage.value,
+            'use_datastore': configuration.localStorage == LocalStorage.datastore,
+            'use_shared_preferences': configuration.localStorage == LocalStorage.shared_pref,
+            'enable_room': configuration.enableRoom,
+            'room_database': (
+                database_context(configuration.roomSchema, project.package) if configuration.roomSchema else None
+            ),
+
+            'permissions': frozenset(permission.value for permission in configuration.permissions),
+            'i18n_enabled': configuration.internationalization.enabled,
+            'languages': tuple(sorted(set(configuration.internationalization.languages))),
+        }
+        values['application_class'] = class_name(project.name) + 'Application'
+        # Koin's DSL is Kotlin-only, so Java projects get the Application class without Koin scaffolding
+        use_koin_module = values['use_koin'] and values['is_kotlin']
+        # Singletons worth creating off the main thread before first use
+        values['warm_up'] = (values['use_hilt'] or use_koin_module) and (
+            values['use_networking'] or values['room_database'] is not None
+            or (values['use_datastore'] and values['is_kotlin'])
+        )
+        # androidx.startup runs Koin's start and the warm-up before Application.onCreate
+        values['use_startup'] = use_koin_module or values['warm_up']
+        values['dependencies'] = resolve_dependencies(values)
+        for attr, value in values.items():
+            object.__setattr__(self, attr, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
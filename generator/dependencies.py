@@ -0,0 +1,427 @@
+from functools import lru_cache
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+# Single source of truth for every library, plugin and version the generated build scripts use.
+# Updating a version or adding a library is a data edit here; the Groovy, KTS and version catalog
+# output is emitted from the resolved set by the filters at the bottom of this module.
+
+VERSIONS: Dict[str, str] = {
+    'agp': '8.2.0',
+    'kotlin': '1.9.0',
+    'coreKtx': '1.12.0',
+    'lifecycleRuntimeKtx': '2.7.0',
+    'activityCompose': '1.8.2',
+    'composeBom': '2023.10.01',
+    'appcompat': '1.6.1',
+    'material': '1.11.0',
+    'constraintlayout': '2.1.4',
+    'hilt': '2.48',
+    'koin': '3.5.0',
+    'retrofit': '2.9.0',
+    'retrofitKotlinxConverter': '1.0.0',
+    'okhttp': '4.12.0',
+    'gson': '2.10.1',
+    'moshi': '1.14.0',
+    'ktor': '2.3.7',
+    'kotlinxSerialization': '1.6.0',
+    'datastore': '1.0.0',
+    'room': '2.6.1',
+    'ksp': '1.9.0-1.0.13',
+    'navigation': '2.7.6',
+    'startup': '1.1.1',
+    'profileinstaller': '1.3.1',
+    'benchmarkMacro': '1.2.3',
+    'uiautomator': '2.2.0',
+    'junit': '4.13.2',
+    'junitVersion': '1.1.5',
+    'espressoCore': '3.5.1',
+}
+
+
+class Library(NamedTuple):
+    """A Maven artifact; version_ref is None for artifacts whose version comes from a BOM"""
+    alias: str  # version catalog alias, e.g. androidx-core-ktx
+    group: str
+    name: str
+    version_ref: Optional[str] = None
+
+    @property
+    def accessor(self) -> str:
+        return 'libs.' + self.alias.replace('-', '.')
+
+    @property
+    def coordinate(self) -> str:
+        if self.version_ref is None:
+            return f'{self.group}:{self.name}'
+        return f'{self.group}:{self.name}:{VERSIONS[self.version_ref]}'
+
+
+class Plugin(NamedTuple):
+    """A Gradle plugin"""
+    alias: str  # version catalog alias, e.g. androidApplication
+    id: str
+    version_ref: str
+
+
+class Dependency(NamedTuple):
+    """A library added to a Gradle configuration"""
+    configuration: str
+    library: Library
+    platform: bool = False
+
+
+class Rule(NamedTuple):
+    """
+    Adds a library or plugin when every flag in `when` is truthy on the render context
+    ("!flag" when it is falsy). PROCESSOR as configuration means the project's annotation processor.
+    """
+    alias: str
+    configuration: Optional[str] = None
+    when: Tuple[str, ...] = ()
+    platform: bool = False
+
+
+PROCESSOR = 'processor'
+
+LIBRARIES: Dict[str, Library] = {library.alias: library for library in (
+    Library('androidx-core-ktx', 'androidx.core', 'core-ktx', 'coreKtx'),
+    Library('androidx-lifecycle-runtime-ktx', 'androidx.lifecycle', 'lifecycle-runtime-ktx', 'lifecycleRuntimeKtx'),
+    Library('androidx-profileinstaller', 'androidx.profileinstaller', 'profileinstaller', 'profileinstaller'),
+    Library('androidx-appcompat', 'androidx.appcompat', 'appcompat', 'appcompat'),
+    Library('material', 'com.google.android.material', 'material', 'material'),
+    Library('androidx-constraintlayout', 'androidx.constraintlayout', 'constraintlayout', 'constraintlayout'),
+    Library('androidx-activity-compose', 'androidx.activity', 'activity-compose', 'activityCompose'),
+    Library('androidx-compose-bom', 'androidx.compose', 'compose-bom', 'composeBom'),
+    Library('androidx-ui', 'androidx.compose.ui', 'ui'),
+    Library('androidx-ui-graphics', 'androidx.compose.ui', 'ui-graphics'),
+    Library('androidx-ui-tooling', 'androidx.compose.ui', 'ui-tooling'),
+    Library('androidx-ui-tooling-preview', 'androidx.compose.ui', 'ui-tooling-preview'),
+    Library('androidx-ui-test-manifest', 'androidx.compose.ui', 'ui-test-manifest'),
+    Library('androidx-ui-test-junit4', 'androidx.compose.ui', 'ui-test-junit4'),
+    Library('androidx-material3', 'androidx.compose.material3', 'material3'),
+    Library('androidx-compose-material', 'androidx.compose.material', 'material'),
+    Library('retrofit', 'com.squareup.retrofit2', 'retrofit', 'retrofit'),
+    Library('okhttp-logging', 'com.squareup.okhttp3', 'logging-interceptor', 'okhttp'),
+    Library('retrofit-converter-gson', 'com.squareup.retrofit2', 'converter-gson', 'retrofit'),
+    Library('gson', 'com.google.code.gson', 'gson', 'gson'),
+    Library('retrofit-converter-moshi', 'com.squareup.retrofit2', 'converter-moshi', 'retrofit'),
+    Library('moshi-kotlin', 'com.squareup.moshi', 'moshi-kotlin', 'moshi'),
+    Library('retrofit-converter-kotlinx', 'com.jakewharton.retrofit', 'retrofit2-kotlinx-serialization-converter',
+            'retrofitKotlinxConverter'),
+    Library('ktor-client-okhttp', 'io.ktor', 'ktor-client-okhttp', 'ktor'),
+    Library('ktor-client-core', 'io.ktor', 'ktor-client-core', 'ktor'),
+    Library('ktor-client-logging', 'io.ktor', 'ktor-client-logging', 'ktor'),
+    Library('ktor-serialization-kotlinx-json', 'io.ktor', 'ktor-serialization-kotlinx-json', 'ktor'),
+    Library('ktor-serialization-gson', 'io.ktor', 'ktor-serialization-gson', 'ktor'),
+    Library('ktor-client-content-negotiation', 'io.ktor', 'ktor-client-content-negotiation', 'ktor'),
+    Library('kotlinx-serialization-json', 'org.jetbrains.kotlinx', 'kotlinx-serialization-json', 'kotlinxSerialization'),
+    Library('hilt-android', 'com.google.dagger', 'hilt-android', 'hilt'),
+    Library('hilt-compiler', 'com.google.dagger', 'hilt-compiler', 'hilt'),
+    Library('koin-android', 'io.insert-koin', 'koin-android', 'koin'),
+    Library('koin-androidx-compose', 'io.insert-koin', 'koin-androidx-compose', 'koin'),
+    Library('androidx-startup-runtime', 'androidx.startup', 'startup-runtime', 'startup'),
+    Library('androidx-datastore-preferences', 'androidx.datastore', 'datastore-preferences', 'datastore'),
+    Library('androidx-room-runtime', 'androidx.room', 'room-runtime', 'room'),
+    Library('androidx-room-ktx', 'androidx.room', 'room-ktx', 'room'),
+    Library('androidx-room-compiler', 'androidx.room', 'room-compiler', 'room'),
+    Library('androidx-navigation-compose', 'androidx.navigation', 'navigation-compose', 'navigation'),
+    Library('androidx-navigation-fragment-ktx', 'androidx.navigation', 'navigation-fragment-ktx', 'navigation'),
+    Library('androidx-navigation-ui-ktx', 'androidx.navigation', 'navigation-ui-ktx', 'navigation'),
+    Library('junit', 'junit', 'junit', 'junit'),
+    Library('androidx-junit', 'androidx.test.ext', 'junit', 'junitVersion'),
+    Library('androidx-espresso-core', 'androidx.test.espresso', 'espresso-core', 'espressoCore'),
+    Library('androidx-uiautomator', 'androidx.test.uiautomator', 'uiautomator', 'uiautomator'),
+    Library('androidx-benchmark-macro-junit4', 'androidx.benchmark', 'benchmark-macro-junit4', 'benchmarkMacro'),
+    Library('android-gradlePlugin', 'com.android.tools.build', 'gradle', 'agp'),
+    Library('kotlin-gradlePlugin', 'org.jetbrains.kotlin', 'kotlin-gradle-plugin', 'kotlin'),
+)}
+
+PLUGINS: Dict[str, Plugin] = {plugin.alias: plugin for plugin in (
+    Plugin('androidApplication', 'com.android.application', 'agp'),
+    Plugin('jetbrainsKotlinAndroid', 'org.jetbrains.kotlin.android', 'kotlin'),
+    Plugin('hiltAndroid', 'com.google.dagger.hilt.android', 'hilt'),
+    Plugin('kotlinSerialization', 'org.jetbrains.kotlin.plugin.serialization', 'kotlin'),
+    Plugin('ksp', 'com.google.devtools.ksp', 'ksp'),
+    Plugin('kotlinKapt', 'org.jetbrains.kotlin.kapt', 'kotlin'),
+    Plugin('androidTest', 'com.android.test', 'agp'),
+    Plugin('baselineprofile', 'androidx.baselineprofile', 'benchmarkMacro'),
+    Plugin('androidLibrary', 'com.android.library', 'agp'),
+    Plugin('kotlinJvm', 'org.jetbrains.kotlin.jvm', 'kotlin'),
+)}
+
+# The root project declares the Kotlin plugin even for Java apps, since the benchmark module is always Kotlin
+# Plugins applied by the build-logic convention plugins must also be declared here to share one classpath
+ROOT_PLUGINS = (
+    Rule('jetbrainsKotlinAndroid'),
+    Rule('androidLibrary', when=('has_android_modules',)),
+    Rule('kotlinJvm', when=('has_jvm_modules', 'is_kotlin')),
+)
+
+APP_PLUGINS = (
+    Rule('androidApplication'),
+    Rule('jetbrainsKotlinAndroid', when=('is_kotlin',)),
+    Rule('hiltAndroid', when=('use_hilt',)),
+    Rule('kotlinSerialization', when=('use_kotlinx_serialization',)),
+    Rule('ksp', when=('use_ksp_plugin',)),
+    Rule('kotlinKapt', when=('use_kapt',)),
+    Rule('baselineprofile', when=('benchmark_module',)),
+)
+
+# Sections are separated by a blank line in the emitted dependencies block
+APP_DEPENDENCIES = (
+    (
+        Rule('androidx-core-ktx', 'implementation'),
+        Rule('androidx-lifecycle-runtime-ktx', 'implementation'),
+        Rule('androidx-profileinstaller', 'implementation', ('benchmark_module',)),
+    ),
+    (
+        Rule('androidx-activity-compose', 'implementation', ('is_compose',)),
+        Rule('androidx-compose-bom', 'implementation', ('is_compose',), platform=True),
+        Rule('androidx-ui', 'implementation', ('is_compose',)),
+        Rule('androidx-ui-graphics', 'implementation', ('is_compose',)),
+        Rule('androidx-ui-tooling-preview', 'implementation', ('is_compose',)),
+        Rule('androidx-material3', 'implementation', ('is_compose', 'is_material3')),
+        Rule('androidx-compose-material', 'implementation', ('is_compose', '!is_material3')),
+        Rule('androidx-appcompat', 'implementation', ('!is_compose',)),
+        Rule('material', 'implementation', ('!is_compose',)),
+        Rule('androidx-constraintlayout', 'implementation', ('!is_compose',)),
+    ),
+    (
+        Rule('retrofit', 'implementation', ('use_retrofit',)),
+        Rule('okhttp-logging', 'implementation', ('use_retrofit',)),
+        Rule('retrofit-converter-gson', 'implementation', ('use_retrofit', 'use_gson')),
+        Rule('gson', 'implementation', ('use_retrofit', 'use_gson')),
+        Rule('retrofit-converter-moshi', 'implementation', ('use_retrofit', 'use_moshi')),
+        Rule('moshi-kotlin', 'implementation', ('use_retrofit', 'use_moshi')),
+        Rule('retrofit-converter-kotlinx', 'implementation', ('use_retrofit', 'use_kotlinx_serialization')),
+        # OkHttp engine so Ktor shares OkHttp's connection pool and disk cache
+        Rule('ktor-client-okhttp', 'implementation', ('use_ktor',)),
+        Rule('ktor-client-core', 'implementation', ('use_ktor',)),
+        Rule('ktor-client-logging', 'implementation', ('use_ktor',)),
+        Rule('ktor-serialization-kotlinx-json', 'implementation', ('use_ktor', 'use_kotlinx_serialization')),
+        Rule('ktor-client-content-negotiation', 'implementation', ('use_ktor', 'use_kotlinx_serialization')),
+        Rule('ktor-serialization-gson', 'implementation', ('use_ktor', 'use_gson')),
+        Rule('gson', 'implementation', ('use_ktor', 'use_gson')),
+        Rule('ktor-client-content-negotiation', 'implementation', ('use_ktor', 'use_gson')),
+    ),
+    (
+        Rule('kotlinx-serialization-json', 'implementation', ('use_kotlinx_serialization',)),
+    ),
+    (
+        Rule('hilt-android', 'implementation', ('use_hilt',)),
+        Rule('hilt-compiler', PROCESSOR, ('use_hilt',)),
+        Rule('koin-android', 'implementation', ('use_koin',)),
+        Rule('koin-androidx-compose', 'implementation', ('use_koin', 'is_compose')),
+        Rule('androidx-startup-runtime', 'implementation', ('use_startup',)),
+    ),
+    (
+        Rule('androidx-datastore-preferences', 'implementation', ('use_datastore',)),
+    ),
+    (
+        Rule('androidx-room-runtime', 'implementation', ('enable_room',)),
+        Rule('androidx-room-ktx', 'implementation', ('enable_room',)),
+        Rule('androidx-room-compiler', PROCESSOR, ('enable_room',)),
+    ),
+    (
+        Rule('androidx-navigation-compose', 'implementation', ('use_compose_navigation',)),
+        Rule('androidx-navigation-fragment-ktx', 'implementation', ('use_fragment_navigation',)),
+        Rule('androidx-navigation-ui-ktx', 'implementation', ('use_fragment_navigation',)),
+    ),
+    (
+        Rule('junit', 'testImplementation'),
+        Rule('androidx-junit', 'androidTestImplementation'),
+        Rule('androidx-espresso-core', 'androidTestImplementation'),
+        Rule('androidx-compose-bom', 'androidTestImplementation', ('is_compose',), platform=True),
+        Rule('androidx-ui-test-junit4', 'androidTestImplementation', ('is_compose',)),
+        Rule('androidx-ui-tooling', 'debugImplementation', ('is_compose',)),
+        Rule('androidx-ui-test-manifest', 'debugImplementation', ('is_compose',)),
+    ),
+)
+
+BENCHMARK_PLUGINS = (
+    Rule('androidTest'),
+    Rule('jetbrainsKotlinAndroid'),
+    Rule('baselineprofile'),
+)
+
+BENCHMARK_DEPENDENCIES = (
+    (
+        Rule('androidx-junit', 'implementation'),
+        Rule('androidx-espresso-core', 'implementation'),
+        Rule('androidx-uiautomator', 'implementation'),
+        Rule('androidx-benchmark-macro-junit4', 'implementation'),
+    ),
+)
+
+# Compiled against by the convention plugins of the build-logic included build
+BUILD_LOGIC_DEPENDENCIES = (
+    (
+        Rule('android-gradlePlugin', 'compileOnly', ('has_android_modules',)),
+        Rule('kotlin-gradlePlugin', 'compileOnly', ('is_kotlin',)),
+    ),
+)
+
+# Render context flags the rules depend on; the resolver is memoized on their values
+FLAGS = tuple(sorted({
+    flag.lstrip('!')
+    for rules in (
+        ROOT_PLUGINS, APP_PLUGINS, BENCHMARK_PLUGINS, *APP_DEPENDENCIES, *BENCHMARK_DEPENDENCIES,
+        *BUILD_LOGIC_DEPENDENCIES,
+    )
+    for rule in rules
+    for flag in rule.when
+} | {'benchmark_module', 'has_modules'}))
+
+
+class DependencySet(NamedTuple):
+    """Plugins and libraries of every generated module, plus the version catalog that covers them"""
+    root_plugins: Tuple[Plugin, ...]
+    app_plugins: Tuple[Plugin, ...]
+    app_dependencies: Tuple[Tuple[Dependency, ...], ...]
+    benchmark_plugins: Tuple[Plugin, ...]
+    benchmark_dependencies: Tuple[Tuple[Dependency, ...], ...]
+    build_logic_dependencies: Tuple[Tuple[Dependency, ...], ...]
+    versions: Tuple[Tuple[str, str], ...]
+    libraries: Tuple[Library, ...]
+    plugins: Tuple[Plugin, ...]
+
+
+def resolve_dependencies(values: Mapping[str, object]) -> DependencySet:
+    """Resolve the dependency set for the render context values, once per feature combination"""
+    return _resolve(tuple(bool(values[flag]) for flag in FLAGS), values['annotation_processor'])
+
+
+@lru_cache(maxsize=None)
+def _resolve(flag_values: Tuple[bool, ...], annotation_processor: str) -> DependencySet:
+    flags = dict(zip(FLAGS, flag_values))
+
+    def active(rule: Rule) -> bool:
+        return all(not flags[flag[1:]] if flag.startswith('!') else flags[flag] for flag in rule.when)
+
+    def plugins(rules) -> Tuple[Plugin, ...]:
+        return tuple(PLUGINS[rule.alias] for rule in rules if active(rule))
+
+    def dependencies(sections) -> Tuple[Tuple[Dependency, ...], ...]:
+        resolved = (
+            tuple(
+                Dependency(
+                    annotation_processor if rule.configuration == PROCESSOR else rule.configuration,
+                    LIBRARIES[rule.alias],
+                    rule.platform,
+                )
+                for rule in rules if active(rule)
+            )
+            for rules in sections
+        )
+        return tuple(section for section in resolved if section)
+
+    app_plugins = plugins(APP_PLUGINS)
+    app_dependencies = dependencies(APP_DEPENDENCIES)
+    benchmark = flags['benchmark_module']
+    benchmark_plugins = plugins(BENCHMARK_PLUGINS) if benchmark else ()
+    benchmark_dependencies = dependencies(BENCHMARK_DEPENDENCIES) if benchmark else ()
+    build_logic_dependencies = dependencies(BUILD_LOGIC_DEPENDENCIES) if flags['has_modules'] else ()
+
+    # Canonical (declaration) order, so the output does not depend on which module pulled an entry in
+    used_plugins = {plugin.alias for plugin in plugins(ROOT_PLUGINS) + app_plugins + benchmark_plugins}
+    root_plugins = tuple(plugin for alias, plugin in PLUGINS.items() if alias in used_plugins)
+    used_libraries = {
+        dependency.library.alias
+        for section in app_dependencies + benchmark_dependencies
+        for dependency in section
+    }
+    libraries = tuple(library for alias, library in LIBRARIES.items() if alias in used_libraries)
+    used_versions = {entry.version_ref for entry in libraries + root_plugins}
+    versions = tuple((ref, version) for ref, version in VERSIONS.items() if ref in used_versions)
+
+    return DependencySet(
+        root_plugins=root_plugins,
+        app_plugins=app_plugins,
+        app_dependencies=app_dependencies,
+        benchmark_plugins=benchmark_plugins,
+        benchmark_dependencies=benchmark_dependencies,
+        build_logic_dependencies=build_logic_dependencies,
+        versions=versions,
+        libraries=libraries,
+        plugins=root_plugins,
+    )
+
+
+@lru_cache(maxsize=None)
+def groovy_plugins(plugins: Tuple[Plugin, ...], apply: bool = True) -> str:
+    """plugins {} entries in Groovy DSL; apply=False declares versions for the root project"""
+    if apply:
+        return '\n'.join(f"    id '{plugin.id}'" for plugin in plugins)
+    return '\n'.join(
+        f"    id '{plugin.id}' version '{VERSIONS[plugin.version_ref]}' apply false" for plugin in plugins
+    )
+
+
+@lru_cache(maxsize=None)
+def kts_plugins(plugins: Tuple[Plugin, ...], apply: bool = True) -> str:
+    """plugins {} entries in Kotlin DSL, referencing the version catalog"""
+    suffix = '' if apply else ' apply false'
+    return '\n'.join(f'    alias(libs.plugins.{plugin.alias}){suffix}' for plugin in plugins)
+
+
+@lru_cache(maxsize=None)
+def groovy_dependencies(sections: Tuple[Tuple[Dependency, ...], ...]) -> str:
+    """dependencies {} entries in Groovy DSL with literal coordinates"""
+    return '\n\n'.join(
+        '\n'.join(
+            f"    {dependency.configuration} platform('{dependency.library.coordinate}')" if dependency.platform
+            else f"    {dependency.configuration} '{dependency.library.coordinate}'"
+            for dependency in section
+        )
+        for section in sections
+    )
+
+
+@lru_cache(maxsize=None)
+def kts_dependencies(sections: Tuple[Tuple[Dependency, ...], ...]) -> str:
+    """dependencies {} entries in Kotlin DSL, referencing the version catalog"""
+    return '\n\n'.join(
+        '\n'.join(
+            f'    {dependency.configuration}(platform({dependency.library.accessor}))' if dependency.platform
+            else f'    {dependency.configuration}({dependency.library.accessor})'
+            for dependency in section
+        )
+        for section in sections
+    )
+
+
+@lru_cache(maxsize=None)
+def kts_coordinates(sections: Tuple[Tuple[Dependency, ...], ...]) -> str:
+    """dependencies {} entries in Kotlin DSL with literal coordinates, for builds without the version catalog"""
+    return '\n\n'.join(
+        '\n'.join(f'    {dependency.configuration}("{dependency.library.coordinate}")' for dependency in section)
+        for section in sections
+    )
+
+
+@lru_cache(maxsize=None)
+def version_catalog(dependencies: DependencySet) -> str:
+    """gradle/libs.versions.toml covering every library and plugin of the dependency set"""
+    lines = ['[versions]']
+    lines += [f'{ref} = "{version}"' for ref, version in dependencies.versions]
+    lines += ['', '[libraries]']
+    for library in dependencies.libraries:
+        version = f', version.ref = "{library.version_ref}"' if library.version_ref else ''
+        lines.append(f'{library.alias} = {{ group = "{library.group}", name = "{library.name}"{version} }}')
+    lines += ['', '[plugins]']
+    lines += [
+        f'{plugin.alias} = {{ id = "{plugin.id}", version.ref = "{plugin.version_ref}" }}'
+        for plugin in dependencies.plugins
+    ]
+    return '\n'.join(lines)
+
+
+# Registered on the Jinja environment so templates can emit any part of the set in either DSL
+DEPENDENCY_FILTERS = {
+    'groovy_plugins': groovy_plugins,
+    'kts_plugins': kts_plugins,
+    'groovy_dependencies': groovy_dependencies,
+    'kts_dependencies': kts_dependencies,
+    'kts_coordinates': kts_coordinates,
+    'version_catalog': version_catalog,
+}
@@ -0,0 +1,102 @@
+import difflib
+import json
+from typing import Dict, List, Optional
+
+from models.config_model import ProjectConfig
+from .archive import ArchiveFormat, ZipEntry, ZipFormat
+from .skeleton import SkeletonEngine
+
+# Written at the archive root, next to the project directory, so it cannot clash with a project file
+PATCH_MANIFEST = 'patch-manifest.json'
+
+
+class ProjectDiff:
+    """Files added, modified and deleted between the projects of two configurations"""
+
+    __slots__ = ('added', 'modified', 'deleted', 'old')
+
+    def __init__(self, added: Dict[str, bytes], modified: Dict[str, bytes], deleted: List[str],
+                 old: Dict[str, bytes]):
+        # added/modified map path -> new content; old holds the previous content of modified files,
+        # and of deleted files when they were rendered for a unified diff
+        self.added = added
+        self.modified = modified
+        self.deleted = deleted
+        self.old = old
+
+    def manifest(self) -> dict:
+        """Changed paths by kind, each list sorted"""
+        return {
+            'added': sorted(self.added),
+            'modified': sorted(self.modified),
+            'deleted': sorted(self.deleted),
+        }
+
+    def to_archive(self, archive_format: Optional[ArchiveFormat] = None) -> bytes:
+        """Archive of the added and modified files plus a manifest listing every change, deletions included"""
+        entries = [ZipEntry.from_bytes(path, data) for path, data in sorted({**self.added, **self.modified}.items())]
+        entries.append(ZipEntry.from_bytes(PATCH_MANIFEST, json.dumps(self.manifest(), indent=2).encode('utf-8')))
+        return (archive_format or ZipFormat()).write(entries)
+
+    def to_unified(self) -> str:
+        """Unified diff in git apply format; binary files are reported but not inlined"""
+        chunks = []
+        for path in sorted(set(self.added) | set(self.modified) | set(self.deleted)):
+            if path in self.added:
+                chunks.append(_file_diff(path, None, self.added[path]))
+            elif path in self.modified:
+                chunks.append(_file_diff(path, self.old[path], self.modified[path]))
+            else:
+                chunks.append(_file_diff(path, self.old[path], None))
+        return ''.join(chunks)
+
+
+def _file_diff(path: str, old: Optional[bytes], new: Optional[bytes]) -> str:
+    header = f'diff --git a/{path} b/{path}\n'
+    if old is None:
+        header += 'new file mode 100644\n'
+    elif new is None:
+        header += 'deleted file mode 100644\n'
+    try:
+        old_lines = old.decode('utf-8').splitlines(keepends=True) if old is not None else []
+        new_lines = new.decode('utf-8').splitlines(keepends=True) if new is not None else []
+    except UnicodeDecodeError:
+        return header + f'Binary files {_label("a", path, old)} and {_label("b", path, new)} differ\n'
+    lines = []
+    for line in difflib.unified_diff(old_lines, new_lines, _label('a', path, old), _label('b', path, new)):
+        lines.append(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+    return header + ''.join(lines)
+
+
+def _label(side: str, path: str, content: Optional[bytes]) -> str:
+    return f'{side}/{path}' if content is not None else '/dev/null'
+
+
+def diff_projects(engine: SkeletonEngine, previous: ProjectConfig, current: ProjectConfig,
+                  with_deleted_content: bool = False) -> ProjectDiff:
+    """
+    Compare the projects of two configs by per-file input keys, rendering only files whose inputs
+    changed (and, when with_deleted_content is set, the deleted files for a unified diff)
+    """
+    old_sources = engine.file_sources(previous)
+    new_sources = engine.file_sources(current)
+
+    added = {path: render() for path, (_, render) in new_sources.items() if path not in old_sources}
+    deleted = [path for path in old_sources if path not in new_sources]
+    modified, old = {}, {}
+    for path, (key, render) in new_sources.items():
+        if path not in old_sources:
+            continue
+        old_key, old_render = old_sources[path]
+        if key == old_key:
+            continue
+        # Different inputs can still render the same text, e.g. a changed package in a file that never uses it
+        old_data, new_data = old_render(), render()
+        if old_data != new_data:
+            modified[path] = new_data
+            old[path] = old_data
+
+    diff = ProjectDiff(added, modified, deleted, old)
+    if with_deleted_content:
+        diff.old.update((path, old_sources[path][1]()) for path in deleted)
+    return diff
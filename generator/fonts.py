@@ -0,0 +1,176 @@
+import io
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.enums import FontName, FontSubset, FontWeight
+from .archive import ZipEntry
+from .assets import BUNDLE_FILE, AssetStore
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # Listed in requirements.txt; without it, configs that request subsets are rejected
+    font_subset = None
+    TTFont = None
+
+FONT_DIR = Path(__file__).parent.parent / 'fontfamilies'
+
+# Mapped on first use; see use_asset_store
+_store: Optional[AssetStore] = None
+
+# Packed from FONT_DIR when there is no prebuilt bundle, e.g. in a source checkout
+FALLBACK_STORE_FILE = Path(tempfile.gettempdir()) / 'android-generator-assets.bin'
+
+# Compose FontWeight constant for each selectable weight
+COMPOSE_WEIGHTS = {
+    FontWeight.light: 'Light',
+    FontWeight.regular: 'Normal',
+    FontWeight.medium: 'Medium',
+    FontWeight.semibold: 'SemiBold',
+    FontWeight.bold: 'Bold',
+}
+
+# Unicode ranges per subset, matching the Google Fonts unicode-range splits
+SUBSET_RANGES = {
+    FontSubset.latin: (
+        (0x0000, 0x00FF), (0x0131, 0x0131), (0x0152, 0x0153), (0x02BB, 0x02BC), (0x02C6, 0x02C6),
+        (0x02DA, 0x02DA), (0x02DC, 0x02DC), (0x0304, 0x0304), (0x0308, 0x0308), (0x0329, 0x0329),
+        (0x2000, 0x206F), (0x2074, 0x2074), (0x20AC, 0x20AC), (0x2122, 0x2122), (0x2191, 0x2191),
+        (0x2193, 0x2193), (0x2212, 0x2212), (0x2215, 0x2215), (0xFEFF, 0xFEFF), (0xFFFD, 0xFFFD),
+    ),
+    FontSubset.latin_ext: (
+        (0x0100, 0x02AF), (0x0304, 0x0304), (0x0308, 0x0308), (0x0329, 0x0329), (0x1E00, 0x1E9F),
+        (0x1EF2, 0x1EFF), (0x2020, 0x2020), (0x20A0, 0x20AB), (0x20AD, 0x20C0), (0x2113, 0x2113),
+        (0x2C60, 0x2C7F), (0xA720, 0xA7FF),
+    ),
+    FontSubset.cyrillic: (
+        (0x0301, 0x0301), (0x0400, 0x045F), (0x0490, 0x0491), (0x04B0, 0x04B1), (0x2116, 0x2116),
+    ),
+    FontSubset.greek: (
+        (0x0370, 0x0377), (0x037A, 0x037F), (0x0384, 0x038A), (0x038C, 0x038C), (0x038E, 0x03A1),
+        (0x03A3, 0x03FF),
+    ),
+    FontSubset.vietnamese: (
+        (0x0102, 0x0103), (0x0110, 0x0111), (0x0128, 0x0129), (0x0168, 0x0169), (0x01A0, 0x01A1),
+        (0x01AF, 0x01B0), (0x0300, 0x0301), (0x0303, 0x0304), (0x0308, 0x0309), (0x0323, 0x0323),
+        (0x0329, 0x0329), (0x1EA0, 0x1EF9), (0x20AB, 0x20AB),
+    ),
+}
+
+
+def resource_prefix(family: FontName) -> str:
+    """Android resource name prefix of a family's font files"""
+    return family.value.lower().replace(' ', '_')
+
+
+def font_asset(family: FontName, weight: FontWeight) -> str:
+    """Bundle name of a font weight, from the enum member names rather than their display values"""
+    return f'font/{family.name}/{weight.name}'
+
+
+def font_sources() -> Dict[str, Path]:
+    """Every font file in FONT_DIR by bundle name; only needed to pack the bundle"""
+    sources = {}
+    for family in FontName:
+        for weight in FontWeight:
+            source = _source_file(family, weight)
+            if source is not None:
+                sources[font_asset(family, weight)] = source
+    return sources
+
+
+def use_asset_store(path: Optional[str] = None) -> AssetStore:
+    """
+    Map the asset bundle packed at image build time (BUNDLE_FILE). With a path, or without a prebuilt
+    bundle, map the store at path (or FALLBACK_STORE_FILE) instead, packing it from FONT_DIR when needed.
+    """
+    global _store
+    if path is None and BUNDLE_FILE.exists():
+        store = AssetStore(BUNDLE_FILE)
+    else:
+        store = AssetStore.open(Path(path) if path else FALLBACK_STORE_FILE, font_sources())
+    _store = store
+    font_files.cache_clear()
+    return store
+
+
+def asset_store() -> AssetStore:
+    """The mapped asset bundle, mapping it on first use"""
+    return _store if _store is not None else use_asset_store()
+
+
+def zip_entry(path: str, data: bytes) -> ZipEntry:
+    """Compressed entry for a project file; bundled fonts reuse the bundle's payload instead"""
+    entry = asset_store().entry_for(path, data)
+    return entry if entry is not None else ZipEntry.from_bytes(path, data)
+
+
+def _font_data(family: FontName, weight: FontWeight) -> Optional[memoryview]:
+    """A weight's content as a view of the mapped bundle"""
+    store = asset_store()
+    name = font_asset(family, weight)
+    return store.raw(name) if name in store else None
+
+
+def _source_file(family: FontName, weight: FontWeight) -> Optional[Path]:
+    """Locate a weight's .ttf, ignoring case since the file names are not consistent; only used when packing"""
+    family_dir = FONT_DIR / family.value.title()
+    wanted = f'{resource_prefix(family)}_{weight.value}.ttf'
+    if not family_dir.is_dir():
+        return None
+    for path in family_dir.iterdir():
+        if path.name.lower() == wanted:
+            return path
+    return None
+
+
+def _subset(data: bytes, unicodes: List[int]) -> bytes:
+    options = font_subset.Options()
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.notdef_outline = True
+    font = TTFont(io.BytesIO(data))
+    subsetter = font_subset.Subsetter(options=options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    output = io.BytesIO()
+    font.save(output)
+    return output.getvalue()
+
+
+@lru_cache(maxsize=64)
+def font_files(family: FontName, weights: Tuple[FontWeight, ...],
+               subsets: Tuple[FontSubset, ...] = ()) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    Return (resource file name, data) for each selected weight, subset when requested; ValueError if subsets
+    are requested without fontTools installed.
+    Full fonts are memoryviews of the mapped bundle, so caching them copies nothing.
+    """
+    if subsets and font_subset is None:
+        raise ValueError("configuration.fonts.subsets needs fontTools installed on the server")
+    unicodes = sorted({
+        code
+        for subset in subsets
+        for start, end in SUBSET_RANGES[subset]
+        for code in range(start, end + 1)
+    })
+    files = []
+    for weight in weights:
+        data = _font_data(family, weight)
+        if data is None:
+            continue
+        if unicodes:
+            data = _subset(data, unicodes)
+        files.append((f'{resource_prefix(family)}_{weight.value}.ttf', data))
+    return tuple(files)
+
+
+def selected_weights(weights: Optional[Iterable[FontWeight]]) -> Tuple[FontWeight, ...]:
+    """Selected weights in canonical (lightest first) order; every weight when none are given"""
+    if weights is None:
+        return tuple(FontWeight)
+    chosen = set(weights)
+    return tuple(weight for weight in FontWeight if weight in chosen)
@@ -0,0 +1,210 @@
+import csv
+import io
+import json
+import re
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+from xml.etree import ElementTree
+
+from models.naming import locale_qualifier
+from .archive import ZipEntry
+
+# Locale whose strings live in values/strings.xml
+DEFAULT_LOCALE = 'en'
+
+_RESOURCE_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_.]*$')
+_STRING_NAME = re.compile(r'<string name="([^"]+)"')
+
+# Android string resource escaping, in application order (backslashes first so added ones are not doubled)
+_ESCAPES = (
+    ('\\', '\\\\'),
+    ('&', '&amp;'),
+    ('<', '&lt;'),
+    ('>', '&gt;'),
+    ('"', '\\"'),
+    ("'", "\\'"),
+    ('\n', '\\n'),
+    ('\t', '\\t'),
+)
+# Joins the values of a table so it is escaped in one pass; NUL cannot appear in XML text
+_SEPARATOR = '\x00'
+
+# CSV columns that are not locales
+_CSV_KEY_COLUMNS = ('key', 'name', 'id')
+_CSV_IGNORED_COLUMNS = ('comment', 'description', 'context', 'note', 'notes')
+
+
+def escape_strings(values: List[str]) -> List[str]:
+    """Escape texts for Android <string> resources, all at once"""
+    text = _SEPARATOR.join(values)
+    for char, replacement in _ESCAPES:
+        if char in text:
+            text = text.replace(char, replacement)
+    return ['\\' + value if value[:1] in ('@', '?') else value for value in text.split(_SEPARATOR)]
+
+
+class TranslationSet:
+    """Imported strings: default (source) values and a table per locale qualifier"""
+
+    def __init__(self):
+        self.default: Dict[str, str] = {}
+        self.locales: Dict[str, Dict[str, str]] = {}
+        # Locale tag as written in the upload -> its table, so each tag is validated once
+        self._tables: Dict[str, Dict[str, str]] = {}
+        self._names = set()
+
+    def add(self, locale: str, key: str, value: str):
+        """Add one string; empty values are skipped so Android falls back to the default"""
+        if not value:
+            return
+        table = self._tables.get(locale)
+        if table is None:
+            table = self._table(locale)
+        if key not in self._names:
+            if not _RESOURCE_NAME.match(key):
+                raise ValueError(f"Invalid string name {key!r}; expected letters, digits, '_' and '.'")
+            self._names.add(key)
+        table[key] = value.replace(_SEPARATOR, '')
+
+    def _table(self, locale: str) -> Dict[str, str]:
+        qualifier = locale_qualifier(locale)
+        table = self.default if qualifier == DEFAULT_LOCALE else self.locales.setdefault(qualifier, {})
+        self._tables[locale] = table
+        return table
+
+    def tables(self, default_names: set) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+        """Per-locale string tables in key order, checking that every key has a default value"""
+        tables = {}
+        for qualifier, strings in self.locales.items():
+            missing = next((key for key in strings if key not in default_names and key not in self.default), None)
+            if missing is not None:
+                raise ValueError(f"String {missing!r} is translated for {qualifier} but has no {DEFAULT_LOCALE} value")
+            tables[qualifier] = tuple(sorted(strings.items()))
+        return tables
+
+
+def load_translations(file: BinaryIO, filename: str) -> TranslationSet:
+    """Stream translations from a CSV, XLIFF (1.2 or 2.x) or JSON upload, chosen by file extension"""
+    translations = TranslationSet()
+    name = filename.lower()
+    if name.endswith('.csv'):
+        rows = _read_csv(file)
+    elif name.endswith(('.xlf', '.xliff')):
+        rows = _read_xliff(file)
+    elif name.endswith('.json'):
+        rows = _read_json(file)
+    else:
+        raise ValueError("Translations must be a .csv, .xlf/.xliff or .json file")
+    for locale, key, value in rows:
+        translations.add(locale, key, value)
+    return translations
+
+
+def _read_csv(file: BinaryIO) -> Iterator[Tuple[str, str, str]]:
+    """key,<locale>,<locale>,... with one row per string; comment/description columns are ignored"""
+    text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header or header[0].strip().lower() not in _CSV_KEY_COLUMNS:
+            raise ValueError("Translation CSV must start with a key column followed by one column per locale")
+        columns = [
+            (index, column.strip()) for index, column in enumerate(header)
+            if index > 0 and column.strip() and column.strip().lower() not in _CSV_IGNORED_COLUMNS
+        ]
+        for row in reader:
+            if not row or not row[0].strip():
+                continue
+            key = row[0].strip()
+            for index, locale in columns:
+                if index < len(row):
+                    yield locale, key, row[index]
+    except csv.Error as e:
+        raise ValueError(f"Invalid translation CSV: {str(e)}")
+    finally:
+        text.detach()
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _read_xliff(file: BinaryIO) -> Iterator[Tuple[str, str, str]]:
+    """trans-unit (1.2) or unit (2.x) elements; the unit id (or resname) is the string name"""
+    source_language = target_language = None
+    key = None
+    alternatives = 0
+    try:
+        for event, element in ElementTree.iterparse(file, events=('start', 'end')):
+            name = _local_name(element.tag)
+            if event == 'start':
+                if name in ('xliff', 'file'):
+                    source_language = element.get('srcLang') or element.get('source-language') or source_language
+                    target_language = element.get('trgLang') or element.get('target-language') or target_language
+                elif name in ('trans-unit', 'unit'):
+                    key = element.get('resname') or element.get('name') or element.get('id')
+                elif name == 'alt-trans':
+                    alternatives += 1
+                continue
+            if name == 'alt-trans':
+                alternatives -= 1
+            elif name in ('source', 'target') and key is not None and not alternatives:
+                language = source_language if name == 'source' else target_language
+                if language is None:
+                    raise ValueError(f"XLIFF file does not declare its {name} language")
+                yield language, key, ''.join(element.itertext())
+            elif name in ('trans-unit', 'unit'):
+                key = None
+                # Units are independent, so drop each one once read to keep memory flat
+                element.clear()
+    except ElementTree.ParseError as e:
+        raise ValueError(f"Invalid XLIFF: {str(e)}")
+
+
+def _read_json(file: BinaryIO) -> Iterator[Tuple[str, str, str]]:
+    """{"<locale>": {"<name>": "<text>", ...}, ...}"""
+    try:
+        data = json.load(file)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid translation JSON: {str(e)}")
+    if not isinstance(data, dict) or not all(isinstance(strings, dict) for strings in data.values()):
+        raise ValueError("Translation JSON must map each locale to an object of string names and texts")
+    for locale, strings in data.items():
+        for key, value in strings.items():
+            yield locale, key, str(value)
+
+
+def strings_xml(table: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Render a string table as a strings.xml resource file"""
+    lines = ['<?xml version="1.0" encoding="utf-8"?>', '<resources>']
+    values = escape_strings([value for _, value in table])
+    lines.extend(f'    <string name="{key}">{value}</string>' for (key, _), value in zip(table, values))
+    lines.append('</resources>')
+    return '\n'.join(lines).encode('utf-8')
+
+
+def apply_translations(entries: Dict[str, ZipEntry], res_dir: str, translations: TranslationSet):
+    """
+    Add imported default strings to values/strings.xml and write values-<locale>/strings.xml for every
+    imported locale. Locales with identical tables share one rendered and compressed entry.
+    """
+    default_path = f'{res_dir}/values/strings.xml'
+    default_text = entries[default_path].data().decode('utf-8')
+    names = set(_STRING_NAME.findall(default_text))
+    tables = translations.tables(names)
+
+    extra = [(key, value) for key, value in sorted(translations.default.items()) if key not in names]
+    if extra:
+        values = escape_strings([value for _, value in extra])
+        added = ''.join(f'    <string name="{key}">{value}</string>\n' for (key, _), value in zip(extra, values))
+        head, _, tail = default_text.rpartition('</resources>')
+        entries[default_path] = ZipEntry.from_bytes(default_path, (head + added + '</resources>' + tail).encode('utf-8'))
+
+    rendered: Dict[Tuple[Tuple[str, str], ...], ZipEntry] = {}
+    for qualifier in sorted(tables):
+        table = tables[qualifier]
+        path = f'{res_dir}/values-{qualifier}/strings.xml'
+        entry = rendered.get(table)
+        if entry is None:
+            entry = rendered[table] = ZipEntry.from_bytes(path, strings_xml(table))
+        entries[path] = entry if entry.name == path else entry.renamed(path)
+
@@ -0,0 +1,243 @@
+import math
+import re
+import struct
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .archive import ZipEntry
+from .palette import parse_hex, rgb_to_lch
+from .utils import ProjectUtils
+
+# Legacy launcher icon size in pixels for each mipmap density (48dp)
+DENSITIES = {'mdpi': 48, 'hdpi': 72, 'xhdpi': 96, 'xxhdpi': 144, 'xxxhdpi': 192}
+
+# Adaptive icon canvas and the centered area launchers show (in dp)
+_CANVAS = 108
+_VISIBLE = 72
+
+# Stroke glyphs on a 4 x 6 grid (y grows downwards), one polyline per stroke
+_GLYPHS: Dict[str, Tuple[Tuple[Tuple[float, float], ...], ...]] = {
+    'A': (((0, 6), (2, 0), (4, 6)), ((0.67, 4), (3.33, 4))),
+    'B': (((0, 3), (3, 3), (4, 4), (4, 5), (3, 6), (0, 6), (0, 0), (3, 0), (4, 1), (4, 2), (3, 3)),),
+    'C': (((4, 1), (3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5)),),
+    'D': (((0, 0), (0, 6), (2.5, 6), (4, 4.5), (4, 1.5), (2.5, 0), (0, 0)),),
+    'E': (((4, 0), (0, 0), (0, 6), (4, 6)), ((0, 3), (3, 3))),
+    'F': (((4, 0), (0, 0), (0, 6)), ((0, 3), (3, 3))),
+    'G': (((4, 1), (3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5), (4, 3), (2, 3)),),
+    'H': (((0, 0), (0, 6)), ((4, 0), (4, 6)), ((0, 3), (4, 3))),
+    'I': (((2, 0), (2, 6)), ((1, 0), (3, 0)), ((1, 6), (3, 6))),
+    'J': (((4, 0), (4, 5), (3, 6), (1, 6), (0, 5)),),
+    'K': (((0, 0), (0, 6)), ((4, 0), (0, 4)), ((1.2, 2.8), (4, 6))),
+    'L': (((0, 0), (0, 6), (4, 6)),),
+    'M': (((0, 6), (0, 0), (2, 3), (4, 0), (4, 6)),),
+    'N': (((0, 6), (0, 0), (4, 6), (4, 0)),),
+    'O': (((1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6), (0, 5), (0, 1), (1, 0)),),
+    'P': (((0, 6), (0, 0), (3, 0), (4, 1), (4, 2), (3, 3), (0, 3)),),
+    'Q': (((1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6), (0, 5), (0, 1), (1, 0)), ((2.5, 4.5), (4, 6))),
+    'R': (((0, 6), (0, 0), (3, 0), (4, 1), (4, 2), (3, 3), (0, 3)), ((2, 3), (4, 6))),
+    'S': (((4, 1), (3, 0), (1, 0), (0, 1), (0, 2), (1, 3), (3, 3), (4, 4), (4, 5), (3, 6), (1, 6), (0, 5)),),
+    'T': (((0, 0), (4, 0)), ((2, 0), (2, 6))),
+    'U': (((0, 0), (0, 5), (1, 6), (3, 6), (4, 5), (4, 0)),),
+    'V': (((0, 0), (2, 6), (4, 0)),),
+    'W': (((0, 0), (1, 6), (2, 3), (3, 6), (4, 0)),),
+    'X': (((0, 0), (4, 6)), ((4, 0), (0, 6))),
+    'Y': (((0, 0), (2, 3), (4, 0)), ((2, 3), (2, 6))),
+    'Z': (((0, 0), (4, 0), (0, 6), (4, 6)),),
+    '0': (((1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6), (0, 5), (0, 1), (1, 0)), ((3.5, 0.5), (0.5, 5.5))),
+    '1': (((1, 1), (2, 0), (2, 6)), ((1, 6), (3, 6))),
+    '2': (((0, 1), (1, 0), (3, 0), (4, 1), (4, 2), (0, 6), (4, 6)),),
+    '3': (((0, 1), (1, 0), (3, 0), (4, 1), (4, 2), (3, 3), (4, 4), (4, 5), (3, 6), (1, 6), (0, 5)), ((1.5, 3), (3, 3))),
+    '4': (((3, 6), (3, 0), (0, 4), (4, 4)),),
+    '5': (((4, 0), (0, 0), (0, 3), (3, 3), (4, 4), (4, 5), (3, 6), (1, 6), (0, 5)),),
+    '6': (((3, 0), (1, 0), (0, 1), (0, 5), (1, 6), (3, 6), (4, 5), (4, 4), (3, 3), (0, 3)),),
+    '7': (((0, 0), (4, 0), (1.5, 6)),),
+    '8': (((1, 3), (0, 2), (0, 1), (1, 0), (3, 0), (4, 1), (4, 2), (3, 3), (1, 3), (0, 4), (0, 5), (1, 6),
+           (3, 6), (4, 5), (4, 4), (3, 3)),),
+    '9': (((4, 3), (1, 3), (0, 2), (0, 1), (1, 0), (3, 0), (4, 1), (4, 5), (3, 6), (1, 6)),),
+}
+
+# Glyph grid unit, letter spacing and stroke width in dp on the adaptive icon canvas
+_UNIT = 5.0
+_SPACING = 1.5
+_STROKE = 4.0
+
+_ADAPTIVE_ICON = '''<?xml version="1.0" encoding="utf-8"?>
+<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
+    <background android:drawable="@drawable/ic_launcher_background" />
+    <foreground android:drawable="@drawable/ic_launcher_foreground" />
+    <monochrome android:drawable="@drawable/ic_launcher_foreground" />
+</adaptive-icon>'''
+
+
+def icon_initials(name: str) -> str:
+    """Up to two initials of the project name that the glyph set can draw"""
+    words = [re.sub(r'[^A-Z0-9]', '', word.upper()) for word in re.split(r'[\s\-_]+', name)]
+    words = [word for word in words if word]
+    if len(words) >= 2:
+        return words[0][0] + words[1][0]
+    if words:
+        return words[0][:2]
+    return 'A'
+
+
+def _layout(initials: str) -> List[Tuple[str, float]]:
+    """Each initial with the left edge (dp) of its glyph, centered on the adaptive icon canvas"""
+    width = len(initials) * 4 + (len(initials) - 1) * _SPACING
+    left = _CANVAS / 2 - width * _UNIT / 2
+    return [(char, left + index * (4 + _SPACING) * _UNIT) for index, char in enumerate(initials)]
+
+
+def _glyph_strokes(char: str, left: float) -> List[List[Tuple[float, float]]]:
+    """Polylines of one glyph in adaptive icon canvas coordinates (dp)"""
+    top = _CANVAS / 2 - 3 * _UNIT
+    return [[(left + x * _UNIT, top + y * _UNIT) for x, y in polyline] for polyline in _GLYPHS[char]]
+
+
+def _strokes(initials: str) -> List[List[Tuple[float, float]]]:
+    return [polyline for char, left in _layout(initials) for polyline in _glyph_strokes(char, left)]
+
+
+def _foreground_color(color: str) -> str:
+    """White or near-black glyphs, whichever reads better on the background tone"""
+    tone, _, _ = rgb_to_lch(parse_hex(color))
+    return '#1C1B1F' if tone > 60 else '#FFFFFF'
+
+
+def _format(value: float) -> str:
+    return f'{value:.2f}'.rstrip('0').rstrip('.')
+
+
+def foreground_vector(initials: str, color: str) -> str:
+    path_data = ' '.join(
+        'M' + ' L'.join(f'{_format(x)},{_format(y)}' for x, y in polyline) for polyline in _strokes(initials)
+    )
+    return f'''<?xml version="1.0" encoding="utf-8"?>
+<vector xmlns:android="http://schemas.android.com/apk/res/android"
+    android:width="{_CANVAS}dp"
+    android:height="{_CANVAS}dp"
+    android:viewportWidth="{_CANVAS}"
+    android:viewportHeight="{_CANVAS}">
+    <path
+        android:pathData="{path_data}"
+        android:strokeColor="{_foreground_color(color)}"
+        android:strokeWidth="{_format(_STROKE)}"
+        android:strokeLineCap="round"
+        android:strokeLineJoin="round" />
+</vector>'''
+
+
+def background_vector(color: str) -> str:
+    return f'''<?xml version="1.0" encoding="utf-8"?>
+<vector xmlns:android="http://schemas.android.com/apk/res/android"
+    android:width="{_CANVAS}dp"
+    android:height="{_CANVAS}dp"
+    android:viewportWidth="{_CANVAS}"
+    android:viewportHeight="{_CANVAS}">
+    <path
+        android:fillColor="{color}"
+        android:pathData="M0,0h{_CANVAS}v{_CANVAS}h-{_CANVAS}z" />
+</vector>'''
+
+
+@lru_cache(maxsize=None)
+def _shape_mask(size: int, round_icon: bool) -> bytes:
+    """Anti-aliased coverage (0-255) of the legacy icon shape, one byte per pixel"""
+    center = size / 2
+    half = size * 0.46
+    radius = half if round_icon else size * 0.1
+    inner = half - radius
+    # The shape is symmetric, so the per-axis distances are computed once and combined per row
+    axis = [abs(i + 0.5 - center) - inner for i in range(size)]
+    return bytes(
+        round(255 * min(1.0, max(0.0, 0.5 + radius - math.hypot(max(qx, 0.0), max(qy, 0.0)) - min(max(qx, qy), 0.0))))
+        for qy in axis for qx in axis
+    )
+
+
+@lru_cache(maxsize=None)
+def _glyph_mask(char: str, left: float, size: int) -> bytes:
+    """Anti-aliased coverage (0-255) of one glyph's strokes, rasterized within each segment's bounding box"""
+    scale = size * 0.92 / _VISIBLE
+    origin = size * 0.04 - (_CANVAS - _VISIBLE) / 2 * scale
+    half_width = _STROKE * scale / 2
+    coverage = bytearray(size * size)
+    for polyline in _glyph_strokes(char, left):
+        points = [(origin + x * scale, origin + y * scale) for x, y in polyline]
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            dx, dy = x1 - x0, y1 - y0
+            length_sq = dx * dx + dy * dy or 1e-9
+            reach = half_width + 1
+            columns = range(max(0, int(min(x0, x1) - reach)), min(size, int(max(x0, x1) + reach) + 1))
+            for row in range(max(0, int(min(y0, y1) - reach)), min(size, int(max(y0, y1) + reach) + 1)):
+                py = row + 0.5 - y0
+                base = row * size
+                for column in columns:
+                    px = column + 0.5 - x0
+                    t = min(1.0, max(0.0, (px * dx + py * dy) / length_sq))
+                    value = round(255 * min(1.0, half_width + 0.5 - math.hypot(px - t * dx, py - t * dy)))
+                    if value > coverage[base + column]:
+                        coverage[base + column] = value
+    return bytes(coverage)
+
+
+def _initials_mask(initials: str, size: int) -> bytes:
+    """Coverage of all initials; glyphs never overlap, so their masks are merged with a bitwise OR"""
+    merged = 0
+    for char, left in _layout(initials):
+        merged |= int.from_bytes(_glyph_mask(char, left, size), 'big')
+    return merged.to_bytes(size * size, 'big')
+
+
+def _encode_png(size: int, pixels: bytes) -> bytes:
+    """Encode 8-bit RGBA pixels as a PNG"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    stride = size * 4
+    raw = b''.join(b'\x00' + pixels[row * stride:(row + 1) * stride] for row in range(size))
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 6, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(raw))
+        + chunk(b'IEND', b'')
+    )
+
+
+@lru_cache(maxsize=1024)
+def legacy_icon_png(initials: str, color: str, density: str, round_icon: bool = False) -> bytes:
+    """Rasterize the legacy launcher icon for one density, cached per (initials, color, density)"""
+    size = DENSITIES[density]
+    background = parse_hex(color)
+    foreground = parse_hex(_foreground_color(color))
+    glyphs = _initials_mask(initials, size)
+    # Whole-plane compositing: each channel is the glyph coverage mapped through a 256-entry blend table
+    pixels = bytearray(size * size * 4)
+    for channel, (b, f) in enumerate(zip(background, foreground)):
+        pixels[channel::4] = glyphs.translate(bytes(round(b + (f - b) * level / 255) for level in range(256)))
+    pixels[3::4] = _shape_mask(size, round_icon)
+    return _encode_png(size, bytes(pixels))
+
+
+def launcher_icon_files(name: str, color: str) -> Dict[str, bytes]:
+    """Adaptive and legacy launcher icon resources, keyed by path relative to res/"""
+    initials = icon_initials(name)
+    files = {
+        'mipmap-anydpi-v26/ic_launcher.xml': _ADAPTIVE_ICON.encode('utf-8'),
+        'mipmap-anydpi-v26/ic_launcher_round.xml': _ADAPTIVE_ICON.encode('utf-8'),
+        'drawable/ic_launcher_background.xml': background_vector(color).encode('utf-8'),
+        'drawable/ic_launcher_foreground.xml': foreground_vector(initials, color).encode('utf-8'),
+    }
+    for density in DENSITIES:
+        files[f'mipmap-{density}/ic_launcher.png'] = legacy_icon_png(initials, color, density)
+        files[f'mipmap-{density}/ic_launcher_round.png'] = legacy_icon_png(initials, color, density, True)
+    return files
+
+
+@lru_cache(maxsize=256)
+def launcher_icon_entries(name: str, color: str) -> Tuple[ZipEntry, ...]:
+    """Compressed launcher icon entries at their archive paths, reused across requests"""
+    res_dir = f'{ProjectUtils.sanitize_project_name(name)}/app/src/main/res'
+    return tuple(
+        ZipEntry.from_bytes(f'{res_dir}/{path}', data) for path, data in launcher_icon_files(name, color).items()
+    )
@@ -0,0 +1,48 @@
+import re
+from typing import List, NamedTuple, Tuple
+
+from models.config_model import ModuleConfig
+from models.enums import ModuleType
+from models.naming import module_package
+
+# Convention plugins from the generated build-logic included build; module scripts only apply one of these
+ANDROID_LIBRARY_CONVENTION = 'convention.android.library'
+JVM_LIBRARY_CONVENTION = 'convention.jvm.library'
+
+
+class ModuleContext(NamedTuple):
+    """Flattened view of one library module of the module graph"""
+    path: str  # Gradle path, e.g. :core:data
+    dir: str  # core/data
+    namespace: str  # <package>.core.data
+    package_path: str  # <package path>/core/data
+    class_name: str  # CoreDataModule
+    is_android: bool
+    convention: str
+    dependencies: Tuple[str, ...]  # Gradle paths
+
+
+def module_contexts(modules: List[ModuleConfig], package: str, package_path: str) -> Tuple[ModuleContext, ...]:
+    """Contexts of the configured modules, in path order so output does not depend on config order"""
+    contexts = []
+    for module in sorted(modules, key=lambda m: m.path):
+        segments = module.path.strip(':').split(':')
+        package_segments = module_package(module.path).split('.')
+        is_android = module.type == ModuleType.android_library
+        contexts.append(ModuleContext(
+            path=module.path,
+            dir='/'.join(segments),
+            namespace='.'.join([package] + package_segments),
+            package_path='/'.join([package_path] + package_segments),
+            class_name=''.join(word.capitalize() for segment in segments for word in re.split(r'[-_]', segment)) + 'Module',
+            is_android=is_android,
+            convention=ANDROID_LIBRARY_CONVENTION if is_android else JVM_LIBRARY_CONVENTION,
+            dependencies=tuple(sorted(set(module.dependencies))),
+        ))
+    return tuple(contexts)
+
+
+def app_module_dependencies(modules: Tuple[ModuleContext, ...]) -> Tuple[ModuleContext, ...]:
+    """Modules :app depends on: every module no other module depends on (the top of the graph, e.g. features)"""
+    depended_on = {dependency for module in modules for dependency in module.dependencies}
+    return tuple(module for module in modules if module.path not in depended_on)
@@ -0,0 +1,628 @@
+import json
+import re
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+
+from models.config_model import ProjectConfig
+from models.enums import DILib, NetworkingLib, SerializationLib
+from models.naming import RESERVED_WORDS
+from .archive import ZipEntry
+from .builder import template_environment
+from .utils import ProjectUtils
+
+try:
+    import yaml
+except ImportError:  # YAML specs are optional; JSON always works
+    yaml = None
+
+# Used when the document has no (absolute) server URL; relative server URLs are resolved against it
+DEFAULT_BASE_URL = 'https://api.example.com/'
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete')
+HTTP_CACHE_BYTES = 10 * 1024 * 1024
+
+_WORD = re.compile(r'[A-Za-z0-9]+')
+_PATH_PARAMETER = re.compile(r'\{([^}]+)\}')
+_ESCAPES = {'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'}
+
+
+def _pointer(*parts) -> str:
+    """JSON pointer to the document node at parts"""
+    return '#/' + '/'.join(str(part).replace('~', '~0').replace('/', '~1') for part in parts)
+
+
+class ApiSpec:
+    """An OpenAPI 3 document with local $ref resolution indexed by JSON pointer"""
+
+    def __init__(self, document: dict):
+        if not isinstance(document, dict) or not str(document.get('openapi', '')).startswith('3.'):
+            raise ValueError("Only OpenAPI 3.x documents are supported")
+        self.document = document
+        self._refs: Dict[str, dict] = {}
+
+    def resolve(self, node):
+        """Follow $ref chains to the referenced object, resolving each pointer once"""
+        seen = set()
+        while isinstance(node, dict) and '$ref' in node:
+            pointer = node['$ref']
+            if pointer in seen:
+                raise ValueError(f"Circular $ref {pointer}")
+            seen.add(pointer)
+            target = self._refs.get(pointer)
+            if target is None:
+                target = self._refs[pointer] = self._lookup(pointer)
+            node = target
+        return node
+
+    def _lookup(self, pointer: str):
+        if not pointer.startswith('#/'):
+            raise ValueError(f"Only local $ref pointers are supported, got {pointer!r}")
+        node = self.document
+        for part in pointer[2:].split('/'):
+            part = part.replace('~1', '/').replace('~0', '~')
+            if not isinstance(node, dict) or part not in node:
+                raise ValueError(f"Unresolvable $ref {pointer}")
+            node = node[part]
+        return node
+
+    @property
+    def base_url(self) -> str:
+        """First server URL with its variables at their defaults, ending with / as Retrofit requires"""
+        servers = self.document.get('servers', [])
+        if not isinstance(servers, list):
+            raise ValueError(f"Expected an array at {_pointer('servers')}")
+        server = self.resolve_object(servers[0], 'servers', 0) if servers else {}
+        url = server.get('url') or '/'
+        if not isinstance(url, str):
+            raise ValueError(f"Expected a string at {_pointer('servers', 0, 'url')}")
+        variables = server.get('variables', {})
+        if not isinstance(variables, dict):
+            raise ValueError(f"Expected an object at {_pointer('servers', 0, 'variables')}")
+        for name, variable in variables.items():
+            variable = self.resolve_object(variable, 'servers', 0, 'variables', name)
+            url = url.replace('{' + name + '}', str(variable.get('default', '')))
+        url = urljoin(DEFAULT_BASE_URL, url)
+        return url if url.endswith('/') else url + '/'
+
+    def resolve_object(self, node, *parts) -> dict:
+        """Resolve node, which must be an object; ValueError with the JSON pointer of parts otherwise"""
+        node = self.resolve(node)
+        if not isinstance(node, dict):
+            raise ValueError(f"Expected an object at {_pointer(*parts)}")
+        return node
+
+    def _parameters(self, parameters, *parts) -> List[dict]:
+        """Resolved parameter objects of a parameters array, each with a name and a location"""
+        if parameters is None:
+            return []
+        if not isinstance(parameters, list):
+            raise ValueError(f"Expected an array at {_pointer(*parts)}")
+        resolved = []
+        for index, parameter in enumerate(parameters):
+            parameter = self.resolve_object(parameter, *parts, index)
+            if not isinstance(parameter.get('name'), str) or not isinstance(parameter.get('in'), str):
+                raise ValueError(f"Parameter at {_pointer(*parts, index)} needs a name and an in location")
+            resolved.append(parameter)
+        return resolved
+
+    def operations(self) -> Iterator[Tuple[str, str, dict, List[dict]]]:
+        """Yield (path, method, operation, parameters) in document order, path-level parameters merged in"""
+        paths = self.document.get('paths')
+        if paths is None:
+            return
+        if not isinstance(paths, dict):
+            raise ValueError(f"Expected an object at {_pointer('paths')}")
+        for path, item in paths.items():
+            item = self.resolve_object(item, 'paths', path)
+            shared = self._parameters(item.get('parameters'), 'paths', path, 'parameters')
+            for method in HTTP_METHODS:
+                if item.get(method) is None:
+                    continue
+                operation = self.resolve_object(item[method], 'paths', path, method)
+                if not isinstance(operation.get('tags', []), list):
+                    raise ValueError(f"Expected an array at {_pointer('paths', path, method, 'tags')}")
+                own = self._parameters(operation.get('parameters'), 'paths', path, method, 'parameters')
+                overridden = {(parameter['name'], parameter['in']) for parameter in own}
+                parameters = [p for p in shared if (p['name'], p['in']) not in overridden] + own
+                yield path, method, operation, parameters
+
+
+def load_openapi(file: BinaryIO, filename: str) -> ApiSpec:
+    """Parse an OpenAPI 3 document from a .json or .yaml/.yml upload"""
+    name = filename.lower()
+    if name.endswith('.json'):
+        try:
+            document = json.load(file)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid OpenAPI JSON: {str(e)}")
+    elif name.endswith(('.yaml', '.yml')):
+        if yaml is None:
+            raise ValueError("YAML OpenAPI documents need PyYAML installed; upload the document as JSON instead")
+        try:
+            # The libyaml loader is several times faster on large specs when it is available
+            document = yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid OpenAPI YAML: {str(e)}")
+    else:
+        raise ValueError("OpenAPI document must be a .json, .yaml or .yml file")
+    return ApiSpec(document)
+
+
+def _pascal(text: str) -> str:
+    name = ''.join(word[0].upper() + word[1:] for word in _WORD.findall(text))
+    return name if name and not name[0].isdigit() else 'N' + name
+
+
+def _camel(text: str) -> str:
+    name = _pascal(text)
+    name = name[0].lower() + name[1:]
+    return name + 'Value' if name in RESERVED_WORDS else name
+
+
+def _string_literal(text: str, kotlin: bool) -> str:
+    """Quoted Kotlin or Java string literal of text; in Kotlin $ is escaped too, so nothing is interpolated"""
+    escaped = []
+    for char in text:
+        if char in _ESCAPES:
+            escaped.append(_ESCAPES[char])
+        elif char == '$' and kotlin:
+            escaped.append('\\$')
+        elif ord(char) < 0x20:
+            # Java translates \uXXXX before lexing, so a control character needs an octal escape there
+            escaped.append(f'\\u{ord(char):04x}' if kotlin else f'\\{ord(char):03o}')
+        else:
+            escaped.append(char)
+    return '"' + ''.join(escaped) + '"'
+
+
+def _unique(name: str, used: set) -> str:
+    candidate, index = name, 2
+    while candidate in used:
+        candidate, index = f'{name}{index}', index + 1
+    used.add(candidate)
+    return candidate
+
+
+class _Type(NamedTuple):
+    kotlin: str
+    java: str
+
+
+class _Property(NamedTuple):
+    json_name: str
+    name: str
+    type: _Type
+    required: bool
+
+
+class _Parameter(NamedTuple):
+    location: str  # path, query or header
+    json_name: str
+    name: str
+    type: _Type
+    required: bool
+
+
+class _Operation(NamedTuple):
+    method: str
+    path: str  # relative to the base URL
+    name: str
+    parameters: Tuple[_Parameter, ...]
+    body: Optional[_Type]
+    body_is_json: bool
+    response: Optional[_Type]  # None for no content
+
+
+class PropertyContext(NamedTuple):
+    name: str
+    annotation: str  # serializer annotation carrying the JSON name
+    type: str  # in the target language; optional Kotlin properties default to null
+
+
+class ModelContext(NamedTuple):
+    package: str  # <package>.data.remote; models live in its model subpackage
+    name: str
+    imports: Tuple[str, ...]
+    serializable: bool  # annotated with kotlinx @Serializable
+    properties: Tuple[PropertyContext, ...]
+
+
+class ParameterContext(NamedTuple):
+    location: str  # path, query or header
+    literal: str  # string literal of the name sent on the wire
+    name: str
+    type: str  # in the target language; optional Kotlin parameters default to null
+
+
+class OperationContext(NamedTuple):
+    name: str
+    method: str
+    path: str  # string literal, relative to the base URL
+    parameters: Tuple[ParameterContext, ...]
+    body: Optional[str]
+    body_is_json: bool
+    response: Optional[str]  # None for no content
+
+
+class ServiceContext(NamedTuple):
+    package: str
+    name: str
+    imports: Tuple[str, ...]
+    operations: Tuple[OperationContext, ...]
+
+
+class ClientContext(NamedTuple):
+    package: str
+    imports: Tuple[str, ...]
+    base_url: str  # string literal
+    cache_bytes: int
+    converter: Optional[str]  # Retrofit converter factory or Ktor ContentNegotiation call
+    injected: bool  # built on the client AppModule provides instead of its own
+
+
+class ApiGenerator:
+    """
+    Turns an ApiSpec into the Retrofit interfaces or Ktor clients, models and shared HTTP client of a
+    project. Operations are walked once; a model is generated the first time a schema is referenced.
+    """
+
+    def __init__(self, spec: ApiSpec, config: ProjectConfig):
+        configuration = config.configuration
+        if configuration.networking == NetworkingLib.none:
+            raise ValueError("An OpenAPI document needs networking set to retrofit or ktor")
+        self.spec = spec
+        self.config = config
+        self.kotlin = configuration.language.value == 'kotlin'
+        if configuration.networking == NetworkingLib.ktor and not self.kotlin:
+            raise ValueError("Ktor clients can only be generated for Kotlin projects")
+        self.ktor = configuration.networking == NetworkingLib.ktor
+        # AppModule already provides the OkHttpClient (Retrofit) or HttpClient (Ktor); a second one would open
+        # its own connection pool on the same disk cache. Koin's module is Kotlin-only.
+        self.injected = configuration.dependencyInjection == DILib.hilt or (
+            configuration.dependencyInjection == DILib.koin and self.kotlin
+        )
+        self.serialization = configuration.serialization
+        self.package = f'{config.project.package}.data.remote'
+        # Models need a serializer the HTTP stack can use; otherwise bodies stay raw
+        if self.ktor:
+            self.typed = self.serialization in (SerializationLib.kotlinx, SerializationLib.gson)
+        elif self.kotlin:
+            self.typed = self.serialization != SerializationLib.none
+        else:
+            self.typed = self.serialization in (SerializationLib.gson, SerializationLib.moshi)
+        self.models: Dict[str, Tuple[_Property, ...]] = {}
+        self._model_names = set()
+        self._schema_types: Dict[int, _Type] = {}
+
+    # Types
+
+    def _free_form(self) -> _Type:
+        if self.serialization == SerializationLib.moshi:
+            return _Type('Any', 'Object')
+        return _Type('JsonElement', 'JsonElement')
+
+    def _type(self, schema, hint: str) -> _Type:
+        """Type of a schema; object schemas become models named after their component or hint"""
+        if isinstance(schema, dict) and '$ref' in schema:
+            pointer = schema['$ref']
+            resolved = self.spec.resolve(schema)
+            if pointer.startswith('#/components/schemas/'):
+                hint = pointer.rsplit('/', 1)[-1]
+            schema = resolved
+        if not isinstance(schema, dict):
+            return self._free_form()
+        # Component schemas are shared by identity, so each is mapped (and its model generated) once
+        known = self._schema_types.get(id(schema))
+        if known is not None:
+            return known
+
+        kind = schema.get('type')
+        if isinstance(kind, list):  # OpenAPI 3.1: ["string", "null"]
+            kind = next((k for k in kind if k != 'null'), None)
+        if kind == 'array':
+            item = self._type(schema.get('items', {}), hint + 'Item')
+            return _Type(f'List<{item.kotlin}>', f'List<{item.java}>')
+        if kind == 'string':
+            return _Type('String', 'String')
+        if kind == 'integer':
+            return _Type('Long', 'Long') if schema.get('format') == 'int64' else _Type('Int', 'Integer')
+        if kind == 'number':
+            return _Type('Float', 'Float') if schema.get('format') == 'float' else _Type('Double', 'Double')
+        if kind == 'boolean':
+            return _Type('Boolean', 'Boolean')
+        if 'properties' in schema or 'allOf' in schema:
+            return self._model(schema, hint)
+        additional = schema.get('additionalProperties')
+        if isinstance(additional, dict) and additional:
+            value = self._type(additional, hint + 'Value')
+            return _Type(f'Map<String, {value.kotlin}>', f'Map<String, {value.java}>')
+        return self._free_form()
+
+    def _model(self, schema: dict, hint: str) -> _Type:
+        name = _unique(_pascal(hint), self._model_names)
+        model_type = self._schema_types[id(schema)] = _Type(name, name)
+        parts = schema.get('allOf', [])
+        parts = [schema] + [self.spec.resolve(part) for part in parts] if isinstance(parts, list) else None
+        if parts is None or not all(isinstance(part, dict) for part in parts):
+            raise ValueError(f"Schema of model {name}: allOf must be an array of objects")
+        properties, required = {}, set()
+        for part in parts:
+            names = part.get('required', [])
+            if not isinstance(part.get('properties', {}), dict) or not isinstance(names, list) or \
+                    not all(isinstance(json_name, str) for json_name in names):
+                raise ValueError(f"Schema of model {name}: properties must be an object and required an array of names")
+            properties.update(part.get('properties', {}))
+            required.update(names)
+        used = set()
+        self.models[name] = ()  # Reserved before the properties so self-references terminate
+        self.models[name] = tuple(
+            _Property(json_name, _unique(_camel(json_name), used), self._type(prop, name + _pascal(json_name)),
+                      json_name in required and not (isinstance(prop, dict) and prop.get('nullable')))
+            for json_name, prop in properties.items()
+        )
+        return model_type
+
+    # Operations
+
+    def _json_content(self, content, *parts) -> Tuple[Optional[dict], bool]:
+        """(schema, is JSON) of the preferred media type of a content map"""
+        if not isinstance(content, dict):
+            raise ValueError(f"Expected an object at {_pointer(*parts)}")
+        media = {
+            media_type: self.spec.resolve_object(value, *parts, media_type) for media_type, value in content.items()
+        }
+        for media_type, value in media.items():
+            if 'json' in media_type:
+                return value.get('schema', {}), True
+        return (None, False) if not media else (next(iter(media.values())).get('schema', {}), False)
+
+    def _operation(self, path: str, method: str, operation: dict, parameters: List[dict], used: set) -> _Operation:
+        name = str(operation.get('operationId') or method + ' ' + path)
+        name = _unique(_camel(name), used)
+        hint = _pascal(name)
+
+        names = set()
+        params = []
+        for parameter in parameters:
+            location = parameter['in']
+            if location not in ('path', 'query', 'header'):
+                continue
+            params.append(_Parameter(
+                location, parameter['name'], _unique(_camel(parameter['name']), names),
+                self._type(parameter.get('schema', {}), hint + _pascal(parameter['name'])),
+                location == 'path' or bool(parameter.get('required')),
+            ))
+
+        body, body_is_json = None, False
+        if operation.get('requestBody') is not None:
+            request = self.spec.resolve_object(operation['requestBody'], 'paths', path, method, 'requestBody')
+            if request.get('content'):
+                schema, body_is_json = self._json_content(
+                    request['content'], 'paths', path, method, 'requestBody', 'content',
+                )
+                if body_is_json and self.typed:
+                    body = self._type(schema, hint + 'Request')
+                else:
+                    body = _Type('ByteArray', 'RequestBody') if self.ktor else _Type('RequestBody', 'RequestBody')
+
+        response = None
+        responses = operation.get('responses', {})
+        if not isinstance(responses, dict):
+            raise ValueError(f"Expected an object at {_pointer('paths', path, method, 'responses')}")
+        code = next((code for code in sorted(responses, key=str) if str(code).startswith('2')), None)
+        code = code if code is not None else 'default'
+        if responses.get(code) is not None:
+            chosen = self.spec.resolve_object(responses[code], 'paths', path, method, 'responses', code)
+            if chosen.get('content'):
+                schema, is_json = self._json_content(
+                    chosen['content'], 'paths', path, method, 'responses', code, 'content',
+                )
+                if is_json and self.typed:
+                    response = self._type(schema, hint + 'Response')
+                elif self.ktor:
+                    response = _Type('HttpResponse', 'HttpResponse')
+                else:
+                    response = _Type('ResponseBody', 'ResponseBody')
+
+        return _Operation(method, path.lstrip('/'), name, tuple(params), body, body_is_json, response)
+
+    def services(self) -> Dict[str, List[_Operation]]:
+        """Operations grouped into one service per first tag, in document order"""
+        services: Dict[str, List[_Operation]] = {}
+        used: Dict[str, set] = {}
+        for path, method, operation, parameters in self.spec.operations():
+            tags = operation.get('tags') or ['Default']
+            service = _pascal(str(tags[0])) + 'Api'
+            services.setdefault(service, []).append(
+                self._operation(path, method, operation, parameters, used.setdefault(service, set()))
+            )
+        return services
+
+    # Sources
+
+    def files(self) -> Dict[str, str]:
+        """Source files relative to the data.remote package directory"""
+        extension = 'kt' if self.kotlin else 'java'
+        flavour = 'ktor' if self.ktor else extension
+        env = template_environment(self.config)
+        files = {f'ApiClient.{extension}': env.get_template(f'api_client_{flavour}.j2').render(client=self._client())}
+        service_template = env.get_template(f'api_service_{flavour}.j2')
+        for name, operations in self.services().items():
+            files[f'api/{name}.{extension}'] = service_template.render(service=self._service(name, operations))
+        model_template = env.get_template(f'api_model_{extension}.j2')
+        for name, properties in self.models.items():
+            files[f'model/{name}.{extension}'] = model_template.render(model=self._model_context(name, properties))
+        return files
+
+    def _language_type(self, value: _Type) -> str:
+        return value.kotlin if self.kotlin else value.java
+
+    def _literal(self, text: str) -> str:
+        return _string_literal(text, self.kotlin)
+
+    def _uses_models(self, operations: List[_Operation]) -> bool:
+        types = [op.body for op in operations] + [op.response for op in operations]
+        types += [param.type for op in operations for param in op.parameters]
+        return any(t is not None and not self.models.keys().isdisjoint(_WORD.findall(t.kotlin)) for t in types)
+
+    def _json_imports(self, types: List[str]) -> List[str]:
+        if not any('JsonElement' in t for t in types):
+            return []
+        if self.serialization == SerializationLib.kotlinx:
+            return ['kotlinx.serialization.json.JsonElement']
+        return ['com.google.gson.JsonElement']
+
+    def _collection_imports(self, types: List[str]) -> List[str]:
+        """java.util imports a Java source needs for the given types"""
+        if self.kotlin:
+            return []
+        return [module for module, used in (('java.util.List', 'List<'), ('java.util.Map', 'Map<'))
+                if any(used in t for t in types)]
+
+    def _model_context(self, name: str, properties: Tuple[_Property, ...]) -> ModelContext:
+        annotation, imports = {
+            SerializationLib.gson: ('@SerializedName({})', ['com.google.gson.annotations.SerializedName']),
+            SerializationLib.moshi: ('@Json(name = {})', ['com.squareup.moshi.Json']),
+            SerializationLib.kotlinx: ('@SerialName({})', [
+                'kotlinx.serialization.SerialName', 'kotlinx.serialization.Serializable',
+            ]),
+        }[self.serialization]
+        types = [self._language_type(prop.type) for prop in properties]
+        return ModelContext(
+            package=self.package,
+            name=name,
+            imports=tuple(sorted(imports + self._json_imports(types) + self._collection_imports(types))),
+            serializable=self.serialization == SerializationLib.kotlinx,
+            properties=tuple(
+                PropertyContext(
+                    name=prop.name,
+                    annotation=annotation.format(self._literal(prop.json_name)),
+                    type=self._language_type(prop.type) + ('' if prop.required or not self.kotlin else '? = null'),
+                )
+                for prop in properties
+            ),
+        )
+
+    def _service_imports(self, operations: List[_Operation]) -> List[str]:
+        types = [self._language_type(t) for op in operations for t in (op.body, op.response) if t is not None]
+        parameter_types = [self._language_type(p.type) for op in operations for p in op.parameters]
+        if self.ktor:
+            imports = ['io.ktor.client.HttpClient', 'io.ktor.client.request.*']
+            if any(op.body is not None for op in operations):
+                imports += ['io.ktor.http.ContentType', 'io.ktor.http.contentType']
+            if any(param.location == 'path' for op in operations for param in op.parameters):
+                imports.append('io.ktor.http.encodeURLPathPart')
+            if self._uses_models(operations) or any(op.response and op.response.kotlin != 'HttpResponse'
+                                                     for op in operations):
+                imports.append('io.ktor.client.call.body')
+            if 'HttpResponse' in types:
+                imports.append('io.ktor.client.statement.HttpResponse')
+        else:
+            imports = ['retrofit2.http.*'] if self.kotlin else ['retrofit2.Call', 'retrofit2.http.*']
+            imports += [f'okhttp3.{name}' for name in ('RequestBody', 'ResponseBody') if name in types]
+        if self._uses_models(operations):
+            imports.append(f'{self.package}.model.*')
+        imports += self._json_imports(types + parameter_types) + self._collection_imports(types + parameter_types)
+        return sorted(set(imports))
+
+    def _path(self, op: _Operation) -> str:
+        """String literal of the operation path; Ktor interpolates the encoded path parameters into it"""
+        if not self.ktor:
+            return self._literal(op.path)
+        by_name = {param.json_name: param for param in op.parameters if param.location == 'path'}
+        parts, last = [], 0
+        for match in _PATH_PARAMETER.finditer(op.path):
+            if match.group(1) in by_name:
+                # Only the text around the parameters is escaped; the interpolations are generated code
+                parts.append(self._literal(op.path[last:match.start()])[1:-1])
+                parts.append('${' + by_name[match.group(1)].name + '.toString().encodeURLPathPart()}')
+                last = match.end()
+        parts.append(self._literal(op.path[last:])[1:-1])
+        return '"' + ''.join(parts) + '"'
+
+    def _service(self, name: str, operations: List[_Operation]) -> ServiceContext:
+        return ServiceContext(
+            package=self.package,
+            name=name,
+            imports=tuple(self._service_imports(operations)),
+            operations=tuple(
+                OperationContext(
+                    name=op.name,
+                    method=op.method,
+                    path=self._path(op),
+                    parameters=tuple(
+                        ParameterContext(
+                            location=param.location,
+                            literal=self._literal(param.json_name),
+                            name=param.name,
+                            type=self._language_type(param.type)
+                            + ('' if param.required or not self.kotlin else '? = null'),
+                        )
+                        for param in op.parameters
+                    ),
+                    body=self._language_type(op.body) if op.body is not None else None,
+                    body_is_json=op.body_is_json,
+                    response=self._language_type(op.response) if op.response is not None else None,
+                )
+                for op in operations
+            ),
+        )
+
+    def _client(self) -> ClientContext:
+        if self.ktor:
+            imports, converter = self._ktor_negotiation()
+            imports += [
+                'io.ktor.client.HttpClient', 'io.ktor.client.plugins.defaultRequest',
+                'io.ktor.client.plugins.logging.LogLevel', 'io.ktor.client.plugins.logging.Logging',
+            ]
+            if not self.injected:
+                imports += ['io.ktor.client.engine.okhttp.OkHttp']
+        else:
+            imports, converter = self._retrofit_converter()
+            imports += ['okhttp3.OkHttpClient', 'okhttp3.logging.HttpLoggingInterceptor', 'retrofit2.Retrofit']
+        if not self.injected:
+            imports += ['android.content.Context', 'java.io.File', 'java.util.concurrent.TimeUnit', 'okhttp3.Cache',
+                        'okhttp3.ConnectionPool', 'okhttp3.OkHttpClient']
+        return ClientContext(
+            package=self.package,
+            imports=tuple(sorted(set(imports))),
+            base_url=self._literal(self.spec.base_url),
+            cache_bytes=HTTP_CACHE_BYTES,
+            converter=converter,
+            injected=self.injected,
+        )
+
+    def _retrofit_converter(self) -> Tuple[List[str], Optional[str]]:
+        """(imports, converter factory expression) for the project's serialization library"""
+        if not self.typed:
+            return [], None
+        if self.serialization == SerializationLib.gson:
+            return ['retrofit2.converter.gson.GsonConverterFactory'], 'GsonConverterFactory.create()'
+        if self.serialization == SerializationLib.moshi:
+            if not self.kotlin:
+                return ['retrofit2.converter.moshi.MoshiConverterFactory'], 'MoshiConverterFactory.create()'
+            return [
+                'com.squareup.moshi.Moshi', 'com.squareup.moshi.kotlin.reflect.KotlinJsonAdapterFactory',
+                'retrofit2.converter.moshi.MoshiConverterFactory',
+            ], 'MoshiConverterFactory.create(Moshi.Builder().add(KotlinJsonAdapterFactory()).build())'
+        return [
+            'com.jakewharton.retrofit2.converter.kotlinx.serialization.asConverterFactory',
+            'kotlinx.serialization.json.Json', 'okhttp3.MediaType.Companion.toMediaType',
+        ], 'Json { ignoreUnknownKeys = true }.asConverterFactory("application/json".toMediaType())'
+
+    def _ktor_negotiation(self) -> Tuple[List[str], Optional[str]]:
+        """(imports, ContentNegotiation converter call) for the project's serialization library"""
+        if not self.typed:
+            return [], None
+        imports = ['io.ktor.client.plugins.contentnegotiation.ContentNegotiation']
+        if self.serialization == SerializationLib.kotlinx:
+            imports += ['io.ktor.serialization.kotlinx.json.json', 'kotlinx.serialization.json.Json']
+            return imports, 'json(Json { ignoreUnknownKeys = true })'
+        return imports + ['io.ktor.serialization.gson.gson'], 'gson()'
+
+
+def apply_api(entries: Dict[str, ZipEntry], source_dir: str, spec: ApiSpec, config: ProjectConfig):
+    """Add the API layer generated from spec to the project entries, under <package>.data.remote of source_dir"""
+    remote_dir = f'{source_dir}/{ProjectUtils.package_to_path(config.project.package)}/data/remote'
+    for path, source in ApiGenerator(spec, config).files().items():
+        name = f'{remote_dir}/{path}'
+        entries[name] = ZipEntry.from_bytes(name, source.encode('utf-8'))
@@ -0,0 +1,236 @@
+import math
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+from models.naming import HEX_COLOR
+
+# Tone-based color engine in the spirit of Material 3 HCT. Tone is CIE L* exactly as in HCT;
+# hue and chroma are measured in CIELAB LCh instead of CAM16, which keeps the math dependency
+# free and is close enough for deriving tonal palettes from a seed.
+
+# sRGB (D65) <-> XYZ
+_RGB_TO_XYZ = (
+    (0.41233895, 0.35762064, 0.18051042),
+    (0.2126, 0.7152, 0.0722),
+    (0.01932141, 0.11916382, 0.95034478),
+)
+_XYZ_TO_RGB = (
+    (3.2413774792388685, -1.5376652402851851, -0.49885366846268053),
+    (-0.9691452513005321, 1.8758853451067872, 0.04156585616912061),
+    (0.05562093689691305, -0.20395524564742123, 1.0571799111220335),
+)
+_WHITE = (95.047, 100.0, 108.883)
+
+_EPSILON = 216 / 24389
+_KAPPA = 24389 / 27
+
+# Material baseline error color
+ERROR_SEED = '#B3261E'
+
+
+def parse_hex(color: str) -> Tuple[int, int, int]:
+    """Parse #RRGGBB or #AARRGGBB (alpha ignored) into an RGB triple"""
+    match = HEX_COLOR.match(color or '')
+    if match is None:
+        raise ValueError(f"Invalid theme color {color!r}; expected #RRGGBB")
+    value = int(match.group(1), 16)
+    return value >> 16 & 0xFF, value >> 8 & 0xFF, value & 0xFF
+
+
+def _linearize(channel: int) -> float:
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _delinearize(c: float) -> float:
+    return 12.92 * c if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def _lab_f(t: float) -> float:
+    return t ** (1 / 3) if t > _EPSILON else (_KAPPA * t + 16) / 116
+
+
+def _lab_f_inv(ft: float) -> float:
+    cube = ft ** 3
+    return cube if cube > _EPSILON else (116 * ft - 16) / _KAPPA
+
+
+def rgb_to_lch(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    """Convert an sRGB triple to CIELAB (L*, chroma, hue in degrees)"""
+    linear = [_linearize(c) * 100 for c in rgb]
+    fx, fy, fz = (
+        _lab_f(sum(m * c for m, c in zip(row, linear)) / white)
+        for row, white in zip(_RGB_TO_XYZ, _WHITE)
+    )
+    a, b = 500 * (fx - fy), 200 * (fy - fz)
+    return 116 * fy - 16, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360
+
+
+def _lch_to_linear(tone: float, chroma: float, hue: float) -> Tuple[float, float, float]:
+    radians = math.radians(hue)
+    fy = (tone + 16) / 116
+    fx = fy + chroma * math.cos(radians) / 500
+    fz = fy - chroma * math.sin(radians) / 200
+    xyz = (_lab_f_inv(fx) * _WHITE[0], _lab_f_inv(fy) * _WHITE[1], _lab_f_inv(fz) * _WHITE[2])
+    return tuple(sum(m * c for m, c in zip(row, xyz)) / 100 for row in _XYZ_TO_RGB)
+
+
+def _in_gamut(linear: Tuple[float, float, float]) -> bool:
+    return all(-1e-7 <= c <= 1 + 1e-7 for c in linear)
+
+
+def lch_to_hex(tone: float, chroma: float, hue: float) -> str:
+    """Return the sRGB color with the given tone and hue, reducing chroma until it is in gamut"""
+    if tone <= 0:
+        return '#000000'
+    if tone >= 100:
+        return '#FFFFFF'
+    linear = _lch_to_linear(tone, chroma, hue)
+    if not _in_gamut(linear):
+        low, high = 0.0, chroma
+        linear = _lch_to_linear(tone, 0.0, hue)
+        for _ in range(16):
+            middle = (low + high) / 2
+            candidate = _lch_to_linear(tone, middle, hue)
+            if _in_gamut(candidate):
+                low, linear = middle, candidate
+            else:
+                high = middle
+    r, g, b = (round(_delinearize(min(1.0, max(0.0, c))) * 255) for c in linear)
+    return f'#{r:02X}{g:02X}{b:02X}'
+
+
+class TonalPalette:
+    """Colors of one hue and chroma across the tone range 0-100"""
+
+    TONES = (0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99, 100)
+
+    __slots__ = ('hue', 'chroma', 'tones')
+
+    def __init__(self, hue: float, chroma: float):
+        self.hue = hue
+        self.chroma = chroma
+        # Every tone a scheme needs is computed up front, once per palette
+        self.tones: Dict[int, str] = {tone: lch_to_hex(tone, chroma, hue) for tone in self.TONES}
+
+    def tone(self, tone: int) -> str:
+        return self.tones[tone] if tone in self.tones else lch_to_hex(tone, self.chroma, self.hue)
+
+
+@lru_cache(maxsize=512)
+def tonal_palette(seed: str, min_chroma: float = 0.0, max_chroma: float = None) -> TonalPalette:
+    """Return the palette for a seed color, clamping its chroma to the given range"""
+    _, chroma, hue = rgb_to_lch(parse_hex(seed))
+    chroma = max(chroma, min_chroma)
+    if max_chroma is not None:
+        chroma = min(chroma, max_chroma)
+    return TonalPalette(hue, chroma)
+
+
+def argb_literal(color: str) -> str:
+    """0xAARRGGBB literal of a #RRGGBB or #AARRGGBB color, with alpha FF when it has none"""
+    digits = color[1:]
+    return '0x' + (digits if len(digits) == 8 else 'FF' + digits)
+
+
+class SchemeColor(NamedTuple):
+    """One color role of a scheme, with the spellings the templates use"""
+    role: str  # Compose ColorScheme parameter, e.g. primaryContainer
+    name: str  # PascalCase, for Kotlin declarations
+    resource: str  # snake_case, for XML color resources
+    hex: str  # #RRGGBB
+    argb: str  # 0xFFRRGGBB
+    legacy: bool = False  # MaterialComponents-only role, not part of the Material 3 scheme
+
+    @classmethod
+    def of(cls, role: str, hex_value: str, legacy: bool = False) -> 'SchemeColor':
+        return cls(
+            role=role,
+            name=role[0].upper() + role[1:],
+            resource=re.sub(r'([A-Z])', r'_\1', role).lower(),
+            hex=hex_value,
+            argb=argb_literal(hex_value),
+            legacy=legacy,
+        )
+
+
+# (role, palette, light tone, dark tone)
+SCHEME_ROLES = (
+    ('primary', 'primary', 40, 80),
+    ('onPrimary', 'primary', 100, 20),
+    ('primaryContainer', 'primary', 90, 30),
+    ('onPrimaryContainer', 'primary', 10, 90),
+    ('inversePrimary', 'primary', 80, 40),
+    ('secondary', 'secondary', 40, 80),
+    ('onSecondary', 'secondary', 100, 20),
+    ('secondaryContainer', 'secondary', 90, 30),
+    ('onSecondaryContainer', 'secondary', 10, 90),
+    ('tertiary', 'tertiary', 40, 80),
+    ('onTertiary', 'tertiary', 100, 20),
+    ('tertiaryContainer', 'tertiary', 90, 30),
+    ('onTertiaryContainer', 'tertiary', 10, 90),
+    ('background', 'neutral', 99, 10),
+    ('onBackground', 'neutral', 10, 90),
+    ('surface', 'neutral', 99, 10),
+    ('onSurface', 'neutral', 10, 90),
+    ('surfaceVariant', 'neutral_variant', 90, 30),
+    ('onSurfaceVariant', 'neutral_variant', 30, 80),
+    ('surfaceTint', 'primary', 40, 80),
+    ('inverseSurface', 'neutral', 20, 90),
+    ('inverseOnSurface', 'neutral', 95, 20),
+    ('error', 'error', 40, 80),
+    ('onError', 'error', 100, 20),
+    ('errorContainer', 'error', 90, 30),
+    ('onErrorContainer', 'error', 10, 90),
+    ('outline', 'neutral_variant', 50, 60),
+    ('outlineVariant', 'neutral_variant', 80, 30),
+    ('scrim', 'neutral', 0, 0),
+)
+
+# Extra roles for MaterialComponents (Material 2) XML themes
+LEGACY_ROLES = (
+    ('primaryVariant', 'primary', 30, 30),
+    ('secondaryVariant', 'secondary', 30, 30),
+)
+
+
+class ColorScheme(NamedTuple):
+    """Light and dark schemes, each a tuple of SchemeColor in SCHEME_ROLES + LEGACY_ROLES order"""
+    light: Tuple[SchemeColor, ...]
+    dark: Tuple[SchemeColor, ...]
+
+    def colors(self) -> Tuple[SchemeColor, ...]:
+        return self.light + self.dark
+
+
+@lru_cache(maxsize=256)
+def color_scheme(primary: str, secondary: str, tertiary: str) -> ColorScheme:
+    """Derive complete light and dark Material 3 schemes from the three seed colors"""
+    palettes = {
+        'primary': tonal_palette(primary, min_chroma=48),
+        'secondary': tonal_palette(secondary),
+        'tertiary': tonal_palette(tertiary),
+        'neutral': tonal_palette(primary, max_chroma=4),
+        'neutral_variant': tonal_palette(primary, max_chroma=8),
+        'error': tonal_palette(ERROR_SEED),
+    }
+    light, dark = [], []
+    for roles, legacy in ((SCHEME_ROLES, False), (LEGACY_ROLES, True)):
+        for role, palette, light_tone, dark_tone in roles:
+            light.append(SchemeColor.of(role, palettes[palette].tone(light_tone), legacy))
+            dark.append(SchemeColor.of(role, palettes[palette].tone(dark_tone), legacy))
+    return ColorScheme(tuple(light), tuple(dark))
+
+
+def placeholder_scheme(prefix: str) -> ColorScheme:
+    """Scheme whose every color is a unique non-hex token, used to render templates without real colors"""
+    width = len(str(2 * (len(SCHEME_ROLES) + len(LEGACY_ROLES))))
+    schemes = ([], [])
+    index = 0
+    for roles, legacy in ((SCHEME_ROLES, False), (LEGACY_ROLES, True)):
+        for role, *_ in roles:
+            for scheme in schemes:
+                scheme.append(SchemeColor.of(role, f'#{prefix}{index:0{width}d}', legacy))
+                index += 1
+    return ColorScheme(tuple(schemes[0]), tuple(schemes[1]))
@@ -0,0 +1,195 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.config_model import ProjectConfig
+from .cache import ArtifactCache
+
+
+class PopularitySketch:
+    """Count-min sketch of config keys plus a bounded table of the most frequent configs"""
+
+    VERSION = 1
+
+    def __init__(self, width: int = 2048, depth: int = 4, top_k: int = 32):
+        self.width = width
+        self.depth = depth
+        self.top_k = top_k
+        self.total = 0
+        self._rows = [array('I', bytes(4 * width)) for _ in range(depth)]
+        # key -> config dict for the current heavy hitters; size never exceeds top_k
+        self._top: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _indexes(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [int.from_bytes(digest[i * 4:i * 4 + 4], 'little') % self.width for i in range(self.depth)]
+
+    def _estimate(self, indexes: List[int]) -> int:
+        return min(row[i] for row, i in zip(self._rows, indexes))
+
+    def estimate(self, key: str) -> int:
+        """Return the (over-)estimated number of times key was recorded"""
+        with self._lock:
+            return self._estimate(self._indexes(key))
+
+    def record(self, key: str, config: dict):
+        """Count one request for key and keep its config if it is among the top_k"""
+        indexes = self._indexes(key)
+        with self._lock:
+            for row, i in zip(self._rows, indexes):
+                if row[i] < 0xFFFFFFFF:
+                    row[i] += 1
+            self.total += 1
+
+            if key in self._top or len(self._top) < self.top_k:
+                self._top[key] = config
+                return
+
+            count = self._estimate(indexes)
+            weakest = min(self._top, key=lambda k: self._estimate(self._indexes(k)))
+            if count > self._estimate(self._indexes(weakest)):
+                del self._top[weakest]
+                self._top[key] = config
+
+    def top(self, n: int) -> List[Tuple[str, dict, int]]:
+        """Return up to n (key, config, count) tuples, most popular first"""
+        with self._lock:
+            ranked = [(key, config, self._estimate(self._indexes(key))) for key, config in self._top.items()]
+        ranked.sort(key=lambda item: item[2], reverse=True)
+        return ranked[:n]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'version': self.VERSION,
+                'width': self.width,
+                'depth': self.depth,
+                'top_k': self.top_k,
+                'total': self.total,
+                'rows': [base64.b64encode(row.tobytes()).decode('ascii') for row in self._rows],
+                'top': self._top.copy(),
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PopularitySketch':
+        sketch = cls(width=data['width'], depth=data['depth'], top_k=data['top_k'])
+        sketch.total = data['total']
+        for row, encoded in zip(sketch._rows, data['rows']):
+            row[:] = array('I', base64.b64decode(encoded))
+        sketch._top = dict(data['top'])
+        return sketch
+
+    def save(self, path: str):
+        """Atomically persist the sketch to path"""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, **defaults) -> 'PopularitySketch':
+        """Load a persisted sketch, falling back to an empty one if missing or unreadable"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == cls.VERSION:
+                return cls.from_dict(data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading popularity sketch: {str(e)}")
+        return cls(**defaults)
+
+
+class PopularityTracker:
+    """Records requests into a PopularitySketch and persists it periodically from a background thread"""
+
+    def __init__(self, path: str, persist_interval: float = 60.0, **sketch_options):
+        self.path = path
+        self.persist_interval = persist_interval
+        self.sketch = PopularitySketch.load(path, **sketch_options)
+        self._last_persist = time.monotonic()
+        # Serializes saves, which share one temporary file
+        self._persist_lock = threading.Lock()
+
+    def record(self, key: str, config: ProjectConfig):
+        self.sketch.record(key, config.model_dump(mode='json'))
+        if time.monotonic() - self._last_persist >= self.persist_interval:
+            # Called on the event loop; serializing the sketch and writing the file must not hold up requests
+            self._last_persist = time.monotonic()
+            threading.Thread(target=self.persist, name='popularity-persist', daemon=True).start()
+
+    def persist(self):
+        """Save the sketch now, blocking until it is written"""
+        with self._persist_lock:
+            self._last_persist = time.monotonic()
+            try:
+                self.sketch.save(self.path)
+            except Exception as e:
+                print(f"Error persisting popularity sketch: {str(e)}")
+
+
+class CachePrewarmer:
+    """
+    Prebuilds the most popular configurations into the artifact cache in a background thread,
+    after running the optional warm_up callable
+    """
+
+    def __init__(self, tracker: PopularityTracker, cache: ArtifactCache,
+                 build: Callable[[ProjectConfig], bytes], top_n: int = 8,
+                 warm_up: Optional[Callable[[], None]] = None):
+        self.tracker = tracker
+        self.cache = cache
+        self.build = build
+        self.top_n = top_n
+        self.warm_up = warm_up
+        self.state = 'idle'
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start prewarming without blocking the caller"""
+        if self._thread is not None:
+            return
+        if self.top_n <= 0 and self.warm_up is None:
+            self.state = 'done'
+            return
+        self._thread = threading.Thread(target=self._run, name='cache-prewarm', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        self.state = 'running'
+        if self.warm_up is not None:
+            try:
+                self.warm_up()
+            except Exception as e:
+                print(f"Error warming up: {str(e)}")
+        candidates = self.tracker.sketch.top(self.top_n) if self.top_n > 0 else []
+        self.total = len(candidates)
+        for key, config_dict, _ in candidates:
+            if key in self.cache:
+                self.completed += 1
+                continue
+            try:
+                self.cache.put(key, self.build(ProjectConfig(**config_dict)))
+                self.completed += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"Error prewarming {key}: {str(e)}")
+        self.state = 'done'
+
+    def status(self) -> dict:
+        return {
+            'state': self.state,
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+        }
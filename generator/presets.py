@@ -0,0 +1,141 @@
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models.config_model import ProjectConfig
+from .archive import ZipEntry, write_zip
+from .builder import AndroidProjectBuilder
+from .cache import ArtifactCache
+from .config_key import config_key
+from .fonts import zip_entry
+from .icons import launcher_icon_entries
+from .utils import ProjectUtils
+
+PRESETS_FILE = Path(__file__).parent / 'presets.json'
+
+PACKAGE_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*(\.[a-zA-Z][a-zA-Z0-9_]*)+$')
+
+
+class PresetRegistry:
+    """Named starter configurations whose archives are built once and served from memory"""
+
+    def __init__(self, path: Path = PRESETS_FILE, cache: Optional[ArtifactCache] = None):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.presets: Dict[str, Tuple[str, ProjectConfig]] = {
+            name: (entry.get('description', ''), ProjectConfig(**entry['config']))
+            for name, entry in data.items()
+        }
+        self.cache = cache if cache is not None else ArtifactCache(max_bytes=64 * 1024 * 1024)
+        # name -> [(compressed entry, decoded text or None for binary files)]
+        self._bases: Dict[str, List[Tuple[ZipEntry, Optional[str]]]] = {}
+        self._archives: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def list(self) -> List[dict]:
+        """Return a summary of every preset"""
+        return [
+            {
+                'name': name,
+                'description': description,
+                'project': config.project.model_dump(),
+                'configuration': config.configuration.model_dump(mode='json'),
+            }
+            for name, (description, config) in self.presets.items()
+        ]
+
+    def get(self, name: str) -> ProjectConfig:
+        """Return the preset configuration, raising KeyError for unknown names"""
+        return self.presets[name][1]
+
+    def warm(self):
+        """Build every preset's base archive, loading the template registry on the way"""
+        for name in self.presets:
+            self._base_archive(name)
+
+    def archive(self, name: str, project_name: Optional[str] = None,
+                package: Optional[str] = None) -> Tuple[ProjectConfig, bytes]:
+        """Return the (possibly overridden) config and ZIP archive bytes for a preset"""
+        config = self.get(name)
+        overridden = self.with_overrides(config, project_name, package)
+        if overridden is config:
+            return config, self._base_archive(name)
+
+        key = f'preset:{name}:{config_key(overridden)}'
+        archive = self.cache.get(key)
+        if archive is None:
+            archive = self._rewrite(name, config, overridden)
+            self.cache.put(key, archive)
+        return overridden, archive
+
+    @staticmethod
+    def with_overrides(config: ProjectConfig, project_name: Optional[str], package: Optional[str]) -> ProjectConfig:
+        """Return config with the project name and/or package replaced"""
+        project_name = project_name or config.project.name
+        package = package or config.project.package
+        if project_name == config.project.name and package == config.project.package:
+            return config
+
+        if not ProjectUtils.sanitize_project_name(project_name):
+            raise ValueError(f"Invalid project name: {project_name!r}")
+        if not PACKAGE_PATTERN.match(package):
+            raise ValueError(f"Invalid package name: {package!r}")
+
+        return config.model_copy(update={
+            'project': config.project.model_copy(update={'name': project_name, 'package': package}),
+            'configuration': config.configuration.model_copy(update={'projectName': project_name, 'projectId': package}),
+        })
+
+    def _base_entries(self, name: str) -> List[Tuple[ZipEntry, Optional[str]]]:
+        with self._lock:
+            entries = self._bases.get(name)
+            if entries is None:
+                # Launcher icons are drawn from the project name, so they are added per archive instead
+                files = AndroidProjectBuilder(self.get(name), launcher_icons=False).render_files()
+                entries = []
+                for path, data in files.items():
+                    try:
+                        text = data.decode('utf-8')
+                    except UnicodeDecodeError:
+                        text = None
+                    entries.append((zip_entry(path, data), text))
+                self._bases[name] = entries
+            return entries
+
+    def _base_archive(self, name: str) -> bytes:
+        archive = self._archives.get(name)
+        if archive is None:
+            archive = write_zip(self._with_icons([entry for entry, _ in self._base_entries(name)], self.get(name)))
+            self._archives[name] = archive
+        return archive
+
+    def _rewrite(self, name: str, old: ProjectConfig, new: ProjectConfig) -> bytes:
+        """Rename and patch only the entries that mention the preset's name or package"""
+        replacements = {}
+        for before, after in zip(ProjectUtils.free_form_values(old), ProjectUtils.free_form_values(new)):
+            if replacements.setdefault(before, after) != after:
+                # Two derived spellings coincide for the preset but not for the override,
+                # so a text substitution would be ambiguous
+                return AndroidProjectBuilder(new).build_bytes()
+        replacements = {before: after for before, after in replacements.items() if before != after}
+        pattern = re.compile('|'.join(re.escape(token) for token in sorted(replacements, key=len, reverse=True)))
+
+        def substitute(text: str) -> str:
+            return pattern.sub(lambda match: replacements[match.group(0)], text)
+
+        entries = []
+        for entry, text in self._base_entries(name):
+            path = substitute(entry.name)
+            if text is not None and pattern.search(text):
+                entries.append(ZipEntry.from_bytes(path, substitute(text).encode('utf-8')))
+            elif path != entry.name:
+                entries.append(entry.renamed(path))
+            else:
+                entries.append(entry)
+        return write_zip(self._with_icons(entries, new))
+
+    @staticmethod
+    def _with_icons(entries: List[ZipEntry], config: ProjectConfig) -> List[ZipEntry]:
+        return entries + list(launcher_icon_entries(config.project.name, config.configuration.themeColors.primary))
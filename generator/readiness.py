@@ -0,0 +1,110 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple
+
+
+class BuildTracker:
+    """
+    Counts expensive requests in flight and the archive builds among them, and keeps the p95 of the
+    most recent build latencies no older than max_age seconds, so an idle instance recovers from a slow
+    spell. Counters change with each request or build; the p95 is recomputed when a build finishes or its
+    oldest sample expires, so reading it is a few attribute lookups.
+    """
+
+    def __init__(self, window: int = 256, max_age: float = 300.0):
+        self.in_flight = 0
+        self.building = 0
+        self.max_age = max_age
+        self._p95 = 0.0
+        self._expires = math.inf  # when the oldest sample leaves the window
+        # (finish time, latency), oldest first
+        self._latencies: "deque[Tuple[float, float]]" = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted requests that are not building yet (waiting on the event loop or their upload)"""
+        return max(0, self.in_flight - self.building)
+
+    @property
+    def p95(self) -> float:
+        """p95 build latency in seconds over the window, 0 without recent builds"""
+        if time.monotonic() >= self._expires:
+            with self._lock:
+                self._update(time.monotonic())
+        return self._p95
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @contextmanager
+    def build(self):
+        """Track one archive build"""
+        with self._lock:
+            self.building += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.building -= 1
+                now = time.monotonic()
+                self._latencies.append((now, elapsed))
+                self._update(now)
+
+    def _update(self, now: float):
+        """Drop samples older than max_age and recompute the p95; the lock must be held"""
+        latencies = self._latencies
+        if self.max_age > 0:
+            while latencies and latencies[0][0] <= now - self.max_age:
+                latencies.popleft()
+        ordered = sorted(latency for _, latency in latencies)
+        self._p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        self._expires = latencies[0][0] + self.max_age if latencies and self.max_age > 0 else math.inf
+
+    def stats(self) -> dict:
+        return {
+            'in_flight': self.in_flight,
+            'building': self.building,
+            'queue_depth': self.queue_depth,
+            'p95_build_ms': round(self.p95 * 1000, 1),
+        }
+
+
+class ReadinessCheck:
+    """Decides whether an instance should receive traffic, from its load and warm-up state"""
+
+    def __init__(self, tracker: BuildTracker, max_in_flight: int = 16, max_queue_depth: int = 8,
+                 max_p95: float = 5.0, checks: Optional[Dict[str, Callable[[], bool]]] = None,
+                 info: Optional[Dict[str, Callable[[], object]]] = None):
+        self.tracker = tracker
+        self.max_in_flight = max_in_flight
+        self.max_queue_depth = max_queue_depth
+        self.max_p95 = max_p95
+        # name -> callable that is true once that part of the instance is warm
+        self.checks = checks or {}
+        # name -> callable reported alongside the checks without affecting readiness
+        self.info = info or {}
+
+    def status(self) -> dict:
+        """Load and warm-up figures, whether the instance is ready and, if not, which limits it is past"""
+        tracker = self.tracker
+        warm = {name: check() for name, check in self.checks.items()}
+        reasons = [name for name, ok in warm.items() if not ok]
+        if self.max_in_flight > 0 and tracker.in_flight > self.max_in_flight:
+            reasons.append('in_flight')
+        if self.max_queue_depth > 0 and tracker.queue_depth > self.max_queue_depth:
+            reasons.append('queue_depth')
+        if self.max_p95 > 0 and tracker.p95 > self.max_p95:
+            reasons.append('p95_build_latency')
+        info = {name: value() for name, value in self.info.items()}
+        return {'ready': not reasons, 'reasons': reasons, **tracker.stats(), **warm, **info}
@@ -0,0 +1,279 @@
+import hashlib
+import json
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Tuple
+
+from models.enums import ColumnType
+from models.naming import property_name, table_name
+
+if TYPE_CHECKING:
+    from models.config_model import RoomEntity, RoomSchema
+
+# (Kotlin type, Java type, Java type when nullable, SQLite affinity)
+_TYPES: Dict[ColumnType, Tuple[str, str, str, str]] = {
+    ColumnType.integer: ('Int', 'int', 'Integer', 'INTEGER'),
+    ColumnType.long: ('Long', 'long', 'Long', 'INTEGER'),
+    ColumnType.real: ('Float', 'float', 'Float', 'REAL'),
+    ColumnType.double: ('Double', 'double', 'Double', 'REAL'),
+    ColumnType.boolean: ('Boolean', 'boolean', 'Boolean', 'INTEGER'),
+    ColumnType.text: ('String', 'String', 'String', 'TEXT'),
+    ColumnType.blob: ('ByteArray', 'byte[]', 'byte[]', 'BLOB'),
+}
+# Java reference types that Room treats as nullable unless annotated
+_JAVA_REFERENCE_TYPES = ('String', 'byte[]')
+
+
+def _pascal(name: str) -> str:
+    return name[0].upper() + name[1:]
+
+
+class ColumnContext(NamedTuple):
+    """One column of an entity with its types in both languages"""
+    name: str
+    property: str
+    kotlin_type: str  # with ? when nullable
+    java_type: str  # boxed when nullable
+    param_kotlin_type: str  # non-null, for query parameters
+    param_java_type: str
+    affinity: str
+    not_null: bool
+    java_non_null: bool  # needs @NonNull
+    primary_key: bool
+    auto_generate: bool
+    kotlin_default: str  # e.g. " = 0" for auto-generated keys
+
+
+class IndexContext(NamedTuple):
+    name: str
+    columns: Tuple[str, ...]
+    literal: str  # "a", "b"
+    unique: bool
+
+
+class ForeignKeyContext(NamedTuple):
+    parent_class: str
+    parent_table: str
+    parent_column: str
+    column: str
+    on_delete: str  # ForeignKey constant name
+    on_update: str
+
+
+class QueryContext(NamedTuple):
+    """A DAO lookup by the columns of the primary key or of an index"""
+    method: str
+    where: str
+    kotlin_params: str
+    java_params: str
+    unique: bool
+
+
+class EntityContext(NamedTuple):
+    class_name: str
+    dao_name: str
+    dao_accessor: str
+    table: str
+    columns: Tuple[ColumnContext, ...]
+    primary_key_literal: str  # "a", "b"
+    single_key: bool  # annotated with @PrimaryKey instead of primaryKeys
+    indices: Tuple[IndexContext, ...]
+    foreign_keys: Tuple[ForeignKeyContext, ...]
+    key_query: QueryContext
+    queries: Tuple[QueryContext, ...]
+    java_non_null: bool  # imports androidx.annotation.NonNull
+
+
+class DatabaseContext(NamedTuple):
+    class_name: str
+    package: str  # <package>.data.local; entities and DAOs live in its entity and dao subpackages
+    package_path: str
+    file_name: str
+    version: int
+    entities: Tuple[EntityContext, ...]
+
+
+def _column(column) -> ColumnContext:
+    kotlin_type, java_type, java_boxed, affinity = _TYPES[column.type]
+    if column.autoGenerate:
+        default = ' = 0L' if column.type == ColumnType.long else ' = 0'
+    else:
+        default = ' = null' if column.nullable else ''
+    return ColumnContext(
+        name=column.name,
+        property=property_name(column.name),
+        kotlin_type=kotlin_type + '?' if column.nullable else kotlin_type,
+        java_type=java_boxed if column.nullable else java_type,
+        param_kotlin_type=kotlin_type,
+        param_java_type=java_type,
+        affinity=affinity,
+        not_null=not column.nullable,
+        java_non_null=not column.nullable and java_type in _JAVA_REFERENCE_TYPES,
+        primary_key=column.primaryKey,
+        auto_generate=column.autoGenerate,
+        kotlin_default=default,
+    )
+
+
+def _query(prefix: str, columns: List[ColumnContext], unique: bool) -> QueryContext:
+    return QueryContext(
+        method=prefix + 'And'.join(_pascal(column.property) for column in columns),
+        where=' AND '.join(f'`{column.name}` = :{column.property}' for column in columns),
+        kotlin_params=', '.join(f'{column.property}: {column.param_kotlin_type}' for column in columns),
+        java_params=', '.join(f'{column.param_java_type} {column.property}' for column in columns),
+        unique=unique,
+    )
+
+
+def _literal(names) -> str:
+    return ', '.join(f'"{name}"' for name in names)
+
+
+def _entity(entity: 'RoomEntity', tables: Dict[str, str]) -> EntityContext:
+    table = tables[entity.name]
+    columns = tuple(_column(column) for column in entity.columns)
+    by_name = {column.name: column for column in columns}
+    keys = [column for column in columns if column.primary_key]
+    key_names = tuple(column.name for column in keys)
+
+    indices = [(tuple(index.columns), index.unique) for index in entity.indices]
+    # SQLite scans the whole child table on every parent update or delete unless the reference is indexed
+    for relation in entity.relations:
+        if not any(columns_[0] == relation.column for columns_, _ in indices) and key_names[0] != relation.column:
+            indices.append(((relation.column,), False))
+
+    queries, seen = [], {key_names}
+    for index_columns, unique in indices:
+        if index_columns not in seen:
+            seen.add(index_columns)
+            queries.append(_query('findBy', [by_name[name] for name in index_columns], unique))
+
+    return EntityContext(
+        class_name=entity.name,
+        dao_name=f'{entity.name}Dao',
+        dao_accessor=f'{entity.name[0].lower()}{entity.name[1:]}Dao',
+        table=table,
+        columns=columns,
+        primary_key_literal=_literal(key_names),
+        single_key=len(keys) == 1,
+        indices=tuple(
+            IndexContext(f"index_{table}_{'_'.join(index_columns)}", index_columns, _literal(index_columns), unique)
+            for index_columns, unique in indices
+        ),
+        foreign_keys=tuple(
+            ForeignKeyContext(
+                parent_class=relation.entity,
+                parent_table=tables[relation.entity],
+                parent_column=relation.parentColumn,
+                column=relation.column,
+                on_delete=relation.onDelete.value,
+                on_update=relation.onUpdate.value,
+            )
+            for relation in entity.relations
+        ),
+        key_query=_query('getBy', keys, True),
+        queries=tuple(queries),
+        java_non_null=any(column.java_non_null for column in columns),
+    )
+
+
+def database_context(schema: 'RoomSchema', package: str) -> DatabaseContext:
+    """Flatten a validated Room schema into per-entity contexts, in one pass over the entities"""
+    tables = {entity.name: table_name(entity.name, entity.tableName) for entity in schema.entities}
+    database_package = f'{package}.data.local'
+    return DatabaseContext(
+        class_name=schema.databaseName,
+        package=database_package,
+        package_path=database_package.replace('.', '/'),
+        file_name=table_name(schema.databaseName) + '.db',
+        version=schema.version,
+        entities=tuple(_entity(entity, tables) for entity in schema.entities),
+    )
+
+
+def _create_table_sql(entity: EntityContext) -> str:
+    definitions = []
+    for column in entity.columns:
+        if column.auto_generate:
+            definitions.append(f'`{column.name}` {column.affinity} PRIMARY KEY AUTOINCREMENT NOT NULL')
+        else:
+            definitions.append(f'`{column.name}` {column.affinity}' + (' NOT NULL' if column.not_null else ''))
+    if not any(column.auto_generate for column in entity.columns):
+        keys = ', '.join(f'`{column.name}`' for column in entity.columns if column.primary_key)
+        definitions.append(f'PRIMARY KEY({keys})')
+    for key in entity.foreign_keys:
+        definitions.append(
+            f'FOREIGN KEY(`{key.column}`) REFERENCES `{key.parent_table}`(`{key.parent_column}`) '
+            f'ON UPDATE {key.on_update.replace("_", " ")} ON DELETE {key.on_delete.replace("_", " ")} '
+        )
+    return f"CREATE TABLE IF NOT EXISTS `${{TABLE_NAME}}` ({', '.join(definitions)})"
+
+
+def _create_index_sql(index: IndexContext) -> str:
+    unique = 'UNIQUE ' if index.unique else ''
+    columns = ', '.join(f'`{column}`' for column in index.columns)
+    return f'CREATE {unique}INDEX IF NOT EXISTS `${{INDEX_NAME}}` ON `${{TABLE_NAME}}` ({columns})'
+
+
+def _dump(value, indent: str = '') -> str:
+    """json.dumps(value, indent=2) for the plain values of a schema, without the pure-Python encoder's overhead"""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if not value:
+        return '{}' if isinstance(value, dict) else '[]'
+    inner = indent + '  '
+    if isinstance(value, dict):
+        items = [f'{inner}{encode_basestring_ascii(key)}: {_dump(item, inner)}' for key, item in value.items()]
+        return '{\n' + ',\n'.join(items) + '\n' + indent + '}'
+    return '[\n' + ',\n'.join(inner + _dump(item, inner) for item in value) + '\n' + indent + ']'
+
+
+def schema_json(database: DatabaseContext) -> str:
+    """
+    Exported schema in Room's format (app/schemas/<database class>/<version>.json). The identity hash is
+    derived from the table definitions; Room re-exports the file with its own hash on the first build.
+    """
+    entities = []
+    for entity in database.entities:
+        auto_generate = any(column.auto_generate for column in entity.columns)
+        entities.append({
+            'tableName': entity.table,
+            'createSql': _create_table_sql(entity),
+            'fields': [
+                {'fieldPath': column.property, 'columnName': column.name, 'affinity': column.affinity,
+                 'notNull': column.not_null}
+                for column in entity.columns
+            ],
+            'primaryKey': {
+                'autoGenerate': auto_generate,
+                'columnNames': [column.name for column in entity.columns if column.primary_key],
+            },
+            'indices': [
+                {'name': index.name, 'unique': index.unique, 'columnNames': list(index.columns), 'orders': [],
+                 'createSql': _create_index_sql(index)}
+                for index in entity.indices
+            ],
+            'foreignKeys': [
+                {'table': key.parent_table, 'onDelete': key.on_delete.replace('_', ' '),
+                 'onUpdate': key.on_update.replace('_', ' '), 'columns': [key.column],
+                 'referencedColumns': [key.parent_column]}
+                for key in entity.foreign_keys
+            ],
+        })
+    identity = hashlib.md5(json.dumps(entities, sort_keys=True).encode('utf-8')).hexdigest()
+    return _dump({
+        'formatVersion': 1,
+        'database': {
+            'version': database.version,
+            'identityHash': identity,
+            'entities': entities,
+            'views': [],
+            'setupQueries': [
+                'CREATE TABLE IF NOT EXISTS room_master_table (id INTEGER PRIMARY KEY,identity_hash TEXT)',
+                f"INSERT OR REPLACE INTO room_master_table (id,identity_hash) VALUES(42, '{identity}')",
+            ],
+        },
+    })
@@ -0,0 +1,302 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from models.config_model import ProjectConfig
+from .archive import ArchiveFormat, ZipEntry, ZipFormat, ZipLayer, write_zip
+from .builder import AndroidProjectBuilder
+from .config_key import ConfigKey
+from .context import RenderContext
+from .fonts import zip_entry
+from .i18n import TranslationSet, apply_translations
+from .openapi import ApiSpec, apply_api
+from .icons import launcher_icon_entries
+from .palette import placeholder_scheme
+from .utils import ProjectUtils
+
+# Placeholder values rendered in place of the free-form config fields. Every derived
+# spelling (see ProjectUtils.free_form_values) contains "zxq" in some case, so any
+# spelling the engine does not know about is detected after rendering.
+SENTINEL_NAME = 'Zxq Name-Zxq!'
+SENTINEL_PROJECT_NAME = 'Zxq Title-Zxq!'
+SENTINEL_PACKAGE = 'zxq.pkg.zxq'
+SENTINEL_PROJECT_ID = 'zxq.appid.zxq'
+SENTINEL_COLORS = ('#ZXQ001', '#ZXQ002', '#ZXQ003')
+SENTINEL_LANGUAGE = 'zxqlang'
+# Derived scheme colors cannot be computed from the sentinel seeds, so each role gets its own token
+SENTINEL_SCHEME = placeholder_scheme('ZXQS')
+
+_MARKER = re.compile('zxq', re.IGNORECASE)
+
+
+def _manifest_item(path: str, data: bytes) -> Dict[str, object]:
+    return {'path': path, 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+
+class Skeleton:
+    """Project files pre-rendered for one enum combination with free-form values left as sentinels"""
+
+    __slots__ = ('entries',)
+
+    def __init__(self, entries: List[Tuple[str, object, Tuple[str, ...], bool]]):
+        # (path, constant ZipEntry or template text, sentinel forms in the text, per language)
+        self.entries = entries
+
+
+class SkeletonEngine:
+    """Renders projects by patching cached skeletons instead of running Jinja per request"""
+
+    def __init__(self, max_skeletons: int = 64, max_layers: int = 32):
+        self.max_skeletons = max_skeletons
+        self.max_layers = max_layers
+        self._skeletons: "OrderedDict[ConfigKey, Optional[Skeleton]]" = OrderedDict()
+        # Serialized constant entries per (skeleton, patched constant paths); the paths carry the project
+        # directory and languages, which are the only inputs besides the skeleton that change those bytes
+        self._layers: "OrderedDict[Tuple[Skeleton, Tuple[str, ...]], ZipLayer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sentinel_forms: List[str] = []
+        self._pattern: Optional[re.Pattern] = None
+
+    @staticmethod
+    def sentinel_config(config: ProjectConfig) -> ProjectConfig:
+        """Return config with every free-form value replaced by its sentinel"""
+        configuration = config.configuration
+        return config.model_copy(update={
+            'project': config.project.model_copy(update={'name': SENTINEL_NAME, 'package': SENTINEL_PACKAGE}),
+            'configuration': configuration.model_copy(update={
+                'projectName': SENTINEL_PROJECT_NAME,
+                'projectId': SENTINEL_PROJECT_ID,
+                'themeColors': configuration.themeColors.model_copy(update={
+                    'primary': SENTINEL_COLORS[0],
+                    'secondary': SENTINEL_COLORS[1],
+                    'tertiary': SENTINEL_COLORS[2],
+                }),
+                'internationalization': configuration.internationalization.model_copy(update={
+                    'languages': [SENTINEL_LANGUAGE],
+                }),
+            }),
+            'generated_at': None,
+            'generator_version': None,
+        })
+
+    def render_files(self, config: ProjectConfig, translations: Optional[TranslationSet] = None,
+                     api: Optional[ApiSpec] = None) -> Dict[str, bytes]:
+        """Render every project file in memory, keyed by archive path"""
+        return {entry.name: entry.data() for entry in self.render_entries(config, translations, api)}
+
+    def build_bytes(self, config: ProjectConfig, archive_format: Optional[ArchiveFormat] = None,
+                    translations: Optional[TranslationSet] = None, api: Optional[ApiSpec] = None) -> bytes:
+        """
+        Build the project archive, compressing only the entries that contain free-form values. Default ZIPs
+        start with a cached layer of the skeleton's constant entries, so only the rest is serialized.
+        """
+        archive_format = archive_format or ZipFormat()
+        skeleton, entries, constant = self._render(config, translations, api)
+        if skeleton is None or not constant or not archive_format.is_default:
+            return archive_format.write(entries.values())
+        layer = self._get_layer(skeleton, constant, entries)
+        return write_zip((entry for path, entry in entries.items() if path not in layer.names), base=layer)
+
+    def render_entries(self, config: ProjectConfig, translations: Optional[TranslationSet] = None,
+                       api: Optional[ApiSpec] = None) -> List[ZipEntry]:
+        return list(self._render(config, translations, api)[1].values())
+
+    def layer_stats(self) -> Dict[str, int]:
+        """Number and total size of the cached base layers"""
+        with self._lock:
+            return {'layers': len(self._layers), 'bytes': sum(layer.nbytes for layer in self._layers.values())}
+
+    def _render(self, config: ProjectConfig, translations: Optional[TranslationSet],
+                api: Optional[ApiSpec]) -> Tuple[Optional[Skeleton], Dict[str, ZipEntry], Tuple[str, ...]]:
+        """Return the skeleton used (if any), every entry by path and the paths of unpatched skeleton entries"""
+        skeleton, replacements, languages = self._prepare(config)
+        # Files with the same content (e.g. untranslated locales) are patched and compressed once
+        shared: Dict[int, ZipEntry] = {}
+        entries: Dict[str, ZipEntry] = {}
+        # Skeleton entries without free-form values, as added before the uploads can replace any of them
+        constant: Dict[str, ZipEntry] = {}
+
+        if skeleton is None:
+            for path, data in AndroidProjectBuilder(config).render_files().items():
+                entry = shared.get(id(data))
+                if entry is None:
+                    entry = shared[id(data)] = zip_entry(path, data)
+                entries[path] = entry if entry.name == path else entry.renamed(path)
+        else:
+            for path, data, sentinels in self._walk(skeleton, replacements, languages):
+                if sentinels:
+                    entry = shared.get(id(data))
+                    if entry is None or SENTINEL_LANGUAGE in sentinels:
+                        entry = shared[id(data)] = ZipEntry.from_bytes(
+                            path, self._substitute(data, replacements).encode('utf-8'),
+                        )
+                    entries[path] = entry if entry.name == path else entry.renamed(path)
+                else:
+                    entries[path] = constant[path] = data if path == data.name else data.renamed(path)
+
+            for entry in launcher_icon_entries(config.project.name, config.configuration.themeColors.primary):
+                entries[entry.name] = entry
+
+        project_dir = ProjectUtils.sanitize_project_name(config.project.name)
+        if translations is not None:
+            apply_translations(entries, f'{project_dir}/app/src/main/res', translations)
+        if api is not None:
+            language = config.configuration.language.value
+            apply_api(entries, f'{project_dir}/app/src/main/{language}', api, config)
+        # Mapped entries (bundled fonts) are appended per archive from the shared store rather than copied into layers
+        return skeleton, entries, tuple(
+            path for path, entry in constant.items() if entries[path] is entry and not entry.mapped
+        )
+
+    def render_file(self, config: ProjectConfig, path: str) -> bytes:
+        """
+        Render one project file, patching only that skeleton entry. The path may be given with or
+        without the project directory prefix; KeyError if the project has no such file.
+        """
+        prefix = f'{ProjectUtils.sanitize_project_name(config.project.name)}/'
+        if not path.startswith(prefix):
+            path = prefix + path
+        skeleton, replacements, languages = self._prepare(config)
+        if skeleton is None:
+            return AndroidProjectBuilder(config).render_file(path)
+
+        for entry in launcher_icon_entries(config.project.name, config.configuration.themeColors.primary):
+            if entry.name == path:
+                return entry.data()
+        for patched_path, data, sentinels in self._walk(skeleton, replacements, languages):
+            if patched_path == path:
+                return self._substitute(data, replacements).encode('utf-8') if sentinels else data.data()
+        raise KeyError(path)
+
+    def manifest(self, config: ProjectConfig) -> List[Dict[str, object]]:
+        """Path, size and SHA-256 of every file the config produces, without compressing anything"""
+        skeleton, replacements, languages = self._prepare(config)
+        if skeleton is None:
+            return [
+                _manifest_item(path, data) for path, data in AndroidProjectBuilder(config).render_files().items()
+            ]
+
+        items: Dict[str, Dict[str, object]] = {}
+        for path, data, sentinels in self._walk(skeleton, replacements, languages):
+            if sentinels:
+                items[path] = _manifest_item(path, self._substitute(data, replacements).encode('utf-8'))
+            else:
+                items[path] = {'path': path, 'size': data.size, 'sha256': data.sha256()}
+
+        for entry in launcher_icon_entries(config.project.name, config.configuration.themeColors.primary):
+            items[entry.name] = {'path': entry.name, 'size': entry.size, 'sha256': entry.sha256()}
+        return list(items.values())
+
+    def file_sources(self, config: ProjectConfig) -> Dict[str, Tuple[Hashable, Callable[[], bytes]]]:
+        """
+        Map every file the config produces to (input key, render callable) without rendering it.
+        Files with equal input keys have equal content; unequal keys only mean the content may differ.
+        """
+        skeleton, replacements, languages = self._prepare(config)
+        if skeleton is None:
+            files = AndroidProjectBuilder(config).render_files()
+            return {
+                path: (hashlib.sha256(data).hexdigest(), lambda data=data: data) for path, data in files.items()
+            }
+
+        sources: Dict[str, Tuple[Hashable, Callable[[], bytes]]] = {}
+        for path, data, sentinels in self._walk(skeleton, replacements, languages):
+            if sentinels:
+                # Only the values the template uses, so e.g. a new color does not mark every file as changed
+                values = {form: replacements[form] for form in sentinels}
+                sources[path] = (
+                    (data, tuple(values.values())),
+                    lambda data=data, values=values: self._substitute(data, values).encode('utf-8'),
+                )
+            else:
+                sources[path] = (data.sha256(), data.data)
+
+        for entry in launcher_icon_entries(config.project.name, config.configuration.themeColors.primary):
+            sources[entry.name] = (entry.sha256(), entry.data)
+        return sources
+
+    def _prepare(self, config: ProjectConfig) -> Tuple[Optional[Skeleton], Dict[str, str], List[str]]:
+        """Return the config's skeleton (None if it cannot be used), sentinel replacements and extra languages"""
+        values = ProjectUtils.free_form_values(config)
+        sentinel_config = self.sentinel_config(config)
+        if self._pattern is None:
+            # The sentinel spellings are the same for every config, so compile them once
+            self._sentinel_forms = ProjectUtils.free_form_values(sentinel_config, SENTINEL_SCHEME) + [SENTINEL_LANGUAGE]
+            self._pattern = re.compile('|'.join(
+                re.escape(form) for form in sorted(set(self._sentinel_forms), key=len, reverse=True)
+            ))
+        skeleton = self._get_skeleton(sentinel_config) if all(values) else None
+        replacements = dict(zip(self._sentinel_forms, values))
+        languages = [lang for lang in sorted(set(config.configuration.internationalization.languages)) if lang != 'en']
+        return skeleton, replacements, languages
+
+    def _walk(self, skeleton: Skeleton, replacements: Dict[str, str],
+              languages: List[str]) -> Iterator[Tuple[str, object, Tuple[str, ...]]]:
+        """
+        Yield (patched path, skeleton data, sentinel forms in the data), with replacements set to the entry's
+        language; the forms are found once, when the skeleton is rendered
+        """
+        for path, data, sentinels, per_language in skeleton.entries:
+            for lang in (languages if per_language else [None]):
+                if lang is not None:
+                    replacements[SENTINEL_LANGUAGE] = lang
+                yield self._substitute(path, replacements), data, sentinels
+
+    def _substitute(self, text: str, replacements: Dict[str, str]) -> str:
+        return self._pattern.sub(lambda match: replacements[match.group(0)], text)
+
+    def _get_layer(self, skeleton: Skeleton, constant: Tuple[str, ...], entries: Dict[str, ZipEntry]) -> ZipLayer:
+        key = (skeleton, constant)
+        with self._lock:
+            layer = self._layers.get(key)
+            if layer is not None:
+                self._layers.move_to_end(key)
+                return layer
+
+        layer = ZipLayer.build(entries[path] for path in constant)
+        with self._lock:
+            self._layers[key] = layer
+            while len(self._layers) > self.max_layers:
+                self._layers.popitem(last=False)
+        return layer
+
+    def _get_skeleton(self, sentinel_config: ProjectConfig) -> Optional[Skeleton]:
+        key = ConfigKey(sentinel_config)
+        with self._lock:
+            if key in self._skeletons:
+                self._skeletons.move_to_end(key)
+                return self._skeletons[key]
+
+        skeleton = self._render_skeleton(sentinel_config)
+        with self._lock:
+            self._skeletons[key] = skeleton
+            while len(self._skeletons) > self.max_skeletons:
+                self._skeletons.popitem(last=False)
+        return skeleton
+
+    def _render_skeleton(self, sentinel_config: ProjectConfig) -> Optional[Skeleton]:
+        """Render the skeleton, or return None if a template derives an unknown spelling of a sentinel"""
+        # Launcher icons are rasterized from the real name and color, so they are added per request
+        files = AndroidProjectBuilder(
+            sentinel_config, RenderContext(sentinel_config, SENTINEL_SCHEME), launcher_icons=False,
+        ).render_files()
+        entries = []
+        for path, data in files.items():
+            if _MARKER.search(self._pattern.sub('', path)):
+                return None
+            per_language = SENTINEL_LANGUAGE in path
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                entries.append((path, zip_entry(path, data), (), per_language))
+                continue
+            if _MARKER.search(self._pattern.sub('', text)) or (not per_language and SENTINEL_LANGUAGE in text):
+                return None
+            sentinels = tuple(sorted(set(self._pattern.findall(text))))
+            if sentinels:
+                entries.append((path, text, sentinels, per_language))
+            else:
+                entries.append((path, ZipEntry.from_bytes(path, data), (), per_language))
+        return Skeleton(entries)
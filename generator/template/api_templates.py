@@ -0,0 +1,384 @@
+from models.config_model import ProjectConfig
+
+
+class ApiTemplates:
+    """Template handler for the HTTP client, services and models generated from an uploaded OpenAPI document"""
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_templates(self) -> dict:
+        """Return all OpenAPI templates"""
+        return {
+            'api_client_kt.j2': self._get_client_kt_template(),
+            'api_client_java.j2': self._get_client_java_template(),
+            'api_client_ktor.j2': self._get_client_ktor_template(),
+            'api_service_kt.j2': self._get_service_kt_template(),
+            'api_service_java.j2': self._get_service_java_template(),
+            'api_service_ktor.j2': self._get_service_ktor_template(),
+            'api_model_kt.j2': self._get_model_kt_template(),
+            'api_model_java.j2': self._get_model_java_template(),
+        }
+
+    def _get_client_kt_template(self):
+        return '''
+package {{ client.package }}
+{% for module in client.imports %}
+import {{ module }}
+{%- endfor %}
+{% if client.injected %}
+/**
+ * Retrofit on the application's OkHttpClient from AppModule, so every API interface shares its connection pool
+ * and disk cache. Inject the OkHttpClient and call create<T>(okHttpClient).
+ */
+{%- else %}
+/**
+ * Shared HTTP stack: one OkHttp client (connection pool, disk cache, timeouts) behind every API interface.
+ */
+{%- endif %}
+object ApiClient {
+    const val BASE_URL = {{ client.base_url }}
+{%- if not client.injected %}
+    private const val CACHE_SIZE_BYTES = {{ client.cache_bytes }}L
+{%- endif %}
+
+    @Volatile
+    private var retrofit: Retrofit? = null
+{%- if client.injected %}
+
+    fun retrofit(okHttpClient: OkHttpClient): Retrofit =
+        retrofit ?: synchronized(this) {
+            retrofit ?: Retrofit.Builder()
+                .baseUrl(BASE_URL)
+                // newBuilder() shares the connection pool, dispatcher and cache of the application's client
+                .client(
+                    okHttpClient.newBuilder()
+                        .addInterceptor(HttpLoggingInterceptor().apply { level = HttpLoggingInterceptor.Level.BASIC })
+                        .build()
+                )
+{%- if client.converter %}
+                .addConverterFactory({{ client.converter }})
+{%- endif %}
+                .build()
+                .also { retrofit = it }
+        }
+
+    inline fun <reified T> create(okHttpClient: OkHttpClient): T = retrofit(okHttpClient).create(T::class.java)
+{%- else %}
+
+    fun retrofit(context: Context): Retrofit =
+        retrofit ?: synchronized(this) {
+            retrofit ?: Retrofit.Builder()
+                .baseUrl(BASE_URL)
+                .client(okHttpClient(context))
+{%- if client.converter %}
+                .addConverterFactory({{ client.converter }})
+{%- endif %}
+                .build()
+                .also { retrofit = it }
+        }
+
+    inline fun <reified T> create(context: Context): T = retrofit(context).create(T::class.java)
+
+    private fun okHttpClient(context: Context): OkHttpClient =
+        OkHttpClient.Builder()
+            .connectionPool(ConnectionPool(5, 5, TimeUnit.MINUTES))
+            .cache(Cache(File(context.cacheDir, "http_cache"), CACHE_SIZE_BYTES))
+            .connectTimeout(15, TimeUnit.SECONDS)
+            .readTimeout(30, TimeUnit.SECONDS)
+            .writeTimeout(30, TimeUnit.SECONDS)
+            .addInterceptor(HttpLoggingInterceptor().apply { level = HttpLoggingInterceptor.Level.BASIC })
+            .build()
+{%- endif %}
+}
+'''.strip()
+
+    def _get_client_java_template(self):
+        return '''
+package {{ client.package }};
+{% for module in client.imports %}
+import {{ module }};
+{%- endfor %}
+{% if client.injected %}
+/**
+ * Retrofit on the application's OkHttpClient from AppModule, so every API interface shares its connection pool
+ * and disk cache. Inject the OkHttpClient and call create(okHttpClient, Service.class).
+ */
+{%- else %}
+/**
+ * Shared HTTP stack: one OkHttp client (connection pool, disk cache, timeouts) behind every API interface.
+ */
+{%- endif %}
+public final class ApiClient {
+
+    public static final String BASE_URL = {{ client.base_url }};
+{%- if not client.injected %}
+    private static final long CACHE_SIZE_BYTES = {{ client.cache_bytes }}L;
+{%- endif %}
+
+    private static volatile Retrofit retrofit;
+
+    private ApiClient() {
+    }
+{%- if client.injected %}
+
+    public static Retrofit retrofit(OkHttpClient okHttpClient) {
+        if (retrofit == null) {
+            synchronized (ApiClient.class) {
+                if (retrofit == null) {
+                    HttpLoggingInterceptor logging = new HttpLoggingInterceptor();
+                    logging.setLevel(HttpLoggingInterceptor.Level.BASIC);
+                    retrofit = new Retrofit.Builder()
+                            .baseUrl(BASE_URL)
+                            // newBuilder() shares the connection pool, dispatcher and cache of the application's client
+                            .client(okHttpClient.newBuilder().addInterceptor(logging).build())
+{%- if client.converter %}
+                            .addConverterFactory({{ client.converter }})
+{%- endif %}
+                            .build();
+                }
+            }
+        }
+        return retrofit;
+    }
+
+    public static <T> T create(OkHttpClient okHttpClient, Class<T> service) {
+        return retrofit(okHttpClient).create(service);
+    }
+{%- else %}
+
+    public static Retrofit retrofit(Context context) {
+        if (retrofit == null) {
+            synchronized (ApiClient.class) {
+                if (retrofit == null) {
+                    retrofit = new Retrofit.Builder()
+                            .baseUrl(BASE_URL)
+                            .client(okHttpClient(context))
+{%- if client.converter %}
+                            .addConverterFactory({{ client.converter }})
+{%- endif %}
+                            .build();
+                }
+            }
+        }
+        return retrofit;
+    }
+
+    public static <T> T create(Context context, Class<T> service) {
+        return retrofit(context).create(service);
+    }
+
+    private static OkHttpClient okHttpClient(Context context) {
+        HttpLoggingInterceptor logging = new HttpLoggingInterceptor();
+        logging.setLevel(HttpLoggingInterceptor.Level.BASIC);
+        return new OkHttpClient.Builder()
+                .connectionPool(new ConnectionPool(5, 5, TimeUnit.MINUTES))
+                .cache(new Cache(new File(context.getCacheDir(), "http_cache"), CACHE_SIZE_BYTES))
+                .connectTimeout(15, TimeUnit.SECONDS)
+                .readTimeout(30, TimeUnit.SECONDS)
+                .writeTimeout(30, TimeUnit.SECONDS)
+                .addInterceptor(logging)
+                .build();
+    }
+{%- endif %}
+}
+'''.strip()
+
+    def _get_client_ktor_template(self):
+        return '''
+package {{ client.package }}
+{% for module in client.imports %}
+import {{ module }}
+{%- endfor %}
+{% if client.injected %}
+/**
+ * The API configuration (base URL, serialization, logging) on top of the application's HttpClient from
+ * AppModule; config { } shares its OkHttp engine, connection pool and disk cache. Inject the HttpClient and
+ * pass it to httpClient(base).
+ */
+{%- else %}
+/**
+ * Shared HTTP stack: one Ktor client on an OkHttp engine (connection pool, disk cache, timeouts)
+ * behind every API class.
+ */
+{%- endif %}
+object ApiClient {
+    const val BASE_URL = {{ client.base_url }}
+{%- if not client.injected %}
+    private const val CACHE_SIZE_BYTES = {{ client.cache_bytes }}L
+{%- endif %}
+
+    @Volatile
+    private var client: HttpClient? = null
+{%- if client.injected %}
+
+    fun httpClient(base: HttpClient): HttpClient =
+        client ?: synchronized(this) {
+            client ?: base.config {
+                expectSuccess = true
+                defaultRequest {
+                    url(BASE_URL)
+                }
+{%- if client.converter %}
+                install(ContentNegotiation) {
+                    {{ client.converter }}
+                }
+{%- endif %}
+                install(Logging) {
+                    level = LogLevel.INFO
+                }
+            }.also { client = it }
+        }
+{%- else %}
+
+    fun httpClient(context: Context): HttpClient =
+        client ?: synchronized(this) {
+            client ?: create(context).also { client = it }
+        }
+
+    private fun create(context: Context): HttpClient = HttpClient(OkHttp) {
+        engine {
+            preconfigured = OkHttpClient.Builder()
+                .connectionPool(ConnectionPool(5, 5, TimeUnit.MINUTES))
+                .cache(Cache(File(context.cacheDir, "http_cache"), CACHE_SIZE_BYTES))
+                .connectTimeout(15, TimeUnit.SECONDS)
+                .readTimeout(30, TimeUnit.SECONDS)
+                .writeTimeout(30, TimeUnit.SECONDS)
+                .build()
+        }
+        expectSuccess = true
+        defaultRequest {
+            url(BASE_URL)
+        }
+{%- if client.converter %}
+        install(ContentNegotiation) {
+            {{ client.converter }}
+        }
+{%- endif %}
+        install(Logging) {
+            level = LogLevel.INFO
+        }
+    }
+{%- endif %}
+}
+'''.strip()
+
+    def _get_service_kt_template(self):
+        return '''
+package {{ service.package }}.api
+{% for module in service.imports %}
+import {{ module }}
+{%- endfor %}
+
+interface {{ service.name }} {
+{%- for op in service.operations %}
+
+    @{{ op.method | upper }}({{ op.path }})
+{%- if op.parameters or op.body %}
+    suspend fun {{ op.name }}(
+{%- for param in op.parameters %}
+        @{{ param.location | title }}({{ param.literal }}) {{ param.name }}: {{ param.type }},
+{%- endfor %}
+{%- if op.body %}
+        @Body body: {{ op.body }},
+{%- endif %}
+    ){{ ': ' + op.response if op.response }}
+{%- else %}
+    suspend fun {{ op.name }}(){{ ': ' + op.response if op.response }}
+{%- endif %}
+{%- endfor %}
+}
+'''.strip()
+
+    def _get_service_java_template(self):
+        return '''
+package {{ service.package }}.api;
+{% for module in service.imports %}
+import {{ module }};
+{%- endfor %}
+
+public interface {{ service.name }} {
+{%- for op in service.operations %}
+
+    @{{ op.method | upper }}({{ op.path }})
+    Call<{{ op.response or 'Void' }}> {{ op.name }}(
+{%- for param in op.parameters -%}
+        @{{ param.location | title }}({{ param.literal }}) {{ param.type }} {{ param.name }}{{ ', ' if not loop.last or op.body }}
+{%- endfor -%}
+{{ '@Body ' + op.body + ' body' if op.body }});
+{%- endfor %}
+}
+'''.strip()
+
+    def _get_service_ktor_template(self):
+        return '''
+package {{ service.package }}.api
+{% for module in service.imports %}
+import {{ module }}
+{%- endfor %}
+
+class {{ service.name }}(private val client: HttpClient) {
+{%- for op in service.operations %}
+{%- set block = op.body or op.parameters | rejectattr('location', 'equalto', 'path') | list %}
+
+    suspend fun {{ op.name }}(
+{%- for param in op.parameters -%}
+        {{ param.name }}: {{ param.type }}{{ ', ' if not loop.last or op.body }}
+{%- endfor -%}
+{{ 'body: ' + op.body if op.body }})
+{%- if op.response %}: {{ op.response }} ={% else %} {{ '{' }}{% endif %}
+        client.{{ op.method }}({{ op.path }}){{ ' {' if block }}
+{%- for param in op.parameters if param.location != 'path' %}
+            {{ 'parameter' if param.location == 'query' else 'header' }}({{ param.literal }}, {{ param.name }})
+{%- endfor %}
+{%- if op.body %}
+            contentType(ContentType.{{ 'Application.Json' if op.body_is_json else 'Application.OctetStream' }})
+            setBody(body)
+{%- endif %}
+{%- if block %}
+        }{{ '.body()' if op.response and op.response != 'HttpResponse' }}
+{%- else %}{{ '.body()' if op.response and op.response != 'HttpResponse' }}
+{%- endif %}
+{%- if not op.response %}
+    }
+{%- endif %}
+{%- endfor %}
+}
+'''.strip()
+
+    def _get_model_kt_template(self):
+        return '''
+package {{ model.package }}.model
+{% for module in model.imports %}
+import {{ module }}
+{%- endfor %}
+{% if model.serializable %}
+@Serializable
+{%- endif %}
+{%- if model.properties %}
+data class {{ model.name }}(
+{%- for prop in model.properties %}
+    {{ prop.annotation }}
+    val {{ prop.name }}: {{ prop.type }},
+{%- endfor %}
+)
+{%- else %}
+class {{ model.name }}
+{%- endif %}
+'''.strip()
+
+    def _get_model_java_template(self):
+        return '''
+package {{ model.package }}.model;
+{% for module in model.imports %}
+import {{ module }};
+{%- endfor %}
+
+public class {{ model.name }} {
+{%- for prop in model.properties %}
+
+    {{ prop.annotation }}
+    public {{ prop.type }} {{ prop.name }};
+{%- endfor %}
+}
+'''.strip()
@@ -0,0 +1,182 @@
+from models.config_model import ProjectConfig
+
+
+class BenchmarkTemplates:
+    """Template handler for the baseline profile / macrobenchmark test module"""
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_templates(self) -> dict:
+        """Return all benchmark module templates"""
+        return {
+            'benchmark_build_gradle.j2': self._get_build_gradle_template(),
+            'benchmark_build_gradle_kts.j2': self._get_build_gradle_kts_template(),
+            'benchmark_manifest.j2': self._get_manifest_template(),
+            'startup_benchmark_kt.j2': self._get_startup_benchmark_template(),
+            'baseline_profile_generator_kt.j2': self._get_baseline_profile_generator_template(),
+        }
+
+    def _get_build_gradle_template(self):
+        return '''
+plugins {
+{{ ctx.dependencies.benchmark_plugins|groovy_plugins }}
+}
+
+android {
+    namespace '{{ ctx.benchmark_package }}'
+    compileSdk {{ ctx.compile_sdk }}
+
+    compileOptions {
+        sourceCompatibility JavaVersion.VERSION_{{ ctx.java_version }}
+        targetCompatibility JavaVersion.VERSION_{{ ctx.java_version }}
+    }
+    kotlinOptions {
+        jvmTarget = '{{ ctx.java_version }}'
+    }
+
+    defaultConfig {
+        // Baseline profiles can only be collected on API 28+ without a rooted device
+        minSdk {{ [ctx.min_sdk, 28]|max }}
+        targetSdk {{ ctx.target_sdk }}
+
+        testInstrumentationRunner "androidx.test.runner.AndroidJUnitRunner"
+    }
+
+    targetProjectPath = ':app'
+}
+
+baselineProfile {
+    useConnectedDevices = true
+}
+
+dependencies {
+{{ ctx.dependencies.benchmark_dependencies|groovy_dependencies }}
+}
+'''.strip()
+
+    def _get_build_gradle_kts_template(self):
+        return '''
+plugins {
+{{ ctx.dependencies.benchmark_plugins|kts_plugins }}
+}
+
+android {
+    namespace = "{{ ctx.benchmark_package }}"
+    compileSdk = {{ ctx.compile_sdk }}
+
+    compileOptions {
+        sourceCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+        targetCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+    }
+    kotlinOptions {
+        jvmTarget = "{{ ctx.java_version }}"
+    }
+
+    defaultConfig {
+        // Baseline profiles can only be collected on API 28+ without a rooted device
+        minSdk = {{ [ctx.min_sdk, 28]|max }}
+        targetSdk = {{ ctx.target_sdk }}
+
+        testInstrumentationRunner = "androidx.test.runner.AndroidJUnitRunner"
+    }
+
+    targetProjectPath = ":app"
+}
+
+baselineProfile {
+    useConnectedDevices = true
+}
+
+dependencies {
+{{ ctx.dependencies.benchmark_dependencies|kts_dependencies }}
+}
+'''.strip()
+
+    def _get_manifest_template(self):
+        return '''<?xml version="1.0" encoding="utf-8"?>
+<manifest />'''
+
+    def _get_startup_benchmark_template(self):
+        return '''package {{ ctx.benchmark_package }}
+
+import androidx.benchmark.macro.BaselineProfileMode
+import androidx.benchmark.macro.CompilationMode
+import androidx.benchmark.macro.StartupMode
+import androidx.benchmark.macro.StartupTimingMetric
+import androidx.benchmark.macro.junit4.MacrobenchmarkRule
+import androidx.test.ext.junit.runners.AndroidJUnit4
+import androidx.test.filters.LargeTest
+import org.junit.Rule
+import org.junit.Test
+import org.junit.runner.RunWith
+
+/**
+ * Measures cold startup with and without the generated baseline profile.
+ *
+ * Run with `./gradlew :{{ ctx.benchmark_module }}:connectedBenchmarkReleaseAndroidTest`.
+ */
+@RunWith(AndroidJUnit4::class)
+@LargeTest
+class StartupBenchmark {
+
+    @get:Rule
+    val rule = MacrobenchmarkRule()
+
+    @Test
+    fun startupCompilationNone() = benchmark(CompilationMode.None())
+
+    @Test
+    fun startupCompilationBaselineProfiles() = benchmark(CompilationMode.Partial(BaselineProfileMode.Require))
+
+    private fun benchmark(compilationMode: CompilationMode) {
+        rule.measureRepeated(
+            packageName = "{{ ctx.package }}",
+            metrics = listOf(StartupTimingMetric()),
+            compilationMode = compilationMode,
+            startupMode = StartupMode.COLD,
+            iterations = 10,
+            setupBlock = {
+                pressHome()
+            },
+            measureBlock = {
+                startActivityAndWait()
+            }
+        )
+    }
+}'''
+
+    def _get_baseline_profile_generator_template(self):
+        return '''package {{ ctx.benchmark_package }}
+
+import androidx.benchmark.macro.junit4.BaselineProfileRule
+import androidx.test.ext.junit.runners.AndroidJUnit4
+import androidx.test.filters.LargeTest
+import org.junit.Rule
+import org.junit.Test
+import org.junit.runner.RunWith
+
+/**
+ * Generates the baseline profile for the app's startup path.
+ *
+ * Run with `./gradlew :app:generateBaselineProfile`; the profile is copied into
+ * app/src/main/generated/baselineProfiles.
+ */
+@RunWith(AndroidJUnit4::class)
+@LargeTest
+class BaselineProfileGenerator {
+
+    @get:Rule
+    val rule = BaselineProfileRule()
+
+    @Test
+    fun generate() {
+        rule.collect(
+            packageName = "{{ ctx.package }}",
+            includeInStartupProfile = true
+        ) {
+            pressHome()
+            startActivityAndWait()
+        }
+    }
+}'''
@@ -1,19 +1,16 @@
 from typing import Dict
 from models.config_model import ProjectConfig
-from models.enums import DILib, Language, UIToolkit
+from models.enums import Language, UIToolkit
 
 class CommonTemplates:
-    """Template handler for common files like MainActivity, gradle.properties, etc."""
+    """Template handler for common files like MainActivity"""
 
     def __init__(self, config: ProjectConfig):
         self.config = config
-        self.project_pascal_case = self.config.configuration.projectName.replace(' ', '')
 
     def get_templates(self) -> Dict[str, str]:
         """Return all common templates"""
-        templates = {
-            'gradle_properties.j2': self._get_gradle_properties_template(),
-        }
+        templates = {}
 
         language = self.config.configuration.language
         ui_toolkit = self.config.configuration.uiToolkit
@@ -26,13 +23,11 @@ class CommonTemplates:
         return templates
 
     def _get_main_activity_kotlin_template(self) -> str:
-        is_compose = self.config.configuration.uiToolkit == UIToolkit.compose
-        use_hilt = self.config.configuration.dependencyInjection == DILib.hilt
-
-        return f'''package {{{{ config.project.package }}}}
+        return '''package {{ ctx.package }}
 
-{f"import dagger.hilt.android.AndroidEntryPoint\n" if use_hilt else ''}import android.os.Bundle
-{'''import androidx.activity.ComponentActivity
+{% if ctx.use_hilt %}import dagger.hilt.android.AndroidEntryPoint
+{% endif %}import android.os.Bundle
+{% if ctx.is_compose %}import androidx.activity.ComponentActivity
 import androidx.activity.compose.setContent
 import androidx.compose.foundation.layout.fillMaxSize
 import androidx.compose.material3.MaterialTheme
@@ -42,13 +37,14 @@ import androidx.compose.runtime.Composable
 import androidx.compose.ui.Modifier
 import androidx.compose.ui.res.stringResource
 import androidx.compose.ui.tooling.preview.Preview
-import ''' + f"{self.config.project.package}.ui.theme.{self.project_pascal_case}Theme" if is_compose else 'import androidx.appcompat.app.AppCompatActivity'}
+import {{ ctx.package }}.ui.theme.{{ ctx.pascal_name }}Theme{% else %}import androidx.appcompat.app.AppCompatActivity{% endif %}
 
-{f"@AndroidEntryPoint\n" if use_hilt else ''}{'''class MainActivity : ComponentActivity() {
+{% if ctx.use_hilt %}@AndroidEntryPoint
+{% endif %}{% if ctx.is_compose %}class MainActivity : ComponentActivity() {
     override fun onCreate(savedInstanceState: Bundle?) {
         super.onCreate(savedInstanceState)
         setContent {
-            ''' + f"{self.project_pascal_case}Theme" + ''' {
+            {{ ctx.pascal_name }}Theme {
                 Surface(
                     modifier = Modifier.fillMaxSize(),
                     color = MaterialTheme.colorScheme.background
@@ -71,27 +67,27 @@ fun Greeting(modifier: Modifier = Modifier) {
 @Preview(showBackground = true)
 @Composable
 fun GreetingPreview() {
-    ''' + f"{self.project_pascal_case}Theme" + ''' {
+    {{ ctx.pascal_name }}Theme {
         Greeting()
     }
-}''' if is_compose else '''class MainActivity : AppCompatActivity() {
+}{% else %}class MainActivity : AppCompatActivity() {
     override fun onCreate(savedInstanceState: Bundle?) {
         super.onCreate(savedInstanceState)
         setContentView(R.layout.activity_main)
     }
-}'''}
+}{% endif %}
 '''
 
     def _get_main_activity_java_template(self) -> str:
-        use_hilt = self.config.configuration.dependencyInjection == DILib.hilt
+        return '''package {{ ctx.package }};
 
-        return '''package {{ config.project.package }};
-
-''' + ("import dagger.hilt.android.AndroidEntryPoint;\n" if use_hilt else '') + '''
+{% if ctx.use_hilt %}import dagger.hilt.android.AndroidEntryPoint;
+{% endif %}
 import android.os.Bundle;
 import androidx.appcompat.app.AppCompatActivity;
 
-''' + ("@AndroidEntryPoint\n" if use_hilt else '') + '''
+{% if ctx.use_hilt %}@AndroidEntryPoint
+{% endif %}
 public class MainActivity extends AppCompatActivity {
     @Override
     protected void onCreate(Bundle savedInstanceState) {
@@ -100,13 +96,3 @@ public class MainActivity extends AppCompatActivity {
     }
 }
 '''
-
-    def _get_gradle_properties_template(self) -> str:
-        view_binding_enabled = self.config.configuration.viewBinding
-        return f'''# Project-wide Gradle settings.
-org.gradle.jvmargs=-Xmx2048m -Dfile.encoding=UTF-8
-android.useAndroidX=true
-kotlin.code.style=official
-android.nonTransitiveRClass=true
-{'android.enableViewBinding=true' if view_binding_enabled else ''}
-'''
\ No newline at end of file
@@ -5,7 +5,6 @@ class ComposeTemplates:
 
     def __init__(self, config: ProjectConfig):
         self.config = config
-        self.project_pascal_case = self.config.project.name.replace(' ', '')
 
     def get_templates(self) -> dict:
         """Return all Compose-related templates"""
@@ -17,7 +16,7 @@ class ComposeTemplates:
 
     def _get_compose_theme_template(self) -> str:
         """Generate the main Theme.kt template"""
-        return '''package {{ config.project.package }}.ui.theme
+        return '''package {{ ctx.package }}.ui.theme
 
 import android.app.Activity
 import android.os.Build
@@ -33,7 +32,7 @@ import androidx.compose.ui.platform.LocalView
 import androidx.core.view.WindowCompat
 
 @Composable
-fun {{ config.project.name.replace(' ', '') }}Theme(
+fun {{ ctx.pascal_name }}Theme(
     darkTheme: Boolean = isSystemInDarkTheme(),
     dynamicColor: Boolean = true,
     content: @Composable () -> Unit
@@ -66,68 +65,43 @@ fun {{ config.project.name.replace(' ', '') }}Theme(
 
     def _get_color_scheme_template(self) -> str:
         """Generate the Color.kt template"""
-        return '''package {{ config.project.package }}.ui.theme
+        return '''package {{ ctx.package }}.ui.theme
 
 import androidx.compose.material3.lightColorScheme
 import androidx.compose.material3.darkColorScheme
 import androidx.compose.ui.graphics.Color
 
-// Custom theme colors
-val Primary = Color({{ config.configuration.themeColors.primary.replace('#', '0xFF') if config.configuration.themeColors.primary else '0xFF6200EE' }})
-val Secondary = Color({{ config.configuration.themeColors.secondary.replace('#', '0xFF') if config.configuration.themeColors.secondary else '0xFF03DAC6' }})
-val Tertiary = Color({{ config.configuration.themeColors.tertiary.replace('#', '0xFF') if config.configuration.themeColors.tertiary else '0xFFBB86FC' }})
+// Seed colors
+val Primary = Color({{ ctx.primary_argb }})
+val Secondary = Color({{ ctx.secondary_argb }})
+val Tertiary = Color({{ ctx.tertiary_argb }})
 
 // Light theme colors
-val LightBackground = Color(0xFFFFFBFE)
-val LightSurface = Color(0xFFFFFBFE)
-val LightOnPrimary = Color(0xFFFFFFFF)
-val LightOnSecondary = Color(0xFFFFFFFF)
-val LightOnTertiary = Color(0xFFFFFFFF)
-val LightOnBackground = Color(0xFF1C1B1F)
-val LightOnSurface = Color(0xFF1C1B1F)
+{%- for color in ctx.color_scheme.light if not color.legacy %}
+val Light{{ color.name }} = Color({{ color.argb }})
+{%- endfor %}
 
 // Dark theme colors
-val DarkPrimary = Color(0xFFD0BCFF)
-val DarkSecondary = Color(0xFFCCC2DC)
-val DarkTertiary = Color(0xFFEFB8C8)
-val DarkBackground = Color(0xFF1C1B1F)
-val DarkSurface = Color(0xFF1C1B1F)
-val DarkOnPrimary = Color(0xFF1C1B1F)
-val DarkOnSecondary = Color(0xFF1C1B1F)
-val DarkOnTertiary = Color(0xFF1C1B1F)
-val DarkOnBackground = Color(0xFFE6E1E5)
-val DarkOnSurface = Color(0xFFE6E1E5)
+{%- for color in ctx.color_scheme.dark if not color.legacy %}
+val Dark{{ color.name }} = Color({{ color.argb }})
+{%- endfor %}
 
 val LightColorScheme = lightColorScheme(
-    primary = Primary,
-    secondary = Secondary,
-    tertiary = Tertiary,
-    background = LightBackground,
-    surface = LightSurface,
-    onPrimary = LightOnPrimary,
-    onSecondary = LightOnSecondary,
-    onTertiary = LightOnTertiary,
-    onBackground = LightOnBackground,
-    onSurface = LightOnSurface,
+{%- for color in ctx.color_scheme.light if not color.legacy %}
+    {{ color.role }} = Light{{ color.name }},
+{%- endfor %}
 )
 
 val DarkColorScheme = darkColorScheme(
-    primary = DarkPrimary,
-    secondary = DarkSecondary,
-    tertiary = DarkTertiary,
-    background = DarkBackground,
-    surface = DarkSurface,
-    onPrimary = DarkOnPrimary,
-    onSecondary = DarkOnSecondary,
-    onTertiary = DarkOnTertiary,
-    onBackground = DarkOnBackground,
-    onSurface = DarkOnSurface,
+{%- for color in ctx.color_scheme.dark if not color.legacy %}
+    {{ color.role }} = Dark{{ color.name }},
+{%- endfor %}
 )
 '''
 
     def _get_typography_template(self) -> str:
         """Generate the Type.kt template"""
-        return '''package {{ config.project.package }}.ui.theme
+        return '''package {{ ctx.package }}.ui.theme
 
 import androidx.compose.material3.Typography
 import androidx.compose.ui.text.TextStyle
@@ -135,119 +109,117 @@ import androidx.compose.ui.text.font.Font
 import androidx.compose.ui.text.font.FontFamily
 import androidx.compose.ui.text.font.FontWeight
 import androidx.compose.ui.unit.sp
-import {{ config.project.package }}.R
+import {{ ctx.package }}.R
 
 // Custom font family
-val {{ config.configuration.fontName.title() }}FontFamily = FontFamily(
-    Font(R.font.{{ config.configuration.fontName.lower() }}_light, FontWeight.Light),
-    Font(R.font.{{ config.configuration.fontName.lower() }}_regular, FontWeight.Normal),
-    Font(R.font.{{ config.configuration.fontName.lower() }}_medium, FontWeight.Medium),
-    Font(R.font.{{ config.configuration.fontName.lower() }}_bold, FontWeight.Bold),
-    Font(R.font.{{ config.configuration.fontName.lower() }}_semibold, FontWeight.SemiBold)
+val {{ ctx.font_title }}FontFamily = FontFamily(
+{%- for resource, weight in ctx.font_faces %}
+    Font(R.font.{{ resource }}, FontWeight.{{ weight }}){{ ',' if not loop.last }}
+{%- endfor %}
 )
 
 // Set of Material typography styles
 val Typography = Typography(
     displayLarge = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 57.sp,
         lineHeight = 64.sp,
         letterSpacing = (-0.25).sp,
     ),
     displayMedium = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 45.sp,
         lineHeight = 52.sp,
         letterSpacing = 0.sp,
     ),
     displaySmall = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 36.sp,
         lineHeight = 44.sp,
         letterSpacing = 0.sp,
     ),
     headlineLarge = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 32.sp,
         lineHeight = 40.sp,
         letterSpacing = 0.sp,
     ),
     headlineMedium = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 28.sp,
         lineHeight = 36.sp,
         letterSpacing = 0.sp,
     ),
     headlineSmall = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 24.sp,
         lineHeight = 32.sp,
         letterSpacing = 0.sp,
     ),
     titleLarge = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 22.sp,
         lineHeight = 28.sp,
         letterSpacing = 0.sp,
     ),
     titleMedium = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Medium,
         fontSize = 16.sp,
         lineHeight = 24.sp,
         letterSpacing = 0.15.sp,
     ),
     titleSmall = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Medium,
         fontSize = 14.sp,
         lineHeight = 20.sp,
         letterSpacing = 0.1.sp,
     ),
     bodyLarge = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 16.sp,
         lineHeight = 24.sp,
         letterSpacing = 0.5.sp,
     ),
     bodyMedium = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 14.sp,
         lineHeight = 20.sp,
         letterSpacing = 0.25.sp,
     ),
     bodySmall = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Normal,
         fontSize = 12.sp,
         lineHeight = 16.sp,
         letterSpacing = 0.4.sp,
     ),
     labelLarge = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Medium,
         fontSize = 14.sp,
         lineHeight = 20.sp,
         letterSpacing = 0.1.sp,
     ),
     labelMedium = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Medium,
         fontSize = 12.sp,
         lineHeight = 16.sp,
         letterSpacing = 0.5.sp,
     ),
     labelSmall = TextStyle(
-        fontFamily = {{ config.configuration.fontName.title() }}FontFamily,
+        fontFamily = {{ ctx.font_title }}FontFamily,
         fontWeight = FontWeight.Medium,
         fontSize = 11.sp,
         lineHeight = 16.sp,
@@ -0,0 +1,230 @@
+from models.config_model import ProjectConfig
+
+
+class ModuleTemplates:
+    """Template handler for library modules of the module graph and their build-logic convention plugins"""
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_templates(self) -> dict:
+        """Return all library module and build-logic templates"""
+        return {
+            'module_build_gradle.j2': self._get_build_gradle_template(),
+            'module_build_gradle_kts.j2': self._get_build_gradle_kts_template(),
+            'module_manifest.j2': self._get_manifest_template(),
+            'module_source_kt.j2': self._get_source_kt_template(),
+            'module_source_java.j2': self._get_source_java_template(),
+            'build_logic_settings_gradle_kts.j2': self._get_build_logic_settings_template(),
+            'build_logic_build_gradle_kts.j2': self._get_build_logic_build_gradle_template(),
+            'android_library_convention_kt.j2': self._get_android_library_convention_template(),
+            'jvm_library_convention_kt.j2': self._get_jvm_library_convention_template(),
+        }
+
+    def _get_build_gradle_template(self):
+        return '''
+plugins {
+    id '{{ module.convention }}'
+}
+{%- if module.is_android %}
+
+android {
+    namespace '{{ module.namespace }}'
+}
+{%- endif %}
+{%- if module.dependencies %}
+
+dependencies {
+{%- for dependency in module.dependencies %}
+    implementation project('{{ dependency }}')
+{%- endfor %}
+}
+{%- endif %}
+'''.strip()
+
+    def _get_build_gradle_kts_template(self):
+        return '''
+plugins {
+    id("{{ module.convention }}")
+}
+{%- if module.is_android %}
+
+android {
+    namespace = "{{ module.namespace }}"
+}
+{%- endif %}
+{%- if module.dependencies %}
+
+dependencies {
+{%- for dependency in module.dependencies %}
+    implementation(project("{{ dependency }}"))
+{%- endfor %}
+}
+{%- endif %}
+'''.strip()
+
+    def _get_manifest_template(self):
+        return '''
+<?xml version="1.0" encoding="utf-8"?>
+<manifest xmlns:android="http://schemas.android.com/apk/res/android" />
+'''.strip()
+
+    def _get_source_kt_template(self):
+        return '''
+package {{ module.namespace }}
+
+/**
+ * Entry point of the {{ module.path }} module.
+ */
+object {{ module.class_name }}
+'''.strip()
+
+    def _get_source_java_template(self):
+        return '''
+package {{ module.namespace }};
+
+/**
+ * Entry point of the {{ module.path }} module.
+ */
+public final class {{ module.class_name }} {
+
+    private {{ module.class_name }}() {
+    }
+}
+'''.strip()
+
+    def _get_build_logic_settings_template(self):
+        return '''
+dependencyResolutionManagement {
+    repositories {
+        google()
+        mavenCentral()
+    }
+}
+
+rootProject.name = "build-logic"
+include(":convention")
+'''.strip()
+
+    def _get_build_logic_build_gradle_template(self):
+        return '''
+plugins {
+    `kotlin-dsl`
+}
+
+// The Android Gradle Plugin needs JDK 17 to run, so the convention plugins can target it
+java {
+    sourceCompatibility = JavaVersion.VERSION_17
+    targetCompatibility = JavaVersion.VERSION_17
+}
+{%- if ctx.dependencies.build_logic_dependencies %}
+
+dependencies {
+{{ ctx.dependencies.build_logic_dependencies|kts_coordinates }}
+}
+{%- endif %}
+
+gradlePlugin {
+    plugins {
+{%- if ctx.has_android_modules %}
+        register("androidLibrary") {
+            id = "{{ android_convention }}"
+            implementationClass = "AndroidLibraryConventionPlugin"
+        }
+{%- endif %}
+{%- if ctx.has_jvm_modules %}
+        register("jvmLibrary") {
+            id = "{{ jvm_convention }}"
+            implementationClass = "JvmLibraryConventionPlugin"
+        }
+{%- endif %}
+    }
+}
+'''.strip()
+
+    def _get_android_library_convention_template(self):
+        return '''
+import com.android.build.gradle.LibraryExtension
+import org.gradle.api.JavaVersion
+import org.gradle.api.Plugin
+import org.gradle.api.Project
+import org.gradle.kotlin.dsl.configure
+{%- if ctx.is_kotlin %}
+import org.gradle.kotlin.dsl.withType
+import org.jetbrains.kotlin.gradle.tasks.KotlinCompile
+{%- endif %}
+
+class AndroidLibraryConventionPlugin : Plugin<Project> {
+    override fun apply(target: Project) {
+        with(target) {
+            with(pluginManager) {
+                apply("com.android.library")
+{%- if ctx.is_kotlin %}
+                apply("org.jetbrains.kotlin.android")
+{%- endif %}
+            }
+
+            extensions.configure<LibraryExtension> {
+                compileSdk = {{ ctx.compile_sdk }}
+
+                defaultConfig {
+                    minSdk = {{ ctx.min_sdk }}
+                    testInstrumentationRunner = "androidx.test.runner.AndroidJUnitRunner"
+                }
+
+                compileOptions {
+                    sourceCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+                    targetCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+                }
+            }
+{%- if ctx.is_kotlin %}
+
+            tasks.withType<KotlinCompile>().configureEach {
+                kotlinOptions {
+                    jvmTarget = "{{ ctx.java_version }}"
+                }
+            }
+{%- endif %}
+        }
+    }
+}
+'''.strip()
+
+    def _get_jvm_library_convention_template(self):
+        return '''
+import org.gradle.api.JavaVersion
+import org.gradle.api.Plugin
+import org.gradle.api.Project
+import org.gradle.api.plugins.JavaPluginExtension
+import org.gradle.kotlin.dsl.configure
+{%- if ctx.is_kotlin %}
+import org.gradle.kotlin.dsl.withType
+import org.jetbrains.kotlin.gradle.tasks.KotlinCompile
+{%- endif %}
+
+class JvmLibraryConventionPlugin : Plugin<Project> {
+    override fun apply(target: Project) {
+        with(target) {
+            with(pluginManager) {
+                apply("java-library")
+{%- if ctx.is_kotlin %}
+                apply("org.jetbrains.kotlin.jvm")
+{%- endif %}
+            }
+
+            extensions.configure<JavaPluginExtension> {
+                sourceCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+                targetCompatibility = JavaVersion.VERSION_{{ ctx.java_version }}
+            }
+{%- if ctx.is_kotlin %}
+
+            tasks.withType<KotlinCompile>().configureEach {
+                kotlinOptions {
+                    jvmTarget = "{{ ctx.java_version }}"
+                }
+            }
+{%- endif %}
+        }
+    }
+}
+'''.strip()
@@ -0,0 +1,149 @@
+from functools import lru_cache
+from models.config_model import ProjectConfig
+from models.enums import DILib, NetworkingLib, SerializationLib
+
+
+class ProguardTemplates:
+    """Builds proguard-rules.pro from per-library keep rule fragments"""
+
+    HEADER = '''# Add project specific ProGuard rules here.
+# You can control the set of applied configuration files using the
+# proguardFiles setting in build.gradle.
+#
+# For more details, see
+#   http://developer.android.com/guide/developing/tools/proguard.html
+
+# Preserve line numbers for readable release stack traces
+-keepattributes SourceFile,LineNumberTable
+-renamesourcefileattribute SourceFile
+'''
+
+    NETWORKING = {
+        NetworkingLib.retrofit: '''# Retrofit
+-keepattributes Signature, InnerClasses, EnclosingMethod
+-keepattributes RuntimeVisibleAnnotations, RuntimeVisibleParameterAnnotations
+-keepattributes AnnotationDefault
+-keepclassmembers,allowshrinking,allowobfuscation interface * {
+    @retrofit2.http.* <methods>;
+}
+-if interface * { @retrofit2.http.* <methods>; }
+-keep,allowobfuscation interface <1>
+-if interface * { @retrofit2.http.* public *** *(...); }
+-keep,allowoptimization,allowshrinking,allowobfuscation class <3>
+-keep,allowobfuscation,allowshrinking class kotlin.coroutines.Continuation
+-keep,allowobfuscation,allowshrinking class retrofit2.Response
+-dontwarn org.codehaus.mojo.animal_sniffer.IgnoreJRERequirement
+-dontwarn javax.annotation.**
+-dontwarn kotlin.Unit
+-dontwarn retrofit2.KotlinExtensions
+-dontwarn retrofit2.KotlinExtensions$*
+
+# OkHttp
+-dontwarn okhttp3.internal.platform.**
+-dontwarn org.conscrypt.**
+-dontwarn org.bouncycastle.**
+-dontwarn org.openjsse.**
+''',
+        NetworkingLib.ktor: '''# Ktor
+-keep class io.ktor.client.engine.okhttp.** { *; }
+-keepclassmembers class io.ktor.** { volatile <fields>; }
+-dontwarn org.slf4j.impl.StaticLoggerBinder
+-dontwarn java.lang.management.**
+
+# OkHttp engine
+-dontwarn okhttp3.internal.platform.**
+-dontwarn org.conscrypt.**
+-dontwarn org.bouncycastle.**
+-dontwarn org.openjsse.**
+''',
+    }
+
+    SERIALIZATION = {
+        SerializationLib.gson: '''# Gson
+-keepattributes Signature
+-keepattributes *Annotation*
+-dontwarn sun.misc.**
+-keep class * extends com.google.gson.TypeAdapter
+-keep class * implements com.google.gson.TypeAdapterFactory
+-keep class * implements com.google.gson.JsonSerializer
+-keep class * implements com.google.gson.JsonDeserializer
+-keepclassmembers,allowobfuscation class * {
+    @com.google.gson.annotations.SerializedName <fields>;
+}
+-keep,allowobfuscation,allowshrinking class com.google.gson.reflect.TypeToken
+-keep,allowobfuscation,allowshrinking class * extends com.google.gson.reflect.TypeToken
+''',
+        SerializationLib.moshi: '''# Moshi (reflection via moshi-kotlin)
+-keep class kotlin.Metadata { *; }
+-keepclassmembers class kotlin.Metadata { public <methods>; }
+-keepclassmembers class * {
+    @com.squareup.moshi.FromJson <methods>;
+    @com.squareup.moshi.ToJson <methods>;
+}
+-keepclassmembers @com.squareup.moshi.JsonClass class * extends java.lang.Enum {
+    <fields>;
+    **[] values();
+}
+''',
+        SerializationLib.kotlinx: '''# kotlinx.serialization
+-keepattributes *Annotation*, InnerClasses
+-dontnote kotlinx.serialization.AnnotationsKt
+-keepclassmembers class kotlinx.serialization.json.** { *** Companion; }
+-keepclasseswithmembers class kotlinx.serialization.json.** {
+    kotlinx.serialization.KSerializer serializer(...);
+}
+-if @kotlinx.serialization.Serializable class **
+-keepclassmembers class <1> { static <1>$Companion Companion; }
+-if @kotlinx.serialization.Serializable class ** { static **$* *; }
+-keepclassmembers class <2>$<3> { kotlinx.serialization.KSerializer serializer(...); }
+-if @kotlinx.serialization.Serializable class ** { public static ** INSTANCE; }
+-keepclassmembers class <1> {
+    public static <1> INSTANCE;
+    kotlinx.serialization.KSerializer serializer(...);
+}
+''',
+    }
+
+    DEPENDENCY_INJECTION = {
+        DILib.hilt: '''# Hilt (Dagger ships its own consumer rules; these cover generated entry points)
+-keep,allowobfuscation,allowshrinking @dagger.hilt.android.AndroidEntryPoint class *
+-keep,allowobfuscation,allowshrinking @dagger.hilt.android.HiltAndroidApp class *
+-dontwarn com.google.errorprone.annotations.**
+''',
+        DILib.koin: '''# Koin (modules are resolved by type; keep ViewModel constructors)
+-keepnames class * extends androidx.lifecycle.ViewModel
+-keepclassmembers class * extends androidx.lifecycle.ViewModel { <init>(...); }
+''',
+    }
+
+    ROOM = '''# Room
+-keep class * extends androidx.room.RoomDatabase
+-keep @androidx.room.Entity class *
+-keepclassmembers @androidx.room.Entity class * { <fields>; }
+-dontwarn androidx.room.paging.**
+'''
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_rules(self) -> str:
+        """Return proguard-rules.pro for the selected library stack"""
+        configuration = self.config.configuration
+        return self.rules_for(
+            configuration.networking, configuration.serialization,
+            configuration.dependencyInjection, configuration.enableRoom,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def rules_for(cls, networking: NetworkingLib, serialization: SerializationLib,
+                  dependency_injection: DILib, enable_room: bool) -> str:
+        """Assemble and cache the rules for one library combination"""
+        fragments = [
+            cls.HEADER,
+            cls.NETWORKING.get(networking),
+            cls.SERIALIZATION.get(serialization),
+            cls.DEPENDENCY_INJECTION.get(dependency_injection),
+            cls.ROOM if enable_room else None,
+        ]
+        return '\n'.join(fragment for fragment in fragments if fragment)
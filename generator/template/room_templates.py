@@ -0,0 +1,327 @@
+from models.config_model import ProjectConfig
+
+
+class RoomTemplates:
+    """Template handler for the Room entities, DAOs and database generated from configuration.roomSchema"""
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_templates(self) -> dict:
+        """Return all Room templates"""
+        return {
+            'room_entity_kt.j2': self._get_entity_kt_template(),
+            'room_entity_java.j2': self._get_entity_java_template(),
+            'room_dao_kt.j2': self._get_dao_kt_template(),
+            'room_dao_java.j2': self._get_dao_java_template(),
+            'room_database_kt.j2': self._get_database_kt_template(),
+            'room_database_java.j2': self._get_database_java_template(),
+        }
+
+    def _get_entity_kt_template(self):
+        return '''
+package {{ package }}.entity
+
+import androidx.room.ColumnInfo
+import androidx.room.Entity
+{%- if entity.foreign_keys %}
+import androidx.room.ForeignKey
+{%- endif %}
+{%- if entity.indices %}
+import androidx.room.Index
+{%- endif %}
+{%- if entity.single_key %}
+import androidx.room.PrimaryKey
+{%- endif %}
+
+@Entity(
+    tableName = "{{ entity.table }}",
+{%- if not entity.single_key %}
+    primaryKeys = [{{ entity.primary_key_literal }}],
+{%- endif %}
+{%- if entity.indices %}
+    indices = [
+{%- for index in entity.indices %}
+        Index(value = [{{ index.literal }}]{{ ', unique = true' if index.unique }}),
+{%- endfor %}
+    ],
+{%- endif %}
+{%- if entity.foreign_keys %}
+    foreignKeys = [
+{%- for key in entity.foreign_keys %}
+        ForeignKey(
+            entity = {{ key.parent_class }}::class,
+            parentColumns = ["{{ key.parent_column }}"],
+            childColumns = ["{{ key.column }}"],
+            onDelete = ForeignKey.{{ key.on_delete }},
+            onUpdate = ForeignKey.{{ key.on_update }},
+        ),
+{%- endfor %}
+    ],
+{%- endif %}
+)
+data class {{ entity.class_name }}(
+{%- for column in entity.columns %}
+{%- if entity.single_key and column.primary_key %}
+    @PrimaryKey{{ '(autoGenerate = true)' if column.auto_generate }}
+{%- endif %}
+    @ColumnInfo(name = "{{ column.name }}")
+    val {{ column.property }}: {{ column.kotlin_type }}{{ column.kotlin_default }},
+{%- endfor %}
+)
+'''.strip()
+
+    def _get_entity_java_template(self):
+        return '''
+package {{ package }}.entity;
+
+{% if entity.java_non_null -%}
+import androidx.annotation.NonNull;
+{% endif -%}
+import androidx.room.ColumnInfo;
+import androidx.room.Entity;
+{%- if entity.foreign_keys %}
+import androidx.room.ForeignKey;
+{%- endif %}
+{%- if entity.indices %}
+import androidx.room.Index;
+{%- endif %}
+{%- if entity.single_key %}
+import androidx.room.PrimaryKey;
+{%- endif %}
+
+@Entity(
+        tableName = "{{ entity.table }}"
+{%- if not entity.single_key %},
+        primaryKeys = {{ '{' }}{{ entity.primary_key_literal }}{{ '}' }}
+{%- endif %}
+{%- if entity.indices %},
+        indices = {
+{%- for index in entity.indices %}
+                @Index(value = {{ '{' }}{{ index.literal }}{{ '}' }}{{ ', unique = true' if index.unique }}){{ ',' if not loop.last }}
+{%- endfor %}
+        }
+{%- endif %}
+{%- if entity.foreign_keys %},
+        foreignKeys = {
+{%- for key in entity.foreign_keys %}
+                @ForeignKey(
+                        entity = {{ key.parent_class }}.class,
+                        parentColumns = "{{ key.parent_column }}",
+                        childColumns = "{{ key.column }}",
+                        onDelete = ForeignKey.{{ key.on_delete }},
+                        onUpdate = ForeignKey.{{ key.on_update }}
+                ){{ ',' if not loop.last }}
+{%- endfor %}
+        }
+{%- endif %}
+)
+public class {{ entity.class_name }} {
+{%- for column in entity.columns %}
+{% if entity.single_key and column.primary_key %}
+    @PrimaryKey{{ '(autoGenerate = true)' if column.auto_generate }}
+{%- endif %}
+{%- if column.java_non_null %}
+    @NonNull
+{%- endif %}
+    @ColumnInfo(name = "{{ column.name }}")
+    public {{ column.java_type }} {{ column.property }};
+{%- endfor %}
+}
+'''.strip()
+
+    def _get_dao_kt_template(self):
+        return '''
+package {{ package }}.dao
+
+import androidx.room.Dao
+import androidx.room.Delete
+import androidx.room.Insert
+import androidx.room.OnConflictStrategy
+import androidx.room.Query
+import androidx.room.Update
+import androidx.room.Upsert
+import {{ package }}.entity.{{ entity.class_name }}
+import kotlinx.coroutines.flow.Flow
+
+@Dao
+interface {{ entity.dao_name }} {
+
+    @Query("SELECT * FROM `{{ entity.table }}`")
+    fun observeAll(): Flow<List<{{ entity.class_name }}>>
+
+    @Query("SELECT * FROM `{{ entity.table }}` WHERE {{ entity.key_query.where }}")
+    suspend fun {{ entity.key_query.method }}({{ entity.key_query.kotlin_params }}): {{ entity.class_name }}?
+{%- for query in entity.queries %}
+
+    @Query("SELECT * FROM `{{ entity.table }}` WHERE {{ query.where }}")
+    suspend fun {{ query.method }}({{ query.kotlin_params }}): {{ entity.class_name + '?' if query.unique else 'List<' + entity.class_name + '>' }}
+{%- endfor %}
+
+    // Not REPLACE: that deletes the conflicting row, and with it every row whose foreign key cascades from it
+    @Insert(onConflict = OnConflictStrategy.ABORT)
+    suspend fun insert(vararg entities: {{ entity.class_name }})
+
+    @Upsert
+    suspend fun upsert(vararg entities: {{ entity.class_name }})
+
+    @Update
+    suspend fun update(vararg entities: {{ entity.class_name }})
+
+    @Delete
+    suspend fun delete(vararg entities: {{ entity.class_name }})
+}
+'''.strip()
+
+    def _get_dao_java_template(self):
+        return '''
+package {{ package }}.dao;
+
+import androidx.annotation.Nullable;
+import androidx.room.Dao;
+import androidx.room.Delete;
+import androidx.room.Insert;
+import androidx.room.OnConflictStrategy;
+import androidx.room.Query;
+import androidx.room.Update;
+import androidx.room.Upsert;
+
+import java.util.List;
+
+import {{ package }}.entity.{{ entity.class_name }};
+
+@Dao
+public interface {{ entity.dao_name }} {
+
+    @Query("SELECT * FROM `{{ entity.table }}`")
+    List<{{ entity.class_name }}> getAll();
+
+    @Nullable
+    @Query("SELECT * FROM `{{ entity.table }}` WHERE {{ entity.key_query.where }}")
+    {{ entity.class_name }} {{ entity.key_query.method }}({{ entity.key_query.java_params }});
+{%- for query in entity.queries %}
+{% if query.unique %}
+    @Nullable
+    @Query("SELECT * FROM `{{ entity.table }}` WHERE {{ query.where }}")
+    {{ entity.class_name }} {{ query.method }}({{ query.java_params }});
+{%- else %}
+    @Query("SELECT * FROM `{{ entity.table }}` WHERE {{ query.where }}")
+    List<{{ entity.class_name }}> {{ query.method }}({{ query.java_params }});
+{%- endif %}
+{%- endfor %}
+
+    // Not REPLACE: that deletes the conflicting row, and with it every row whose foreign key cascades from it
+    @Insert(onConflict = OnConflictStrategy.ABORT)
+    void insert({{ entity.class_name }}... entities);
+
+    @Upsert
+    void upsert({{ entity.class_name }}... entities);
+
+    @Update
+    void update({{ entity.class_name }}... entities);
+
+    @Delete
+    void delete({{ entity.class_name }}... entities);
+}
+'''.strip()
+
+    def _get_database_kt_template(self):
+        return '''
+package {{ database.package }}
+
+import android.content.Context
+import androidx.room.Database
+import androidx.room.Room
+import androidx.room.RoomDatabase
+{%- for entity in database.entities %}
+import {{ database.package }}.dao.{{ entity.dao_name }}
+{%- endfor %}
+{%- for entity in database.entities %}
+import {{ database.package }}.entity.{{ entity.class_name }}
+{%- endfor %}
+
+@Database(
+    entities = [
+{%- for entity in database.entities %}
+        {{ entity.class_name }}::class,
+{%- endfor %}
+    ],
+    version = {{ database.version }},
+    exportSchema = true,
+)
+abstract class {{ database.class_name }} : RoomDatabase() {
+{%- for entity in database.entities %}
+    abstract fun {{ entity.dao_accessor }}(): {{ entity.dao_name }}
+{%- endfor %}
+
+    companion object {
+        const val DATABASE_NAME = "{{ database.file_name }}"
+
+        @Volatile
+        private var instance: {{ database.class_name }}? = null
+
+        fun getInstance(context: Context): {{ database.class_name }} =
+            instance ?: synchronized(this) {
+                instance ?: Room.databaseBuilder(
+                    context.applicationContext, {{ database.class_name }}::class.java, DATABASE_NAME
+                )
+                    // Write-ahead logging lets reads run concurrently with a write
+                    .setJournalMode(RoomDatabase.JournalMode.WRITE_AHEAD_LOGGING)
+                    .build()
+                    .also { instance = it }
+            }
+    }
+}
+'''.strip()
+
+    def _get_database_java_template(self):
+        return '''
+package {{ database.package }};
+
+import android.content.Context;
+
+import androidx.room.Database;
+import androidx.room.Room;
+import androidx.room.RoomDatabase;
+{% for entity in database.entities %}
+import {{ database.package }}.dao.{{ entity.dao_name }};
+{%- endfor %}
+{%- for entity in database.entities %}
+import {{ database.package }}.entity.{{ entity.class_name }};
+{%- endfor %}
+
+@Database(
+        entities = {
+{%- for entity in database.entities %}
+                {{ entity.class_name }}.class{{ ',' if not loop.last }}
+{%- endfor %}
+        },
+        version = {{ database.version }},
+        exportSchema = true
+)
+public abstract class {{ database.class_name }} extends RoomDatabase {
+
+    public static final String DATABASE_NAME = "{{ database.file_name }}";
+
+    private static volatile {{ database.class_name }} instance;
+{% for entity in database.entities %}
+    public abstract {{ entity.dao_name }} {{ entity.dao_accessor }}();
+{%- endfor %}
+
+    public static {{ database.class_name }} getInstance(Context context) {
+        if (instance == null) {
+            synchronized ({{ database.class_name }}.class) {
+                if (instance == null) {
+                    instance = Room.databaseBuilder(
+                                    context.getApplicationContext(), {{ database.class_name }}.class, DATABASE_NAME
+                            )
+                            // Write-ahead logging lets reads run concurrently with a write
+                            .setJournalMode(RoomDatabase.JournalMode.WRITE_AHEAD_LOGGING)
+                            .build();
+                }
+            }
+        }
+        return instance;
+    }
+}
+'''.strip()
@@ -0,0 +1,490 @@
+from models.config_model import ProjectConfig
+
+
+class StartupTemplates:
+    """Template handler for the Application class, dependency injection modules and androidx.startup initializers"""
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+
+    def get_templates(self) -> dict:
+        """Return all application startup templates"""
+        return {
+            'application_kt.j2': self._get_application_kt_template(),
+            'application_java.j2': self._get_application_java_template(),
+            'hilt_module_kt.j2': self._get_hilt_module_kt_template(),
+            'hilt_module_java.j2': self._get_hilt_module_java_template(),
+            'koin_module_kt.j2': self._get_koin_module_kt_template(),
+            'koin_initializer_kt.j2': self._get_koin_initializer_kt_template(),
+            'warm_up_initializer_kt.j2': self._get_warm_up_initializer_kt_template(),
+            'warm_up_initializer_java.j2': self._get_warm_up_initializer_java_template(),
+        }
+
+    def _get_application_kt_template(self):
+        return '''
+package {{ ctx.package }}
+
+import android.app.Application
+{%- if ctx.use_hilt %}
+import dagger.hilt.android.HiltAndroidApp
+{%- endif %}
+
+/**
+ * Keep onCreate free of eager initialization so cold start stays fast.
+{%- if ctx.use_startup %}
+ * Singletons are created on first use; the initializers in the startup package run before onCreate.
+{%- endif %}
+ */
+{%- if ctx.use_hilt %}
+@HiltAndroidApp
+{%- endif %}
+class {{ ctx.application_class }} : Application()
+'''.strip()
+
+    def _get_application_java_template(self):
+        return '''
+package {{ ctx.package }};
+
+import android.app.Application;
+{%- if ctx.use_hilt %}
+
+import dagger.hilt.android.HiltAndroidApp;
+{%- endif %}
+
+/**
+ * Keep onCreate free of eager initialization so cold start stays fast.
+{%- if ctx.use_startup %}
+ * Singletons are created on first use; the initializers in the startup package run before onCreate.
+{%- endif %}
+ */
+{%- if ctx.use_hilt %}
+@HiltAndroidApp
+{%- endif %}
+public class {{ ctx.application_class }} extends Application {
+}
+'''.strip()
+
+    def _get_hilt_module_kt_template(self):
+        return '''
+package {{ ctx.package }}.di
+
+import android.content.Context
+{%- if ctx.use_datastore %}
+import androidx.datastore.core.DataStore
+import androidx.datastore.preferences.core.PreferenceDataStoreFactory
+import androidx.datastore.preferences.core.Preferences
+import androidx.datastore.preferences.preferencesDataStoreFile
+{%- endif %}
+import dagger.Module
+import dagger.Provides
+import dagger.hilt.InstallIn
+import dagger.hilt.android.qualifiers.ApplicationContext
+import dagger.hilt.components.SingletonComponent
+{%- if ctx.use_ktor %}
+import io.ktor.client.HttpClient
+import io.ktor.client.engine.okhttp.OkHttp
+{%- endif %}
+{%- if ctx.use_networking %}
+import java.io.File
+import java.util.concurrent.TimeUnit
+{%- endif %}
+import javax.inject.Singleton
+{%- if ctx.use_networking %}
+import okhttp3.Cache
+import okhttp3.ConnectionPool
+import okhttp3.OkHttpClient
+{%- endif %}
+{%- if ctx.room_database %}
+import {{ ctx.room_database.package }}.{{ ctx.room_database.class_name }}
+{%- for entity in ctx.room_database.entities %}
+import {{ ctx.room_database.package }}.dao.{{ entity.dao_name }}
+{%- endfor %}
+{%- endif %}
+{%- if ctx.use_networking %}
+
+private const val HTTP_CACHE_BYTES = 10L * 1024 * 1024
+{%- endif %}
+
+/**
+ * Application-wide singletons. Each is built on first injection; inject heavy ones as dagger.Lazy<T>
+ * or Provider<T> where they are not needed right away.
+ */
+@Module
+@InstallIn(SingletonComponent::class)
+object AppModule {
+{%- if ctx.use_networking %}
+
+    @Provides
+    @Singleton
+    fun provideOkHttpClient(@ApplicationContext context: Context): OkHttpClient =
+        OkHttpClient.Builder()
+            .connectionPool(ConnectionPool(5, 5, TimeUnit.MINUTES))
+            .cache(Cache(File(context.cacheDir, "http_cache"), HTTP_CACHE_BYTES))
+            .connectTimeout(15, TimeUnit.SECONDS)
+            .readTimeout(30, TimeUnit.SECONDS)
+            .writeTimeout(30, TimeUnit.SECONDS)
+            .build()
+{%- endif %}
+{%- if ctx.use_ktor %}
+
+    @Provides
+    @Singleton
+    fun provideHttpClient(okHttpClient: OkHttpClient): HttpClient = HttpClient(OkHttp) {
+        engine {
+            preconfigured = okHttpClient
+        }
+    }
+{%- endif %}
+{%- if ctx.use_datastore %}
+
+    @Provides
+    @Singleton
+    fun providePreferencesDataStore(@ApplicationContext context: Context): DataStore<Preferences> =
+        PreferenceDataStoreFactory.create { context.preferencesDataStoreFile("settings") }
+{%- endif %}
+{%- if ctx.room_database %}
+
+    @Provides
+    @Singleton
+    fun provideDatabase(@ApplicationContext context: Context): {{ ctx.room_database.class_name }} =
+        {{ ctx.room_database.class_name }}.getInstance(context)
+{%- for entity in ctx.room_database.entities %}
+
+    @Provides
+    fun provide{{ entity.dao_name }}(database: {{ ctx.room_database.class_name }}): {{ entity.dao_name }} =
+        database.{{ entity.dao_accessor }}()
+{%- endfor %}
+{%- endif %}
+}
+'''.strip()
+
+    def _get_hilt_module_java_template(self):
+        return '''
+package {{ ctx.package }}.di;
+
+import android.content.Context;
+{%- if ctx.use_networking %}
+
+import java.io.File;
+import java.util.concurrent.TimeUnit;
+{%- endif %}
+
+import javax.inject.Singleton;
+
+import dagger.Module;
+import dagger.Provides;
+import dagger.hilt.InstallIn;
+import dagger.hilt.android.qualifiers.ApplicationContext;
+import dagger.hilt.components.SingletonComponent;
+{%- if ctx.use_networking %}
+import okhttp3.Cache;
+import okhttp3.ConnectionPool;
+import okhttp3.OkHttpClient;
+{%- endif %}
+{%- if ctx.room_database %}
+import {{ ctx.room_database.package }}.{{ ctx.room_database.class_name }};
+{%- for entity in ctx.room_database.entities %}
+import {{ ctx.room_database.package }}.dao.{{ entity.dao_name }};
+{%- endfor %}
+{%- endif %}
+
+/**
+ * Application-wide singletons. Each is built on first injection; inject heavy ones as dagger.Lazy<T>
+ * or Provider<T> where they are not needed right away.
+ */
+@Module
+@InstallIn(SingletonComponent.class)
+public final class AppModule {
+{%- if ctx.use_networking %}
+
+    private static final long HTTP_CACHE_BYTES = 10L * 1024 * 1024;
+{%- endif %}
+
+    private AppModule() {
+    }
+{%- if ctx.use_networking %}
+
+    @Provides
+    @Singleton
+    static OkHttpClient provideOkHttpClient(@ApplicationContext Context context) {
+        return new OkHttpClient.Builder()
+                .connectionPool(new ConnectionPool(5, 5, TimeUnit.MINUTES))
+                .cache(new Cache(new File(context.getCacheDir(), "http_cache"), HTTP_CACHE_BYTES))
+                .connectTimeout(15, TimeUnit.SECONDS)
+                .readTimeout(30, TimeUnit.SECONDS)
+                .writeTimeout(30, TimeUnit.SECONDS)
+                .build();
+    }
+{%- endif %}
+{%- if ctx.room_database %}
+
+    @Provides
+    @Singleton
+    static {{ ctx.room_database.class_name }} provideDatabase(@ApplicationContext Context context) {
+        return {{ ctx.room_database.class_name }}.getInstance(context);
+    }
+{%- for entity in ctx.room_database.entities %}
+
+    @Provides
+    static {{ entity.dao_name }} provide{{ entity.dao_name }}({{ ctx.room_database.class_name }} database) {
+        return database.{{ entity.dao_accessor }}();
+    }
+{%- endfor %}
+{%- endif %}
+}
+'''.strip()
+
+    def _get_koin_module_kt_template(self):
+        return '''
+package {{ ctx.package }}.di
+{% if ctx.use_datastore %}
+import androidx.datastore.preferences.core.PreferenceDataStoreFactory
+import androidx.datastore.preferences.preferencesDataStoreFile
+{%- endif %}
+{%- if ctx.use_ktor %}
+import io.ktor.client.HttpClient
+import io.ktor.client.engine.okhttp.OkHttp
+{%- endif %}
+{%- if ctx.use_networking %}
+import java.io.File
+import java.util.concurrent.TimeUnit
+import okhttp3.Cache
+import okhttp3.ConnectionPool
+import okhttp3.OkHttpClient
+{%- endif %}
+{%- if ctx.use_datastore or ctx.use_networking or ctx.room_database %}
+import org.koin.android.ext.koin.androidContext
+{%- endif %}
+import org.koin.dsl.module
+{%- if ctx.room_database %}
+import {{ ctx.room_database.package }}.{{ ctx.room_database.class_name }}
+{%- endif %}
+{%- if ctx.use_networking %}
+
+private const val HTTP_CACHE_BYTES = 10L * 1024 * 1024
+{%- endif %}
+
+/**
+ * Application-wide definitions. single { } instances are created on the first get() or inject(),
+ * not when Koin starts; prefer by inject() for heavy ones that are not needed right away.
+ */
+val appModule = module {
+{%- if ctx.use_networking %}
+    single {
+        OkHttpClient.Builder()
+            .connectionPool(ConnectionPool(5, 5, TimeUnit.MINUTES))
+            .cache(Cache(File(androidContext().cacheDir, "http_cache"), HTTP_CACHE_BYTES))
+            .connectTimeout(15, TimeUnit.SECONDS)
+            .readTimeout(30, TimeUnit.SECONDS)
+            .writeTimeout(30, TimeUnit.SECONDS)
+            .build()
+    }
+{%- endif %}
+{%- if ctx.use_ktor %}
+    single {
+        val okHttpClient = get<OkHttpClient>()
+        HttpClient(OkHttp) {
+            engine {
+                preconfigured = okHttpClient
+            }
+        }
+    }
+{%- endif %}
+{%- if ctx.use_datastore %}
+    single { PreferenceDataStoreFactory.create { androidContext().preferencesDataStoreFile("settings") } }
+{%- endif %}
+{%- if ctx.room_database %}
+    single { {{ ctx.room_database.class_name }}.getInstance(androidContext()) }
+{%- for entity in ctx.room_database.entities %}
+    factory { get<{{ ctx.room_database.class_name }}>().{{ entity.dao_accessor }}() }
+{%- endfor %}
+{%- endif %}
+}
+'''.strip()
+
+    def _get_koin_initializer_kt_template(self):
+        return '''
+package {{ ctx.package }}.startup
+
+import android.content.Context
+import androidx.startup.Initializer
+import {{ ctx.package }}.di.appModule
+import org.koin.android.ext.koin.androidContext
+import org.koin.core.KoinApplication
+import org.koin.core.context.startKoin
+
+/**
+ * Starts Koin before Application.onCreate so other initializers can depend on it. Only the
+ * definitions are registered here; nothing is instantiated.
+ */
+class KoinInitializer : Initializer<KoinApplication> {
+
+    override fun create(context: Context): KoinApplication = startKoin {
+        androidContext(context.applicationContext)
+        modules(appModule)
+    }
+
+    override fun dependencies(): List<Class<out Initializer<*>>> = emptyList()
+}
+'''.strip()
+
+    def _get_warm_up_initializer_kt_template(self):
+        return '''
+package {{ ctx.package }}.startup
+
+import android.content.Context
+{%- if ctx.use_datastore %}
+import androidx.datastore.core.DataStore
+import androidx.datastore.preferences.core.Preferences
+{%- endif %}
+import androidx.startup.Initializer
+{%- if ctx.use_hilt %}
+import dagger.Lazy
+import dagger.hilt.EntryPoint
+import dagger.hilt.InstallIn
+import dagger.hilt.android.EntryPointAccessors
+import dagger.hilt.components.SingletonComponent
+{%- endif %}
+{%- if ctx.use_ktor %}
+import io.ktor.client.HttpClient
+{%- endif %}
+import kotlin.concurrent.thread
+{%- if ctx.use_datastore %}
+import kotlinx.coroutines.flow.first
+import kotlinx.coroutines.runBlocking
+{%- endif %}
+{%- if ctx.use_retrofit %}
+import okhttp3.OkHttpClient
+{%- endif %}
+{%- if ctx.use_koin %}
+import org.koin.core.component.KoinComponent
+import org.koin.core.component.get
+{%- endif %}
+{%- if ctx.room_database %}
+import {{ ctx.room_database.package }}.{{ ctx.room_database.class_name }}
+{%- endif %}
+
+/**
+ * Builds the heavy singletons on a low-priority background thread during startup, so the first
+ * screen that needs one finds it ready instead of creating it on the main thread.
+ */
+class WarmUpInitializer : Initializer<Unit>{{ ', KoinComponent' if ctx.use_koin }} {
+{%- if ctx.use_hilt %}
+
+    @EntryPoint
+    @InstallIn(SingletonComponent::class)
+    interface WarmUpEntryPoint {
+{%- if ctx.use_ktor %}
+        fun httpClient(): Lazy<HttpClient>
+{%- elif ctx.use_networking %}
+        fun okHttpClient(): Lazy<OkHttpClient>
+{%- endif %}
+{%- if ctx.use_datastore %}
+        fun preferencesDataStore(): Lazy<DataStore<Preferences>>
+{%- endif %}
+{%- if ctx.room_database %}
+        fun database(): Lazy<{{ ctx.room_database.class_name }}>
+{%- endif %}
+    }
+{%- endif %}
+
+    override fun create(context: Context) {
+        thread(name = "warm-up", priority = Thread.MIN_PRIORITY) {
+{%- if ctx.use_hilt %}
+            val entryPoint = EntryPointAccessors.fromApplication(context, WarmUpEntryPoint::class.java)
+{%- if ctx.use_ktor %}
+            entryPoint.httpClient().get()
+{%- elif ctx.use_networking %}
+            entryPoint.okHttpClient().get()
+{%- endif %}
+{%- if ctx.use_datastore %}
+            runBlocking { entryPoint.preferencesDataStore().get().data.first() }
+{%- endif %}
+{%- if ctx.room_database %}
+            entryPoint.database().get().openHelper.writableDatabase
+{%- endif %}
+{%- else %}
+{%- if ctx.use_ktor %}
+            get<HttpClient>()
+{%- elif ctx.use_networking %}
+            get<OkHttpClient>()
+{%- endif %}
+{%- if ctx.use_datastore %}
+            runBlocking { get<DataStore<Preferences>>().data.first() }
+{%- endif %}
+{%- if ctx.room_database %}
+            get<{{ ctx.room_database.class_name }}>().openHelper.writableDatabase
+{%- endif %}
+{%- endif %}
+        }
+    }
+
+    override fun dependencies(): List<Class<out Initializer<*>>> =
+        {{ 'listOf(KoinInitializer::class.java)' if ctx.use_koin else 'emptyList()' }}
+}
+'''.strip()
+
+    def _get_warm_up_initializer_java_template(self):
+        return '''
+package {{ ctx.package }}.startup;
+
+import android.content.Context;
+
+import androidx.annotation.NonNull;
+import androidx.startup.Initializer;
+
+import java.util.Collections;
+import java.util.List;
+
+import dagger.Lazy;
+import dagger.hilt.EntryPoint;
+import dagger.hilt.InstallIn;
+import dagger.hilt.android.EntryPointAccessors;
+import dagger.hilt.components.SingletonComponent;
+{%- if ctx.use_networking %}
+import okhttp3.OkHttpClient;
+{%- endif %}
+{%- if ctx.room_database %}
+import {{ ctx.room_database.package }}.{{ ctx.room_database.class_name }};
+{%- endif %}
+
+/**
+ * Builds the heavy singletons on a low-priority background thread during startup, so the first
+ * screen that needs one finds it ready instead of creating it on the main thread.
+ */
+public final class WarmUpInitializer implements Initializer<Void> {
+
+    @EntryPoint
+    @InstallIn(SingletonComponent.class)
+    public interface WarmUpEntryPoint {
+{%- if ctx.use_networking %}
+        Lazy<OkHttpClient> okHttpClient();
+{%- endif %}
+{%- if ctx.room_database %}
+        Lazy<{{ ctx.room_database.class_name }}> database();
+{%- endif %}
+    }
+
+    @Override
+    public Void create(@NonNull Context context) {
+        Thread thread = new Thread(() -> {
+            WarmUpEntryPoint entryPoint = EntryPointAccessors.fromApplication(context, WarmUpEntryPoint.class);
+{%- if ctx.use_networking %}
+            entryPoint.okHttpClient().get();
+{%- endif %}
+{%- if ctx.room_database %}
+            entryPoint.database().get().getOpenHelper().getWritableDatabase();
+{%- endif %}
+        }, "warm-up");
+        thread.setPriority(Thread.MIN_PRIORITY);
+        thread.start();
+        return null;
+    }
+
+    @NonNull
+    @Override
+    public List<Class<? extends Initializer<?>>> dependencies() {
+        return Collections.emptyList();
+    }
+}
+'''.strip()
@@ -23,7 +23,7 @@ class TestTemplates:
             }
 
     def _get_test_kotlin(self):
-        return '''package {{ config.project.package }}
+        return '''package {{ ctx.package }}
 
 import org.junit.Assert.*
 import org.junit.Test
@@ -36,7 +36,7 @@ class ExampleUnitTest {
 }'''
 
     def _get_android_test_kotlin(self):
-        return '''package {{ config.project.package }}
+        return '''package {{ ctx.package }}
 
 import androidx.test.platform.app.InstrumentationRegistry
 import androidx.test.ext.junit.runners.AndroidJUnit4
@@ -50,12 +50,12 @@ class ExampleInstrumentedTest {
     @Test
     fun useAppContext() {
         val appContext = InstrumentationRegistry.getInstrumentation().targetContext
-        assertEquals("{{ config.project.package }}", appContext.packageName)
+        assertEquals("{{ ctx.package }}", appContext.packageName)
     }
 }'''
 
     def _get_test_java(self):
-        return '''package {{ config.project.package }};
+        return '''package {{ ctx.package }};
 
 import org.junit.Test;
 import static org.junit.Assert.*;
@@ -68,7 +68,7 @@ public class ExampleUnitTest {
 }'''
 
     def _get_android_test_java(self):
-        return '''package {{ config.project.package }};
+        return '''package {{ ctx.package }};
 
 import android.content.Context;
 import androidx.test.platform.app.InstrumentationRegistry;
@@ -83,6 +83,6 @@ public class ExampleInstrumentedTest {
     @Test
     public void useAppContext() {
         Context appContext = InstrumentationRegistry.getInstrumentation().getTargetContext();
-        assertEquals("{{ config.project.package }}", appContext.getPackageName());
+        assertEquals("{{ ctx.package }}", appContext.getPackageName());
     }
 }'''
\ No newline at end of file
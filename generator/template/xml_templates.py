@@ -113,19 +113,17 @@ class XmlTemplates:
         android:label="@string/app_name"
         android:roundIcon="@mipmap/ic_launcher_round"
         android:supportsRtl="true"
-        android:theme="@style/Theme.{{ config.project.name.replace(' ', '').replace('-', '').replace('_', '') }}"
+        android:theme="@style/Theme.{{ ctx.theme_name }}"
 {% if use_network_config %}
         android:networkSecurityConfig="@xml/network_security_config"
 {% endif %}
-{% if config.configuration.dependencyInjection.value == 'hilt' %}
-        android:name=".{{ config.project.name.replace(' ', '').replace('-', '').replace('_', '') }}Application"
-{% endif %}
-        tools:targetApi="{{ config.project.targetSdk }}">
+        android:name=".{{ ctx.application_class }}"
+        tools:targetApi="{{ ctx.target_sdk }}">
         
         <activity
             android:name=".MainActivity"
             android:exported="true"
-            android:theme="@style/Theme.{{ config.project.name.replace(' ', '').replace('-', '').replace('_', '') }}"
+            android:theme="@style/Theme.{{ ctx.theme_name }}"
             tools:ignore="AppLinkUrlError">
             <intent-filter>
                 <action android:name="android.intent.action.MAIN" />
@@ -133,7 +131,33 @@ class XmlTemplates:
             </intent-filter>
         </activity>
         
-{% if config.configuration.networking.value == 'retrofit' or config.configuration.networking.value == 'ktor' %}
+{% if ctx.benchmark_module %}
+        <!-- Lets the macrobenchmark and baseline profile tests profile release builds -->
+        <profileable
+            android:shell="true"
+            tools:targetApi="29" />
+        
+{% endif %}
+{% if ctx.use_startup %}
+        <provider
+            android:name="androidx.startup.InitializationProvider"
+            android:authorities="${applicationId}.androidx-startup"
+            android:exported="false"
+            tools:node="merge">
+{%- if ctx.use_koin %}
+            <meta-data
+                android:name="{{ ctx.package }}.startup.KoinInitializer"
+                android:value="androidx.startup" />
+{%- endif %}
+{%- if ctx.warm_up %}
+            <meta-data
+                android:name="{{ ctx.package }}.startup.WarmUpInitializer"
+                android:value="androidx.startup" />
+{%- endif %}
+        </provider>
+        
+{% endif %}
+{% if ctx.use_networking %}
         <provider
             android:name="androidx.core.content.FileProvider"
             android:authorities="${applicationId}.fileprovider"
@@ -152,34 +176,31 @@ class XmlTemplates:
         """Generate strings.xml template"""
         return '''<?xml version="1.0" encoding="utf-8"?>
 <resources>
-    <string name="app_name">{{ config.project.name }}</string>
+    <string name="app_name">{{ ctx.name }}</string>
     <string name="hello_world">Hello World!</string>
-    <string name="welcome_message">Welcome to {{ config.project.name }}</string>
+    <string name="welcome_message">Welcome to {{ ctx.name }}</string>
     
-{% if config.configuration.networking.value != 'none' %}
+{% if ctx.use_networking %}
     <string name="network_error">Network connection error</string>
     <string name="loading">Loading...</string>
 {% endif %}
 
-{% if 'camera' in config.configuration.permissions %}
+{% if 'camera' in ctx.permissions %}
     <string name="camera_permission_required">Camera permission is required</string>
 {% endif %}
 
-{% if 'location' in config.configuration.permissions %}
+{% if 'location' in ctx.permissions %}
     <string name="location_permission_required">Location permission is required</string>
 {% endif %}
 
-{% if 'storage' in config.configuration.permissions %}
+{% if 'storage' in ctx.permissions %}
     <string name="storage_permission_required">Storage permission is required</string>
 {% endif %}
 
-{% if 'microphone' in config.configuration.permissions %}
+{% if 'microphone' in ctx.permissions %}
     <string name="microphone_permission_required">Microphone permission is required</string>
 {% endif %}
 
-{% if language is defined and language != 'en' %}
-    <!-- Localized strings for {{ language }} -->
-{% endif %}
 </resources>'''
     
     def _get_colors_xml_template(self):
@@ -188,50 +209,25 @@ class XmlTemplates:
 <resources>
     <color name="black">#FF000000</color>
     <color name="white">#FFFFFFFF</color>
-    
-    <color name="primary">{{ config.configuration.themeColors.primary }}</color>
-    <color name="secondary">{{ config.configuration.themeColors.secondary }}</color>
-    <color name="tertiary">{{ config.configuration.themeColors.tertiary }}</color>
-    
-{% if config.configuration.uiTheme.value == 'material3' %}
-    <color name="primary_container">#EADDFF</color>
-    <color name="on_primary_container">#21005D</color>
-    <color name="secondary_container">#E8DEF8</color>
-    <color name="on_secondary_container">#1D192B</color>
-    <color name="tertiary_container">#FFD8E4</color>
-    <color name="on_tertiary_container">#31111D</color>
-    <color name="surface">#FFFBFE</color>
-    <color name="on_surface">#1C1B1F</color>
-    <color name="surface_variant">#E7E0EC</color>
-    <color name="on_surface_variant">#49454F</color>
-    <color name="outline">#79747E</color>
-    <color name="outline_variant">#CAC4D0</color>
+{% if is_dark is defined and is_dark %}
+    <!-- Dark scheme derived from the theme seed colors -->
+{%- for color in ctx.color_scheme.dark %}
+    <color name="{{ color.resource }}">{{ color.hex }}</color>
+{%- endfor %}
 {% else %}
-    <color name="primary_variant">#3700B3</color>
-    <color name="secondary_variant">#018786</color>
-    <color name="surface">#FFFFFF</color>
-    <color name="on_surface">#000000</color>
+    <!-- Light scheme derived from the theme seed colors -->
+{%- for color in ctx.color_scheme.light %}
+    <color name="{{ color.resource }}">{{ color.hex }}</color>
+{%- endfor %}
 {% endif %}
-    
-    <color name="background">#FFFBFE</color>
-    <color name="on_background">#1C1B1F</color>
-    <color name="error">#B3261E</color>
-    <color name="on_error">#FFFFFF</color>
-    <color name="error_container">#F9DEDC</color>
-    <color name="on_error_container">#410E0B</color>
-    <color name="on_primary">#FFFFFF</color>
-    <color name="on_secondary">#FFFFFF</color>
-    <color name="on_tertiary">#FFFFFF</color>
 </resources>'''
     
     def _get_themes_xml_template(self):
         """Generate themes.xml template"""
-        theme_name = self.config.project.name.replace(' ', '').replace('-', '').replace('_', '')
-        
-        return f'''<?xml version="1.0" encoding="utf-8"?>
+        return '''<?xml version="1.0" encoding="utf-8"?>
 <resources xmlns:tools="http://schemas.android.com/tools">
-{{% if config.configuration.uiTheme.value == 'material3' %}}
-    <style name="Base.Theme.{theme_name}" parent="Theme.Material3.DayNight.NoActionBar">
+{% if ctx.is_material3 %}
+    <style name="Base.Theme.{{ ctx.theme_name }}" parent="Theme.Material3.DayNight.NoActionBar">
         <item name="colorPrimary">@color/primary</item>
         <item name="colorOnPrimary">@color/on_primary</item>
         <item name="colorPrimaryContainer">@color/primary_container</item>
@@ -254,17 +250,20 @@ class XmlTemplates:
         <item name="colorOnSurfaceVariant">@color/on_surface_variant</item>
         <item name="colorOutline">@color/outline</item>
         <item name="colorOutlineVariant">@color/outline_variant</item>
+        <item name="colorPrimaryInverse">@color/inverse_primary</item>
+        <item name="colorSurfaceInverse">@color/inverse_surface</item>
+        <item name="colorOnSurfaceInverse">@color/inverse_on_surface</item>
         <item name="android:colorBackground">@color/background</item>
         <item name="colorOnBackground">@color/on_background</item>
     </style>
-{{% elif config.configuration.uiTheme.value == 'material3-expressive' %}}
-    <style name="Base.Theme.{theme_name}" parent="Theme.Material3.DynamicColors.DayNight.NoActionBar">
+{% elif ctx.is_material3_expressive %}
+    <style name="Base.Theme.{{ ctx.theme_name }}" parent="Theme.Material3.DynamicColors.DayNight.NoActionBar">
         <item name="colorPrimary">@color/primary</item>
         <item name="colorSecondary">@color/secondary</item>
         <item name="colorTertiary">@color/tertiary</item>
     </style>
-{{% else %}}
-    <style name="Base.Theme.{theme_name}" parent="Theme.MaterialComponents.DayNight.NoActionBar">
+{% else %}
+    <style name="Base.Theme.{{ ctx.theme_name }}" parent="Theme.MaterialComponents.DayNight.NoActionBar">
         <item name="colorPrimary">@color/primary</item>
         <item name="colorPrimaryVariant">@color/primary_variant</item>
         <item name="colorSecondary">@color/secondary</item>
@@ -278,26 +277,14 @@ class XmlTemplates:
         <item name="colorOnSurface">@color/on_surface</item>
         <item name="colorOnError">@color/on_error</item>
     </style>
-{{% endif %}}
+{% endif %}
 
-    <style name="Theme.{theme_name}" parent="Base.Theme.{theme_name}" />
+    <style name="Theme.{{ ctx.theme_name }}" parent="Base.Theme.{{ ctx.theme_name }}" />
     
-{{% if config.configuration.uiToolkit.value != 'jetpack-compose' %}}
-    <style name="Theme.{theme_name}.AppBarOverlay" parent="ThemeOverlay.AppCompat.Dark.ActionBar" />
-    <style name="Theme.{theme_name}.PopupOverlay" parent="ThemeOverlay.AppCompat.Light" />
-{{% endif %}}
-
-{{% if is_dark is defined and is_dark %}}
-    <style name="Base.Theme.{theme_name}" parent="Theme.Material3.DayNight.NoActionBar">
-        <item name="android:colorBackground">#121212</item>
-        <item name="colorSurface">#1E1E1E</item>
-        <item name="colorOnSurface">#E1E1E1</item>
-        <item name="colorOnBackground">#E1E1E1</item>
-        <item name="colorPrimary">@color/primary</item>
-        <item name="colorSecondary">@color/secondary</item>
-        <item name="colorTertiary">@color/tertiary</item>
-    </style>
-{{% endif %}}
+{% if not ctx.is_compose %}
+    <style name="Theme.{{ ctx.theme_name }}.AppBarOverlay" parent="ThemeOverlay.AppCompat.Dark.ActionBar" />
+    <style name="Theme.{{ ctx.theme_name }}.PopupOverlay" parent="ThemeOverlay.AppCompat.Light" />
+{% endif %}
 </resources>'''
     
     def _get_network_config_xml_template(self):
@@ -3,6 +3,9 @@ import re
 from pathlib import Path
 from typing import List
 
+from models.naming import class_name
+from .palette import argb_literal, color_scheme
+
 class ProjectUtils:
     """Utility functions for Android project generation"""
     
@@ -16,6 +19,37 @@ class ProjectUtils:
         """Convert package name to folder path"""
         return package.replace('.', '/')
     
+    @staticmethod
+    def free_form_values(config, scheme=None) -> List[str]:
+        """Every spelling of the free-form config values (names, package, colors) used by templates and paths"""
+        name = config.project.name
+        project_name = config.configuration.projectName
+        package = config.project.package
+        colors = config.configuration.themeColors
+        values = [
+            name,
+            name.replace(' ', ''),
+            name.replace(' ', '').replace('-', '').replace('_', ''),
+            ProjectUtils.sanitize_project_name(name),
+            class_name(name),
+            project_name,
+            project_name.replace(' ', ''),
+            package,
+            ProjectUtils.package_to_path(package),
+            config.configuration.projectId,
+            colors.primary,
+            argb_literal(colors.primary),
+            colors.secondary,
+            argb_literal(colors.secondary),
+            colors.tertiary,
+            argb_literal(colors.tertiary),
+        ]
+        if scheme is None:
+            scheme = color_scheme(colors.primary, colors.secondary, colors.tertiary)
+        for color in scheme.colors():
+            values += [color.hex, color.argb]
+        return values
+
     @staticmethod
     def create_directories(base_path: Path, directories: List[str]):
         """Create multiple directories"""
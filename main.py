@@ -1,14 +1,46 @@
-from fastapi import BackgroundTasks, FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse
-from generator.builder import AndroidProjectBuilder
-import json, os
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query, Header
+from fastapi.responses import JSONResponse, Response
+from generator.admission import CHEAP, EXPENSIVE, AdmissionMiddleware, LoadShedder, RateLimiter, load_api_keys
+from generator.archive import ArchiveFormat, available_formats, negotiate_format
+from generator.cache import ArtifactCache
+from generator.popularity import CachePrewarmer, PopularityTracker
+from generator.presets import PresetRegistry
+from generator.readiness import BuildTracker, ReadinessCheck
+from generator.skeleton import SkeletonEngine
+from generator.builder import compile_templates, templates_loaded
+from generator.fonts import use_asset_store
+from generator.config_key import config_key
+from generator.diff import diff_projects
+from generator.i18n import TranslationSet, load_translations
+from generator.openapi import ApiSpec, load_openapi
+import gc, hashlib, json, mimetypes, os, tempfile
+from typing import Optional
 from fastapi.middleware.cors import CORSMiddleware
-from models.config_model import ProjectConfig
+from models.config_model import ConfigDiffRequest, ProjectConfig
 from pydantic import ValidationError
 from mangum import Mangum
 
 app = FastAPI(title="Android Project Generator", version="1.0.0")
 
+# Per-client budgets (requests per minute, burst) for archive builds and for everything else
+limiters = {
+    EXPENSIVE: RateLimiter(
+        float(os.getenv("RATE_LIMIT_EXPENSIVE_PER_MINUTE", 30)) / 60,
+        float(os.getenv("RATE_LIMIT_EXPENSIVE_BURST", 10)),
+    ),
+    CHEAP: RateLimiter(
+        float(os.getenv("RATE_LIMIT_CHEAP_PER_MINUTE", 600)) / 60,
+        float(os.getenv("RATE_LIMIT_CHEAP_BURST", 100)),
+    ),
+}
+shedder = LoadShedder(max_delay=float(os.getenv("LOAD_SHED_QUEUE_DELAY", 1.0)))
+builds = BuildTracker(max_age=float(os.getenv("READY_P95_WINDOW_SECONDS", 300)))
+
+# Only these API keys get their own budget; requests with any other key are limited by client address
+api_keys = load_api_keys(os.getenv("API_KEYS", "").split(","), os.getenv("API_KEYS_FILE"))
+
+# Added before CORS so that CORS wraps it and 429/503 responses keep their CORS headers
+app.add_middleware(AdmissionMiddleware, limiters=limiters, shedder=shedder, tracker=builds, api_keys=api_keys)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -19,13 +51,96 @@ app.add_middleware(
 
 handler = Mangum(app)
 
+
+skeletons = SkeletonEngine(
+    max_skeletons=int(os.getenv("SKELETON_CACHE_SIZE", 64)),
+    max_layers=int(os.getenv("BASE_LAYER_CACHE_SIZE", 32)),
+)
+
+
+def build_archive(config: ProjectConfig, archive_format: Optional[ArchiveFormat] = None,
+                  translations: Optional[TranslationSet] = None, api: Optional[ApiSpec] = None) -> bytes:
+    """Build a project and return the archive bytes (ZIP unless another format is given)"""
+    return skeletons.build_bytes(config, archive_format, translations, api)
+
+
+artifact_cache = ArtifactCache(max_bytes=int(os.getenv("ARTIFACT_CACHE_BYTES", 256 * 1024 * 1024)))
+popularity = PopularityTracker(
+    os.getenv("POPULARITY_FILE", os.path.join(tempfile.gettempdir(), "popularity.json")),
+    persist_interval=float(os.getenv("POPULARITY_PERSIST_INTERVAL", 60)),
+)
+presets = PresetRegistry(cache=artifact_cache)
+prewarmer = CachePrewarmer(
+    popularity, artifact_cache, build_archive, top_n=int(os.getenv("PREWARM_TOP_N", 8)), warm_up=presets.warm,
+)
+# Fonts come from the memory-mapped asset bundle, which every worker process shares
+use_asset_store(os.getenv("ASSET_STORE_FILE") or None)
+
+# Prefork mode (gunicorn --preload): templates and presets are loaded once in the master,
+# so workers inherit them copy-on-write
+if os.getenv("PREFORK_PRELOAD", "0") == "1":
+    presets.warm()
+    compile_templates()
+    # Keep the collector from touching (and so copying) the preloaded objects in every worker
+    gc.freeze()
+
+readiness = ReadinessCheck(
+    builds,
+    max_in_flight=int(os.getenv("READY_MAX_IN_FLIGHT", 16)),
+    max_queue_depth=int(os.getenv("READY_MAX_QUEUE_DEPTH", 8)),
+    max_p95=float(os.getenv("READY_MAX_P95_SECONDS", 5.0)),
+    checks={
+        "templates_loaded": templates_loaded,
+        "queue_delay_ok": lambda: not shedder.overloaded,
+    },
+    # Prewarming must not delay readiness, so it is only reported
+    info={"cache_warm": lambda: prewarmer.state == "done"},
+)
+
+
+@app.on_event("startup")
+async def start_prewarm():
+    # Runs in a daemon thread so readiness is not delayed
+    prewarmer.start()
+
+@app.on_event("startup")
+async def start_load_probe():
+    shedder.start()
+
+@app.on_event("shutdown")
+async def persist_popularity():
+    popularity.persist()
+
+@app.on_event("shutdown")
+async def stop_load_probe():
+    shedder.stop()
+
 @app.post("/generate")
-async def generate_android_project(file: UploadFile = File(...), background_tasks: BackgroundTasks = BackgroundTasks()):
+async def generate_android_project(
+    file: UploadFile = File(...),
+    translations: Optional[UploadFile] = File(None),
+    openapi: Optional[UploadFile] = File(None),
+    archive_format: Optional[str] = Query(None, alias="format"),
+    level: Optional[int] = Query(None),
+    accept: Optional[str] = Header(None),
+):
     """
-    Generate Android project ZIP from JSON configuration
+    Generate Android project archive from JSON configuration, with optional translations (CSV, XLIFF or JSON)
+    and an optional OpenAPI 3 document (JSON or YAML) to generate the networking layer from.
+    The format (zip, tar.gz, tar.zst) comes from the format query param or the Accept header.
     """
     if not file.filename.endswith('.json'):
         raise HTTPException(status_code=400, detail="File must be a JSON file")
+
+    try:
+        fmt = negotiate_format(accept, archive_format, level)
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+    if fmt is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Unsupported archive format {archive_format!r}; available: {', '.join(available_formats())}",
+        )
     
     try:
         # Read JSON configuration
@@ -34,36 +149,162 @@ async def generate_android_project(file: UploadFile = File(...), background_task
         
         config = ProjectConfig(**config_dict)
         
-        # Generate project
-        builder = AndroidProjectBuilder(config)
-        zip_path = builder.build()
-        
-        # Return ZIP file as streaming response
-        def iter_file():
-            with open(zip_path, mode="rb") as file_like:
-                yield from file_like
-        
-        # Clean up temp file after response
-        background_tasks.add_task(os.remove, zip_path)
-
-        return StreamingResponse(
-            iter_file(),
-            media_type="application/zip",
-            headers={"Content-Disposition": f"attachment; filename={config.project.name}.zip"},
-            background=background_tasks
+        # Generate project, reusing a cached archive for identical configs
+        key = config_key(config)
+        popularity.record(key, config)
+        cache_key = fmt.cache_key(key)
+        for label, upload in (("i18n", translations), ("api", openapi)):
+            if upload is not None:
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: upload.file.read(1 << 16), b''):
+                    digest.update(chunk)
+                upload.file.seek(0)
+                cache_key = f"{cache_key}:{label}:{digest.hexdigest()}"
+        archive = artifact_cache.get(cache_key)
+        if archive is None:
+            translation_set = None
+            if translations is not None:
+                translation_set = load_translations(translations.file, translations.filename)
+            api_spec = None
+            if openapi is not None:
+                api_spec = load_openapi(openapi.file, openapi.filename)
+            with builds.build():
+                archive = build_archive(config, fmt, translation_set, api_spec)
+            artifact_cache.put(cache_key, archive)
+
+        return Response(
+            content=archive,
+            media_type=fmt.media_type,
+            headers={"Content-Disposition": f"attachment; filename={config.project.name}{fmt.extension}"},
         )
         
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON format")
     except ValidationError as ve:
         raise HTTPException(status_code=422, detail=ve.errors())
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
     except Exception as e:
         print(e)
         raise HTTPException(status_code=500, detail=f"Error generating project: {str(e)}")
 
+@app.post("/generate/diff")
+async def generate_diff(
+    request: ConfigDiffRequest,
+    archive_format: Optional[str] = Query(None, alias="format"),
+    level: Optional[int] = Query(None),
+    accept: Optional[str] = Header(None),
+):
+    """
+    Return only what changed between the projects of two configs: with format=diff a unified diff,
+    otherwise an archive of the added and modified files plus patch-manifest.json listing deletions
+    """
+    unified = archive_format == "diff"
+    try:
+        fmt = None if unified else negotiate_format(accept, archive_format, level)
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+    if fmt is None and not unified:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Unsupported archive format {archive_format!r}; available: {', '.join(available_formats())}",
+        )
+
+    try:
+        with builds.build():
+            diff = diff_projects(skeletons, request.previous, request.current, with_deleted_content=unified)
+            content = diff.to_unified() if unified else diff.to_archive(fmt)
+        name = request.current.project.name
+        if unified:
+            return Response(
+                content=content,
+                media_type="text/x-diff",
+                headers={"Content-Disposition": f"attachment; filename={name}.patch"},
+            )
+        return Response(
+            content=content,
+            media_type=fmt.media_type,
+            headers={"Content-Disposition": f"attachment; filename={name}-patch{fmt.extension}"},
+        )
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+    except Exception as e:
+        print(e)
+        raise HTTPException(status_code=500, detail=f"Error generating diff: {str(e)}")
+
+@app.post("/preview/manifest")
+async def preview_manifest(config: ProjectConfig):
+    """
+    List the path, size and SHA-256 of every file the config would produce, without building an archive
+    """
+    try:
+        return {"files": skeletons.manifest(config)}
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+
+@app.post("/preview/file")
+async def preview_file(config: ProjectConfig, path: str = Query(...)):
+    """
+    Render a single project file; path may omit the project directory prefix
+    """
+    try:
+        data = skeletons.render_file(config, path)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"File not in project: {path}")
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+
+    try:
+        data.decode('utf-8')
+        media_type = "text/plain"
+    except UnicodeDecodeError:
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return Response(content=data, media_type=media_type)
+
+@app.get("/presets")
+async def list_presets():
+    return {"presets": presets.list()}
+
+@app.get("/presets/{name}")
+async def download_preset(name: str, project_name: Optional[str] = Query(None), package: Optional[str] = Query(None)):
+    """
+    Download a preset project ZIP, optionally with a different project name and package
+    """
+    try:
+        with builds.build():
+            config, archive = presets.archive(name, project_name=project_name, package=package)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown preset: {name}")
+    except ValueError as ve:
+        raise HTTPException(status_code=422, detail=str(ve))
+
+    return Response(
+        content=archive,
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={config.project.name}.zip"},
+    )
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "message": "Android Project Generator is running"}
+    return {
+        "status": "healthy",
+        "message": "Android Project Generator is running",
+        "cache": artifact_cache.stats(),
+        "prewarm": prewarmer.status(),
+        "layers": skeletons.layer_stats(),
+        "admission": {
+            "load": shedder.stats(),
+            "limits": {tier: limiter.stats() for tier, limiter in limiters.items()},
+        },
+    }
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Whether this instance should receive traffic: 503 until templates are loaded or once it is past a load threshold
+    """
+    status = readiness.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
 
 @app.get("/")
 async def health_check():
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic_core import PydanticCustomError
 from typing import List, Optional
 from models.enums import *
+from models.naming import locale_qualifier, module_package, property_name, table_name, HEX_COLOR, RESERVED_CLASSES, RESERVED_WORDS
 
 class ProjectInfo(BaseModel):
     name: str
@@ -13,11 +15,144 @@ class I18nConfig(BaseModel):
     enabled: bool
     languages: List[str]
 
+    @field_validator('languages')
+    @classmethod
+    def normalize_languages(cls, languages: List[str]) -> List[str]:
+        """Validate locale tags and convert them to Android resource qualifiers (pt-BR -> pt-rBR)"""
+        try:
+            return [locale_qualifier(language) for language in languages]
+        except ValueError as e:
+            raise PydanticCustomError('locale', str(e))
+
 class ThemeColors(BaseModel):
     primary: str
     secondary: str
     tertiary: str
 
+    @field_validator('primary', 'secondary', 'tertiary')
+    @classmethod
+    def check_color(cls, color: str) -> str:
+        """Seed colors are parsed by the palette engine and the launcher icon renderer"""
+        if not HEX_COLOR.match(color):
+            raise PydanticCustomError('color', "Invalid theme color; expected #RRGGBB or #AARRGGBB")
+        return color
+
+class BuildPerformance(BaseModel):
+    parallel: bool = True
+    buildCache: bool = True
+    configurationCache: bool = True
+    gradleDaemonHeap: str = Field(default="4g", pattern=r"^\d+[kKmMgG]$")
+    kotlinDaemonHeap: str = Field(default="2g", pattern=r"^\d+[kKmMgG]$")
+    useKsp: bool = True
+    nonTransitiveRClass: bool = True
+
+class MinifyConfig(BaseModel):
+    enabled: bool = True
+    fullMode: bool = False
+    shrinkResources: bool = True
+
+class FontOptions(BaseModel):
+    weights: List[FontWeight] = Field(default_factory=lambda: list(FontWeight), min_length=1)
+    subsets: List[FontSubset] = []
+
+class ModuleConfig(BaseModel):
+    path: str = Field(pattern=r"^(:[a-z][a-z0-9_-]*)+$")
+    type: ModuleType = ModuleType.android_library
+    dependencies: List[str] = []
+
+class RoomColumn(BaseModel):
+    name: str = Field(pattern=r"^[A-Za-z_][A-Za-z0-9_]*$")
+    type: ColumnType
+    nullable: bool = False
+    primaryKey: bool = False
+    autoGenerate: bool = False
+
+class RoomIndex(BaseModel):
+    columns: List[str] = Field(min_length=1)
+    unique: bool = False
+
+class RoomRelation(BaseModel):
+    column: str
+    entity: str
+    parentColumn: str
+    onDelete: ForeignKeyAction = ForeignKeyAction.no_action
+    onUpdate: ForeignKeyAction = ForeignKeyAction.no_action
+
+class RoomEntity(BaseModel):
+    name: str = Field(pattern=r"^[A-Z][A-Za-z0-9]*$")
+    tableName: Optional[str] = Field(default=None, pattern=r"^[A-Za-z_][A-Za-z0-9_]*$")
+    columns: List[RoomColumn] = Field(min_length=1)
+    indices: List[RoomIndex] = []
+    relations: List[RoomRelation] = []
+
+    @field_validator('columns')
+    @classmethod
+    def check_columns(cls, columns: List[RoomColumn]) -> List[RoomColumn]:
+        """Column and property names must be unique, with exactly one way of identifying a row"""
+        properties = set()
+        for column in columns:
+            prop = property_name(column.name)
+            if prop in RESERVED_WORDS or prop in properties:
+                raise PydanticCustomError('room_schema', 'Column {name} is reserved or duplicated', {'name': column.name})
+            properties.add(prop)
+        keys = [column for column in columns if column.primaryKey]
+        if not keys:
+            raise PydanticCustomError('room_schema', 'An entity needs at least one primary key column')
+        for column in keys:
+            if column.nullable:
+                raise PydanticCustomError('room_schema', 'Primary key {name} cannot be nullable', {'name': column.name})
+            if column.autoGenerate and (len(keys) > 1 or column.type not in (ColumnType.integer, ColumnType.long)):
+                raise PydanticCustomError(
+                    'room_schema', 'Only a single int or long primary key can be auto-generated ({name})',
+                    {'name': column.name},
+                )
+        return columns
+
+class RoomSchema(BaseModel):
+    databaseName: str = Field(default="AppDatabase", pattern=r"^[A-Z][A-Za-z0-9]*$")
+    version: int = Field(default=1, ge=1)
+    entities: List[RoomEntity] = Field(min_length=1)
+
+    @field_validator('entities')
+    @classmethod
+    def check_references(cls, entities: List[RoomEntity], info: ValidationInfo) -> List[RoomEntity]:
+        """Entity and table names must be unique and indices and relations must name existing columns"""
+        by_name = {}
+        unique_columns = {}
+        tables = set()
+        for entity in entities:
+            table = table_name(entity.name, entity.tableName).lower()
+            reserved = entity.name in RESERVED_CLASSES or entity.name.endswith('Dao')
+            if reserved or entity.name == info.data.get('databaseName'):
+                raise PydanticCustomError('room_schema', 'Entity name {name} is reserved', {'name': entity.name})
+            if entity.name in by_name or table in tables:
+                raise PydanticCustomError('room_schema', 'Duplicate entity {name}', {'name': entity.name})
+            by_name[entity.name] = {column.name for column in entity.columns}
+            keys = [column.name for column in entity.columns if column.primaryKey]
+            unique_columns[entity.name] = set(keys if len(keys) == 1 else ()) | {
+                index.columns[0] for index in entity.indices if index.unique and len(index.columns) == 1
+            }
+            tables.add(table)
+        for entity in entities:
+            columns = by_name[entity.name]
+            for index in entity.indices:
+                missing = next((column for column in index.columns if column not in columns), None)
+                if missing is not None:
+                    raise PydanticCustomError(
+                        'room_schema', 'Index of {entity} uses unknown column {column}',
+                        {'entity': entity.name, 'column': missing},
+                    )
+            for relation in entity.relations:
+                # SQLite only allows references to a column that identifies a single parent row
+                if relation.column not in columns or relation.parentColumn not in unique_columns.get(relation.entity, ()):
+                    raise PydanticCustomError(
+                        'room_schema',
+                        'Relation {entity}.{column} -> {parent}.{parent_column} must reference a unique column',
+                        {'entity': entity.name, 'column': relation.column, 'parent': relation.entity,
+                         'parent_column': relation.parentColumn},
+                    )
+        return entities
+
 class Configuration(BaseModel):
     projectName: str
     projectId: str
@@ -38,11 +173,87 @@ class Configuration(BaseModel):
     buildFormat: BuildFormat
     themeColors: ThemeColors
     fontName: FontName
+    fonts: Optional[FontOptions] = None
     navigation: Navigation
     useLibsVersionsToml: bool
+    buildPerformance: Optional[BuildPerformance] = None
+    minify: Optional[MinifyConfig] = None
+    benchmarkModule: Optional[BenchmarkModule] = None
+    modules: List[ModuleConfig] = []
+    roomSchema: Optional[RoomSchema] = None
+
+    @field_validator('roomSchema')
+    @classmethod
+    def check_room_enabled(cls, schema: Optional[RoomSchema], info: ValidationInfo) -> Optional[RoomSchema]:
+        """A Room schema only makes sense with the Room dependencies"""
+        if schema is not None and not info.data.get('enableRoom'):
+            raise PydanticCustomError('room_schema', 'roomSchema requires enableRoom')
+        return schema
+
+    @field_validator('modules')
+    @classmethod
+    def check_module_graph(cls, modules: List[ModuleConfig], info: ValidationInfo) -> List[ModuleConfig]:
+        """Module paths must be unique and dependencies must name other modules without forming a cycle"""
+        benchmark = info.data.get('benchmarkModule')
+        # build-logic is the included build holding the convention plugins
+        reserved = {':app', ':build-logic'} | ({f':{benchmark.value}'} if benchmark else set())
+        by_path = {}
+        by_package = {}
+        for module in modules:
+            if module.path in reserved:
+                raise PydanticCustomError('module_graph', 'Module path {path} is reserved', {'path': module.path})
+            if module.path in by_path:
+                raise PydanticCustomError('module_graph', 'Duplicate module {path}', {'path': module.path})
+            package = module_package(module.path)
+            keyword = next((segment for segment in package.split('.') if segment in RESERVED_WORDS), None)
+            if keyword is not None:
+                raise PydanticCustomError(
+                    'module_graph', 'Module path {path} uses the keyword {segment}, which cannot be a package name',
+                    {'path': module.path, 'segment': keyword},
+                )
+            if package in by_package:
+                raise PydanticCustomError(
+                    'module_graph', 'Modules {other} and {path} map to the same package',
+                    {'path': module.path, 'other': by_package[package]},
+                )
+            by_path[module.path] = module
+            by_package[package] = module.path
+        for module in modules:
+            for dependency in module.dependencies:
+                target = by_path.get(dependency)
+                if target is None or dependency == module.path:
+                    raise PydanticCustomError(
+                        'module_graph', 'Module {path} depends on unknown module {dependency}',
+                        {'path': module.path, 'dependency': dependency},
+                    )
+                if module.type == ModuleType.jvm_library and target.type == ModuleType.android_library:
+                    raise PydanticCustomError(
+                        'module_graph', 'JVM module {path} cannot depend on Android module {dependency}',
+                        {'path': module.path, 'dependency': dependency},
+                    )
+        # Depth-first search; a module met again while still on the stack closes a cycle
+        state = {}
+
+        def visit(path: str):
+            state[path] = 'visiting'
+            for dependency in by_path[path].dependencies:
+                if state.get(dependency) == 'visiting':
+                    raise PydanticCustomError('module_graph', 'Module dependency cycle through {path}', {'path': dependency})
+                if dependency not in state:
+                    visit(dependency)
+            state[path] = 'done'
+
+        for path in by_path:
+            if path not in state:
+                visit(path)
+        return modules
 
 class ProjectConfig(BaseModel):
     project: ProjectInfo
     configuration: Configuration
     generated_at: Optional[str] = None
     generator_version: Optional[str] = None
+
+class ConfigDiffRequest(BaseModel):
+    previous: ProjectConfig
+    current: ProjectConfig
@@ -50,6 +50,20 @@ class FontName(str, Enum):
     open_sans = "open sans"
     lato = "lato"
 
+class FontWeight(str, Enum):
+    light = "light"
+    regular = "regular"
+    medium = "medium"
+    semibold = "semibold"
+    bold = "bold"
+
+class FontSubset(str, Enum):
+    latin = "latin"
+    latin_ext = "latin-ext"
+    cyrillic = "cyrillic"
+    greek = "greek"
+    vietnamese = "vietnamese"
+
 class Navigation(str, Enum):
     compose = "compose-navigation"
     fragment = "jetpack-navigation"
@@ -62,4 +76,28 @@ class Permission(str, Enum):
     microphone = "microphone"
     contacts = "contacts"
     sms = "sms"
-    phone = "phone"
\ No newline at end of file
+    phone = "phone"
+
+class BenchmarkModule(str, Enum):
+    baselineprofile = "baselineprofile"
+    macrobenchmark = "macrobenchmark"
+
+class ModuleType(str, Enum):
+    android_library = "android-library"
+    jvm_library = "jvm-library"
+
+class ColumnType(str, Enum):
+    integer = "int"
+    long = "long"
+    real = "float"
+    double = "double"
+    boolean = "boolean"
+    text = "string"
+    blob = "bytes"
+
+class ForeignKeyAction(str, Enum):
+    no_action = "NO_ACTION"
+    restrict = "RESTRICT"
+    set_null = "SET_NULL"
+    set_default = "SET_DEFAULT"
+    cascade = "CASCADE"
@@ -0,0 +1,66 @@
+import re
+from typing import Optional
+
+# language[-Script][-Region] in BCP 47 (pt-BR, zh-Hans-CN, es-419), Android (pt-rBR, b+sr+Latn) or POSIX (pt_BR) form
+_LOCALE_TAG = re.compile(r'^([a-z]{2,3})(?:[-_+]([a-z]{4}))?(?:[-_+]r?([a-z]{2}|[0-9]{3}))?$', re.IGNORECASE)
+
+# Theme color as #RRGGBB or #AARRGGBB (alpha first, as Android writes it); group 1 is the RGB part
+HEX_COLOR = re.compile(r'^#(?:[0-9a-fA-F]{2})?([0-9a-fA-F]{6})$')
+
+# Kotlin hard keywords and Java keywords, which cannot be used as property names
+RESERVED_WORDS = frozenset((
+    '_', 'abstract', 'as', 'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const',
+    'continue', 'default', 'do', 'double', 'else', 'enum', 'extends', 'false', 'final', 'finally', 'float', 'for',
+    'fun', 'goto', 'if', 'implements', 'import', 'in', 'instanceof', 'int', 'interface', 'is', 'long', 'native',
+    'new', 'null', 'object', 'package', 'private', 'protected', 'public', 'return', 'short', 'static', 'strictfp',
+    'super', 'switch', 'synchronized', 'this', 'throw', 'throws', 'transient', 'true', 'try', 'typealias',
+    'typeof', 'val', 'var', 'void', 'volatile', 'when', 'while',
+))
+# Classes the generated entity, DAO and database files import, which entity names would shadow
+RESERVED_CLASSES = frozenset((
+    'ColumnInfo', 'Context', 'Dao', 'Database', 'Delete', 'Entity', 'Flow', 'ForeignKey', 'Index', 'Insert', 'List',
+    'NonNull', 'Nullable', 'OnConflictStrategy', 'PrimaryKey', 'Query', 'Room', 'RoomDatabase', 'Update', 'Upsert',
+))
+
+
+def locale_qualifier(tag: str) -> str:
+    """Android resource qualifier for a locale tag, e.g. fr, pt-BR -> pt-rBR, zh-Hans-CN -> b+zh+Hans+CN"""
+    text = tag.strip()
+    if text[:2].lower() == 'b+':
+        text = text[2:]
+    match = _LOCALE_TAG.match(text)
+    if match is None:
+        raise ValueError(f"Invalid locale {tag!r}; expected a language code such as fr, pt-BR or zh-Hans")
+    language, script, region = match.group(1).lower(), match.group(2), match.group(3)
+    # Scripts and numeric regions can only be expressed with the BCP 47 qualifier form
+    if script or (region and region.isdigit()):
+        parts = ['b', language] + ([script.title()] if script else []) + ([region.upper()] if region else [])
+        return '+'.join(parts)
+    if region:
+        return f'{language}-r{region.upper()}'
+    return language
+
+
+def property_name(column: str) -> str:
+    """Kotlin/Java property for a column name, e.g. team_id -> teamId"""
+    parts = [part for part in column.split('_') if part]
+    if not parts:
+        return column
+    return parts[0][0].lower() + parts[0][1:] + ''.join(part[0].upper() + part[1:] for part in parts[1:])
+
+
+def module_package(path: str) -> str:
+    """Package suffix of a Gradle module path, e.g. :core:data-source -> core.data_source"""
+    return '.'.join(segment.replace('-', '_') for segment in path.strip(':').split(':'))
+
+
+def table_name(entity: str, table: Optional[str] = None) -> str:
+    """Table of an entity: the configured name, or the entity name in snake case (UserAccount -> user_account)"""
+    return table or re.sub(r'(?<!^)(?=[A-Z])', '_', entity).lower()
+
+
+def class_name(text: str, prefix: str = 'App') -> str:
+    """PascalCase class name from free text, e.g. my-app -> MyApp, Bob's App -> BobsApp, 2048 Game -> App2048Game"""
+    words = (re.sub(r'[^A-Za-z0-9]', '', word) for word in re.split(r'[\s_-]+', text))
+    name = ''.join(word[0].upper() + word[1:] for word in words if word)
+    return name if name and not name[0].isdigit() else prefix + name
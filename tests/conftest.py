@@ -0,0 +1,71 @@
+import copy
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from models.config_model import ProjectConfig
+
+SAMPLE = {
+    'project': {'name': 'My App', 'package': 'com.example.myapp', 'minSdk': 24, 'targetSdk': 34, 'compileSdk': 34},
+    'configuration': {
+        'projectName': 'My App', 'projectId': 'com.example.myapp', 'uiToolkit': 'jetpack-compose',
+        'networking': 'retrofit', 'serialization': 'gson', 'dependencyInjection': 'hilt',
+        'localStorage': 'datastore', 'enableRoom': True, 'uiTheme': 'material3', 'permissions': ['camera', 'internet'],
+        'internationalization': {'enabled': True, 'languages': ['en', 'fr', 'de']},
+        'lightDark': True, 'httpNetworking': True, 'viewBinding': False, 'language': 'kotlin',
+        'javaVersion': '17', 'buildFormat': 'kts', 'fontName': 'roboto',
+        'themeColors': {'primary': '#6750A4', 'secondary': '#625B71', 'tertiary': '#7D5260'},
+        'navigation': 'compose-navigation', 'useLibsVersionsToml': True,
+    },
+}
+
+
+@pytest.fixture
+def config_data() -> dict:
+    """A fresh copy of the sample request body, safe to modify"""
+    return copy.deepcopy(SAMPLE)
+
+
+@pytest.fixture
+def make_config(config_data):
+    """Build a ProjectConfig from the sample with configuration fields replaced"""
+    def make(**configuration) -> ProjectConfig:
+        data = copy.deepcopy(config_data)
+        data['configuration'].update(configuration)
+        return ProjectConfig(**data)
+    return make
+
+
+@pytest.fixture
+def validation_error(make_config):
+    """The single validation error a configuration with the given fields produces"""
+    def error(**configuration) -> dict:
+        with pytest.raises(ValidationError) as info:
+            make_config(**configuration)
+        errors = info.value.errors()
+        assert len(errors) == 1
+        return errors[0]
+    return error
+
+
+@pytest.fixture(scope='session')
+def client(tmp_path_factory):
+    """TestClient for the app, with the popularity file in a temp dir and build rate limiting off"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('POPULARITY_FILE', str(tmp_path_factory.mktemp('popularity') / 'popularity.json'))
+        mp.setenv('RATE_LIMIT_EXPENSIVE_PER_MINUTE', '0')
+        import main
+        yield TestClient(main.app)
+
+
+@pytest.fixture
+def generate(client):
+    """POST a config (and optionally an OpenAPI document) to /generate"""
+    def post(data: dict, openapi: dict = None, **kwargs):
+        files = {'file': ('config.json', json.dumps(data))}
+        if openapi is not None:
+            files['openapi'] = ('api.json', json.dumps(openapi))
+        return client.post('/generate', files=files, **kwargs)
+    return post
@@ -0,0 +1,103 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from generator.admission import (
+    CHEAP, EXPENSIVE, AdmissionMiddleware, LoadShedder, RateLimiter, client_identity, load_api_keys, request_tier,
+)
+
+
+def scope(address: str = '10.0.0.1', key: bytes = None) -> dict:
+    headers = [(b'x-api-key', key)] if key is not None else []
+    return {'type': 'http', 'client': (address, 1234), 'headers': headers}
+
+
+@pytest.mark.parametrize('method, path, tier', [
+    ('POST', '/generate', EXPENSIVE),
+    ('POST', '/generate/', EXPENSIVE),
+    ('POST', '/generate/diff', EXPENSIVE),
+    ('GET', '/presets/minimal', EXPENSIVE),
+    ('GET', '/presets', CHEAP),
+    ('POST', '/preview', CHEAP),
+])
+def test_request_tier(method, path, tier):
+    assert request_tier(method, path) == tier
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=1.0, burst=2)
+    assert limiter.acquire('a', now=0.0) == 0
+    assert limiter.acquire('a', now=0.0) == 0
+    assert limiter.acquire('a', now=0.0) == pytest.approx(1.0)
+    # Other clients have a budget of their own, and tokens refill at rate
+    assert limiter.acquire('b', now=0.0) == 0
+    assert limiter.acquire('a', now=1.5) == 0
+    assert limiter.stats()['limited'] == 1
+    assert RateLimiter(rate=0, burst=0).acquire('a') == 0
+
+
+def test_rate_limiter_forgets_oldest():
+    limiter = RateLimiter(rate=1.0, burst=1, max_clients=2)
+    for client in 'abc':
+        limiter.acquire(client, now=0.0)
+    assert limiter.stats()['clients'] == 2
+    assert limiter.acquire('a', now=0.0) == 0
+
+
+def test_load_shedder():
+    shedder = LoadShedder(max_delay=1.0, smoothing=1.0)
+    assert shedder.retry_after() == 0
+    shedder.record(2.5)
+    assert shedder.overloaded and shedder.retry_after() == 3
+    shedder.record(0.1)
+    assert shedder.retry_after() == 0
+    assert shedder.stats()['shed'] == 1
+    assert not LoadShedder(max_delay=0).overloaded
+
+
+def test_client_identity(tmp_path):
+    keys_file = tmp_path / 'keys'
+    keys_file.write_text('file-key  # ops\n\n')
+    keys = load_api_keys(['good-key', ' '], str(keys_file))
+    assert len(keys) == 2
+    assert client_identity(scope()) == 'ip:10.0.0.1'
+    assert client_identity(scope(key=b'good-key'), keys).startswith('key:')
+    assert client_identity(scope(key=b'file-key'), keys) == client_identity(scope('10.0.0.2', b'file-key'), keys)
+    # Unknown keys, and any key when none are configured, fall back to the address
+    assert client_identity(scope(key=b'other'), keys) == 'ip:10.0.0.1'
+    assert client_identity(scope(key=b'good-key')) == 'ip:10.0.0.1'
+
+
+def test_rate_limited_is_429(generate, config_data, monkeypatch):
+    import main
+    monkeypatch.setitem(main.limiters, EXPENSIVE, RateLimiter(rate=1 / 60, burst=1))
+    assert generate(config_data).status_code == 200
+    response = generate(config_data)
+    assert response.status_code == 429
+    assert 55 <= int(response.headers['retry-after']) <= 60
+    assert response.json() == {'detail': 'Rate limit exceeded'}
+
+
+def test_api_key_has_own_budget():
+    app = FastAPI()
+    app.post('/generate')(lambda: {})
+    limiters = {tier: RateLimiter(rate=1 / 60, burst=1) for tier in (CHEAP, EXPENSIVE)}
+    app.add_middleware(AdmissionMiddleware, limiters=limiters, shedder=LoadShedder(max_delay=0),
+                       api_keys=load_api_keys(['secret']))
+    client = TestClient(app)
+    assert client.post('/generate').status_code == 200
+    assert client.post('/generate', headers={'X-API-Key': 'secret'}).status_code == 200
+    assert client.post('/generate', headers={'X-API-Key': 'guess'}).status_code == 429
+    assert client.post('/generate', headers={'X-API-Key': 'secret'}).status_code == 429
+
+
+def test_overloaded_is_503(client, generate, config_data, monkeypatch):
+    import main
+    monkeypatch.setattr(main.shedder, 'delay', main.shedder.max_delay + 1.5)
+    response = generate(config_data)
+    assert response.status_code == 503
+    assert int(response.headers['retry-after']) == main.shedder.retry_after()
+    assert response.json() == {'detail': 'Server is overloaded, retry later'}
+    # Only expensive requests are shed, and probes are never limited
+    assert client.get('/presets').status_code == 200
+    assert client.get('/health').status_code == 200
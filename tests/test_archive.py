@@ -0,0 +1,86 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from generator.archive import ArchiveFormat, TarFormat, ZipEntry, available_formats, negotiate_format
+
+ENTRIES = [('MyApp/README.md', b'# My App\n'), ('MyApp/app/src/main/AndroidManifest.xml', b'<manifest/>\n')]
+
+
+@pytest.mark.parametrize('accept, expected', [
+    (None, 'zip'),
+    ('', 'zip'),
+    ('*/*', 'zip'),
+    ('application/json', 'zip'),
+    ('text/html, application/xhtml+xml', 'zip'),
+    ('application/zip', 'zip'),
+    ('application/gzip', 'tar.gz'),
+    ('application/x-gzip, application/zip;q=0.5', 'tar.gz'),
+    ('application/zip;q=0.5, application/gzip', 'tar.gz'),
+    ('application/gzip;q=0, application/zip', 'zip'),
+    ('*/*, application/gzip', 'zip'),
+])
+def test_accept(accept, expected):
+    assert negotiate_format(accept).name == expected
+
+
+def test_explicit_name_wins():
+    assert negotiate_format('application/gzip', 'zip').name == 'zip'
+
+
+@pytest.mark.parametrize('name', ['rar', '7z', 'ZIP'])
+def test_unsupported_name(name):
+    assert negotiate_format('application/zip', name) is None
+
+
+def test_invalid_level():
+    with pytest.raises(ValueError):
+        negotiate_format(None, 'zip', 42)
+
+
+def test_formats_are_abstract():
+    with pytest.raises(TypeError):
+        ArchiveFormat()
+    with pytest.raises(TypeError):
+        TarFormat()
+
+
+@pytest.mark.parametrize('name', available_formats())
+def test_round_trip(name):
+    archive = negotiate_format(None, name).write(ZipEntry.from_bytes(path, data) for path, data in ENTRIES)
+    if name == 'zip':
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            assert [(info.filename, zf.read(info)) for info in zf.infolist()] == ENTRIES
+    elif name == 'tar.gz':
+        with tarfile.open(fileobj=io.BytesIO(archive), mode='r:gz') as tf:
+            assert [(member.name, tf.extractfile(member).read()) for member in tf.getmembers()] == ENTRIES
+    else:
+        import zstandard
+        raw = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(archive)).read()
+        with tarfile.open(fileobj=io.BytesIO(raw), mode='r:') as tf:
+            assert [(member.name, tf.extractfile(member).read()) for member in tf.getmembers()] == ENTRIES
+
+
+def test_accept_without_archive_type_gets_zip(generate, config_data):
+    response = generate(config_data, headers={'Accept': 'application/json'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/zip'
+    assert zipfile.ZipFile(io.BytesIO(response.content)).testzip() is None
+
+
+def test_accept_gzip(generate, config_data):
+    response = generate(config_data, headers={'Accept': 'application/gzip'})
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/gzip'
+
+
+def test_unsupported_format_is_406(generate, config_data):
+    response = generate(config_data, params={'format': 'rar'})
+    assert response.status_code == 406
+    assert "'rar'" in response.json()['detail']
+
+
+def test_invalid_level_is_422(generate, config_data):
+    assert generate(config_data, params={'format': 'zip', 'level': 42}).status_code == 422
@@ -0,0 +1,52 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from generator.skeleton import SkeletonEngine
+
+SCRIPTS = {'kts': '.kts', 'gradle': ''}
+
+
+def render(make_config, module, build_format='kts', language='kotlin'):
+    config = make_config(
+        benchmarkModule=module, buildFormat=build_format, language=language,
+        uiToolkit='jetpack-compose' if language == 'kotlin' else 'xml',
+    )
+    return config, AndroidProjectBuilder(config).render_files()
+
+
+@pytest.mark.parametrize('module', ['baselineprofile', 'macrobenchmark'])
+@pytest.mark.parametrize('build_format', SCRIPTS)
+def test_module_scaffolding(make_config, module, build_format):
+    _, files = render(make_config, module, build_format)
+    suffix = SCRIPTS[build_format]
+    sources = f'MyApp/{module}/src/main/kotlin/com/example/myapp/{module}'
+    for path in (f'MyApp/{module}/build.gradle{suffix}', f'MyApp/{module}/src/main/AndroidManifest.xml',
+                 f'{sources}/StartupBenchmark.kt', f'{sources}/BaselineProfileGenerator.kt'):
+        assert path in files
+    script = files[f'MyApp/{module}/build.gradle{suffix}'].decode()
+    assert 'targetProjectPath' in script and ':app' in script
+    assert f'com.example.myapp.{module}' in script
+    assert module in files[f'MyApp/settings.gradle{suffix}'].decode()
+
+
+@pytest.mark.parametrize('build_format', SCRIPTS)
+def test_app_wiring(make_config, build_format):
+    _, files = render(make_config, 'baselineprofile', build_format)
+    app = files[f'MyApp/app/build.gradle{SCRIPTS[build_format]}'].decode()
+    assert 'profileinstaller' in app
+    assert 'baselineprofile' in app.split('android {')[0]
+    assert ':baselineprofile' in app.split('dependencies {')[1]
+    assert '<profileable' in files['MyApp/app/src/main/AndroidManifest.xml'].decode()
+
+
+def test_no_module_by_default(make_config):
+    files = AndroidProjectBuilder(make_config()).render_files()
+    assert not any('/baselineprofile/' in path or '/macrobenchmark/' in path for path in files)
+    assert 'profileinstaller' not in files['MyApp/app/build.gradle.kts'].decode()
+    assert '<profileable' not in files['MyApp/app/src/main/AndroidManifest.xml'].decode()
+
+
+def test_java_app_gets_kotlin_benchmarks(make_config):
+    config, files = render(make_config, 'baselineprofile', 'gradle', 'java')
+    assert 'MyApp/baselineprofile/src/main/kotlin/com/example/myapp/baselineprofile/StartupBenchmark.kt' in files
+    assert SkeletonEngine().render_files(config) == files
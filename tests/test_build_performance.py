@@ -0,0 +1,93 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from models.config_model import ProjectConfig
+
+FORMATS = {'gradle': '', 'kts': '.kts'}
+
+
+def render(build_format: str, language: str = 'kotlin', **performance):
+    """Render the Gradle files of a Hilt + Room project with the given buildPerformance options"""
+    config = ProjectConfig(**{
+        'project': {'name': 'My App', 'package': 'com.example.myapp', 'minSdk': 24, 'targetSdk': 34, 'compileSdk': 34},
+        'configuration': {
+            'projectName': 'My App', 'projectId': 'com.example.myapp', 'uiToolkit': 'jetpack-compose',
+            'networking': 'retrofit', 'serialization': 'gson', 'dependencyInjection': 'hilt',
+            'localStorage': 'datastore', 'enableRoom': True, 'uiTheme': 'material3', 'permissions': ['internet'],
+            'internationalization': {'enabled': False, 'languages': []},
+            'lightDark': True, 'httpNetworking': True, 'viewBinding': False, 'language': language,
+            'javaVersion': '17', 'buildFormat': build_format, 'fontName': 'roboto',
+            'themeColors': {'primary': '#6750A4', 'secondary': '#625B71', 'tertiary': '#7D5260'},
+            'navigation': 'compose-navigation', 'useLibsVersionsToml': True, 'buildPerformance': performance,
+        },
+    })
+    files = AndroidProjectBuilder(config).render_files()
+    suffix = FORMATS[build_format]
+    return (
+        files['MyApp/gradle.properties'].decode(),
+        files[f'MyApp/build.gradle{suffix}'].decode(),
+        files[f'MyApp/app/build.gradle{suffix}'].decode(),
+    )
+
+
+def properties(text: str) -> dict:
+    return dict(line.split('=', 1) for line in text.splitlines() if line and not line.startswith('#'))
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_defaults(build_format):
+    props = properties(render(build_format)[0])
+    assert props['org.gradle.jvmargs'] == '-Xmx4g -XX:+UseParallelGC -Dfile.encoding=UTF-8'
+    assert props['kotlin.daemon.jvmargs'] == '-Xmx2g'
+    assert props['org.gradle.parallel'] == 'true'
+    assert props['org.gradle.caching'] == 'true'
+    assert props['org.gradle.configuration-cache'] == 'true'
+    assert props['android.nonTransitiveRClass'] == 'true'
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+@pytest.mark.parametrize('option, key', [
+    ('parallel', 'org.gradle.parallel'),
+    ('buildCache', 'org.gradle.caching'),
+    ('configurationCache', 'org.gradle.configuration-cache'),
+])
+def test_switches_off(build_format, option, key):
+    props = properties(render(build_format, **{option: False})[0])
+    assert key not in props
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_heaps(build_format):
+    props = properties(render(build_format, gradleDaemonHeap='6g', kotlinDaemonHeap='1536m')[0])
+    assert props['org.gradle.jvmargs'].startswith('-Xmx6g ')
+    assert props['kotlin.daemon.jvmargs'] == '-Xmx1536m'
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_transitive_r_class(build_format):
+    props = properties(render(build_format, nonTransitiveRClass=False)[0])
+    assert props['android.nonTransitiveRClass'] == 'false'
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_ksp(build_format):
+    _, root, app = render(build_format, useKsp=True)
+    for script in (root, app):
+        assert 'ksp' in script
+        assert 'kapt' not in script.lower()
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_kapt(build_format):
+    _, root, app = render(build_format, useKsp=False)
+    for script in (root, app):
+        assert 'ksp' not in script
+        assert 'kapt' in script.lower()
+    assert 'kapt(libs.hilt.compiler)' in app or "kapt 'com.google.dagger:hilt-compiler" in app
+
+
+@pytest.mark.parametrize('build_format', FORMATS)
+def test_java_uses_annotation_processor(build_format):
+    _, root, app = render(build_format, language='java', useKsp=True)
+    assert 'annotationProcessor' in app
+    assert 'ksp' not in app and 'kapt' not in app.lower()
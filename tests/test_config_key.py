@@ -0,0 +1,64 @@
+import pytest
+
+from generator.config_key import ConfigKey, config_key
+from models.config_model import ProjectConfig
+
+
+def test_round_trip(make_config):
+    config = make_config(modules=[{'path': ':core:data'}], minify={'enabled': True})
+    again = ProjectConfig(**config.model_dump(mode='json'))
+    assert ConfigKey(again) == ConfigKey(config)
+    assert hash(ConfigKey(again)) == hash(ConfigKey(config))
+    assert config_key(again) == config_key(config)
+
+
+def test_digest_format(make_config):
+    key = config_key(make_config())
+    assert key.startswith('v1.')
+    assert len(key) == 3 + 22
+    assert str(ConfigKey(make_config())) == key
+
+
+def test_order_of_sets_is_ignored(make_config):
+    a = make_config(permissions=['camera', 'internet'],
+                    internationalization={'enabled': True, 'languages': ['fr', 'de']})
+    b = make_config(permissions=['internet', 'camera'],
+                    internationalization={'enabled': True, 'languages': ['de', 'fr', 'fr']})
+    assert config_key(a) == config_key(b)
+
+
+@pytest.mark.parametrize('configuration', [
+    {'uiToolkit': 'xml'},
+    {'language': 'java'},
+    {'enableRoom': False},
+    {'permissions': ['camera']},
+    {'fontName': 'inter'},
+    {'projectName': 'Other'},
+    {'themeColors': {'primary': '#000000', 'secondary': '#625B71', 'tertiary': '#7D5260'}},
+    {'internationalization': {'enabled': False, 'languages': ['en', 'fr', 'de']}},
+    {'buildPerformance': {}},
+    {'modules': [{'path': ':core:data'}]},
+])
+def test_every_field_takes_part(make_config, configuration):
+    assert config_key(make_config(**configuration)) != config_key(make_config())
+
+
+def test_free_text_cannot_collide(config_data):
+    a, b = config_data, {**config_data, 'project': dict(config_data['project'])}
+    a['project'].update(name='ab', package='c.d')
+    b['project'].update(name='a', package='bc.d')
+    assert config_key(ProjectConfig(**a)) != config_key(ProjectConfig(**b))
+
+
+@pytest.mark.parametrize('sdk', [70000, -1])
+def test_out_of_range_sdk(config_data, sdk):
+    config_data['project']['minSdk'] = sdk
+    with pytest.raises(ValueError, match='does not fit in 16 bits'):
+        ConfigKey(ProjectConfig(**config_data))
+
+
+def test_out_of_range_sdk_is_422(generate, config_data):
+    config_data['project']['compileSdk'] = 1 << 16
+    response = generate(config_data)
+    assert response.status_code == 422
+    assert 'compileSdk' in response.json()['detail']
@@ -0,0 +1,88 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+from generator.diff import PATCH_MANIFEST, diff_projects
+from generator.skeleton import SkeletonEngine
+from models.config_model import ProjectConfig
+
+CHANGES = [
+    {'themeColors': {'primary': '#123456', 'secondary': '#625B71', 'tertiary': '#7D5260'}},
+    {'projectId': 'com.other.id'},
+    {'projectName': 'Other Title'},
+    {'uiToolkit': 'xml'},
+    {'language': 'java', 'uiToolkit': 'xml'},
+    {'enableRoom': False},
+    {'internationalization': {'enabled': True, 'languages': ['en', 'fr', 'es']}},
+    {'modules': [{'path': ':core:data'}]},
+    {'benchmarkModule': 'baselineprofile'},
+]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return SkeletonEngine()
+
+
+def full_diff(old: dict, new: dict):
+    """(added, modified, deleted) from comparing two full renders"""
+    added = {path: data for path, data in new.items() if path not in old}
+    modified = {path: data for path, data in new.items() if path in old and old[path] != data}
+    deleted = sorted(path for path in old if path not in new)
+    return added, modified, deleted
+
+
+@pytest.mark.parametrize('changes', CHANGES)
+def test_matches_full_renders(engine, make_config, changes):
+    previous, current = make_config(), make_config(**changes)
+    diff = diff_projects(engine, previous, current)
+    old, new = engine.render_files(previous), engine.render_files(current)
+    added, modified, deleted = full_diff(old, new)
+    assert diff.added == added
+    assert diff.modified == modified
+    assert sorted(diff.deleted) == deleted
+    assert diff.old == {path: old[path] for path in modified}
+
+
+def test_renamed_project(engine, make_config, config_data):
+    previous = make_config()
+    config_data['project']['name'] = 'Other App'
+    current = ProjectConfig(**config_data)
+    diff = diff_projects(engine, previous, current)
+    # The project directory is named after the project, so every path moves
+    assert set(diff.added) == set(engine.render_files(current))
+    assert set(diff.deleted) == set(engine.render_files(previous))
+
+
+def test_identical_configs(engine, make_config):
+    diff = diff_projects(engine, make_config(), make_config())
+    assert diff.manifest() == {'added': [], 'modified': [], 'deleted': []}
+
+
+def test_unified_deleted_content(engine, make_config):
+    previous, current = make_config(), make_config(enableRoom=False)
+    diff = diff_projects(engine, previous, current, with_deleted_content=True)
+    old = engine.render_files(previous)
+    for path in diff.deleted:
+        assert diff.old[path] == old[path]
+        assert f'diff --git a/{path} b/{path}\ndeleted file mode 100644\n' in diff.to_unified()
+
+
+def test_archive(engine, make_config):
+    diff = diff_projects(engine, make_config(), make_config(uiToolkit='xml'))
+    with zipfile.ZipFile(io.BytesIO(diff.to_archive())) as zf:
+        files = {name: zf.read(name) for name in zf.namelist()}
+    assert json.loads(files.pop(PATCH_MANIFEST)) == diff.manifest()
+    assert files == {**diff.added, **diff.modified}
+
+
+def test_endpoint(client, config_data):
+    current = json.loads(json.dumps(config_data))
+    current['configuration']['themeColors']['primary'] = '#123456'
+    response = client.post('/generate/diff', params={'format': 'diff'},
+                           json={'previous': config_data, 'current': current})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/x-diff')
+    assert '-val Primary = Color(0xFF6750A4)\n+val Primary = Color(0xFF123456)\n' in response.text
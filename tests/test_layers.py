@@ -0,0 +1,55 @@
+import io
+import zipfile
+
+import pytest
+
+from generator.archive import ZipEntry, ZipLayer, write_zip
+from generator.builder import AndroidProjectBuilder
+from generator.skeleton import SkeletonEngine
+
+TIMESTAMP = 1700000000.0
+
+
+def unzip(data: bytes):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None
+        return {info.filename: (zf.read(info), info.CRC, info.compress_type) for info in zf.infolist()}
+
+
+def entries(count: int, level: int = 6):
+    return [ZipEntry.from_bytes(f'dir/file{i}.txt', f'content {i}\n'.encode() * (i + 1), level) for i in range(count)]
+
+
+@pytest.mark.parametrize('split', [0, 1, 3, 5])
+@pytest.mark.parametrize('level', [0, 6])
+def test_layer_is_byte_identical(split, level):
+    members = entries(5, level)
+    layer = ZipLayer.build(members[:split], TIMESTAMP)
+    assert write_zip(members[split:], TIMESTAMP, base=layer) == write_zip(members, TIMESTAMP)
+    assert layer.count == split and layer.names == {entry.name for entry in members[:split]}
+
+
+def test_layer_is_reusable():
+    members = entries(4)
+    layer = ZipLayer.build(members[:2], TIMESTAMP)
+    first = write_zip(members[2:3], TIMESTAMP, base=layer)
+    second = write_zip(members[3:], TIMESTAMP, base=layer)
+    assert list(unzip(first)) == [entry.name for entry in members[:3]]
+    assert list(unzip(second)) == [entry.name for entry in members[:2] + members[3:]]
+
+
+@pytest.mark.parametrize('changes', [
+    {},
+    {'projectName': 'Other Title'},
+    {'themeColors': {'primary': '#123456', 'secondary': '#625B71', 'tertiary': '#7D5260'}},
+    {'language': 'java', 'uiToolkit': 'xml'},
+])
+def test_engine_matches_unlayered(make_config, changes):
+    engine = SkeletonEngine()
+    # The first build caches the constant layer; the second must still match when it is reused
+    engine.build_bytes(make_config())
+    config = make_config(**changes)
+    layered = engine.build_bytes(config)
+    assert engine._layers
+    assert unzip(layered) == unzip(write_zip(engine.render_entries(config)))
+    assert unzip(layered) == unzip(AndroidProjectBuilder(config).build_bytes())
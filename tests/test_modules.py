@@ -0,0 +1,46 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+
+
+def test_module_graph(make_config):
+    config = make_config(modules=[
+        {'path': ':core:common', 'type': 'jvm-library'},
+        {'path': ':core:data', 'dependencies': [':core:common']},
+        {'path': ':feature:home', 'dependencies': [':core:data', ':core:common']},
+    ])
+    assert [module.path for module in config.configuration.modules] == [':core:common', ':core:data', ':feature:home']
+
+
+@pytest.mark.parametrize('modules, message', [
+    ([{'path': ':a', 'dependencies': [':b']}, {'path': ':b', 'dependencies': [':a']}], 'cycle'),
+    ([{'path': ':a', 'dependencies': [':b']}, {'path': ':b', 'dependencies': [':c']},
+      {'path': ':c', 'dependencies': [':a']}], 'cycle'),
+    ([{'path': ':a', 'dependencies': [':a']}], 'unknown module'),
+    ([{'path': ':a', 'dependencies': [':missing']}], 'unknown module'),
+    ([{'path': ':a'}, {'path': ':a'}], 'Duplicate'),
+    ([{'path': ':app'}], 'reserved'),
+    ([{'path': ':build-logic'}], 'reserved'),
+    ([{'path': ':core:object'}], 'keyword object'),
+    ([{'path': ':core:in'}], 'keyword in'),
+    ([{'path': ':feature:new'}], 'keyword new'),
+    ([{'path': ':core-data'}, {'path': ':core_data'}], 'same package'),
+    ([{'path': ':a', 'type': 'jvm-library', 'dependencies': [':b']}, {'path': ':b'}], 'JVM module'),
+])
+def test_invalid_module_graph(validation_error, modules, message):
+    found = validation_error(modules=modules)
+    assert found['type'] == 'module_graph'
+    assert message in found['msg']
+
+
+def test_benchmark_module_path_reserved(validation_error):
+    found = validation_error(benchmarkModule='baselineprofile', modules=[{'path': ':baselineprofile'}])
+    assert 'reserved' in found['msg']
+
+
+def test_module_namespaces(make_config):
+    config = make_config(modules=[{'path': ':core:data-source'}, {'path': ':feature:home'}])
+    files = AndroidProjectBuilder(config).render_files()
+    assert 'MyApp/core/data-source/build.gradle.kts' in files
+    assert any(path.startswith('MyApp/core/data-source/src/main/kotlin/com/example/myapp/core/data_source/')
+               for path in files)
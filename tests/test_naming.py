@@ -0,0 +1,37 @@
+import pytest
+
+from models.naming import locale_qualifier
+
+
+@pytest.mark.parametrize('tag, qualifier', [
+    ('fr', 'fr'),
+    ('FR', 'fr'),
+    ('pt-BR', 'pt-rBR'),
+    ('pt_br', 'pt-rBR'),
+    ('pt-rBR', 'pt-rBR'),
+    ('es-419', 'b+es+419'),
+    ('zh-Hans', 'b+zh+Hans'),
+    ('zh-hans-cn', 'b+zh+Hans+CN'),
+    ('b+sr+Latn', 'b+sr+Latn'),
+    ('fil', 'fil'),
+    (' de ', 'de'),
+])
+def test_locale_qualifier(tag, qualifier):
+    assert locale_qualifier(tag) == qualifier
+
+
+@pytest.mark.parametrize('tag', ['', 'english', 'e', 'pt-BRA', 'zh-Hans-CN-x', 'en/US'])
+def test_invalid_locale(tag):
+    with pytest.raises(ValueError):
+        locale_qualifier(tag)
+
+
+def test_languages_normalized(make_config):
+    config = make_config(internationalization={'enabled': True, 'languages': ['pt_BR', 'zh-Hans', 'fr']})
+    assert config.configuration.internationalization.languages == ['pt-rBR', 'b+zh+Hans', 'fr']
+
+
+def test_invalid_language(validation_error):
+    found = validation_error(internationalization={'enabled': True, 'languages': ['english']})
+    assert found['type'] == 'locale'
+    assert found['loc'] == ('configuration', 'internationalization', 'languages')
@@ -0,0 +1,158 @@
+import io
+import json
+import re
+
+import pytest
+
+from generator.openapi import ApiGenerator, ApiSpec, _string_literal, load_openapi
+
+SPEC = {
+    'openapi': '3.0.0',
+    'servers': [{'url': 'https://api.example.com/$v"1'}],
+    'paths': {
+        '/items/{id}/$x"': {'get': {
+            'operationId': 'getItem',
+            'parameters': [
+                {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}},
+                {'name': 'say "hi"', 'in': 'query', 'schema': {'type': 'string'}},
+                {'name': '$filter\\', 'in': 'header', 'schema': {'type': 'string'}},
+            ],
+            'responses': {'200': {'description': '', 'content': {'application/json': {'schema': {
+                'type': 'object', 'properties': {'$type': {'type': 'string'}, 'say "hi"': {'type': 'integer'}},
+            }}}}},
+        }},
+    },
+}
+
+
+def generate(make_config, spec: dict, **configuration) -> dict:
+    return ApiGenerator(ApiSpec(spec), make_config(**configuration)).files()
+
+
+@pytest.mark.parametrize('text, kotlin, java', [
+    ('plain', '"plain"', '"plain"'),
+    ('say "hi"', r'"say \"hi\""', r'"say \"hi\""'),
+    ('a\\b', r'"a\\b"', r'"a\\b"'),
+    ('$filter', r'"\$filter"', '"$filter"'),
+    ('${x}', r'"\${x}"', '"${x}"'),
+    ('line\nbreak\ttab\r', r'"line\nbreak\ttab\r"', r'"line\nbreak\ttab\r"'),
+    ('bell\x07', r'"bell\u0007"', r'"bell\007"'),
+])
+def test_string_literal(text, kotlin, java):
+    assert _string_literal(text, kotlin=True) == kotlin
+    assert _string_literal(text, kotlin=False) == java
+
+
+@pytest.mark.parametrize('networking', ['retrofit', 'ktor'])
+def test_kotlin_escaping(make_config, networking):
+    files = generate(make_config, SPEC, networking=networking)
+    assert 'const val BASE_URL = "https://api.example.com/\\$v\\"1/"' in files['ApiClient.kt']
+    service = files['api/DefaultApi.kt']
+    assert '"say \\"hi\\""' in service
+    assert '"\\$filter\\\\"' in service
+    model = files['model/GetItemResponse.kt']
+    assert '@SerializedName("\\$type")' in model
+    assert '@SerializedName("say \\"hi\\"")' in model
+
+
+def test_java_escaping(make_config):
+    files = generate(make_config, SPEC, language='java', uiToolkit='xml')
+    assert 'public static final String BASE_URL = "https://api.example.com/$v\\"1/";' in files['ApiClient.java']
+    service = files['api/DefaultApi.java']
+    assert '@GET("items/{id}/$x\\"")' in service
+    assert '@Query("say \\"hi\\"") String sayHi' in service
+    assert '@Header("$filter\\\\") String filter' in service
+
+
+def test_server_variables(make_config):
+    spec = {'openapi': '3.0.0', 'servers': [{'url': 'https://{host}/api', 'variables': {'host': {'default': 'a.io'}}}]}
+    assert 'BASE_URL = "https://a.io/api/"' in generate(make_config, spec)['ApiClient.kt']
+
+
+def test_no_paths(make_config):
+    assert sorted(generate(make_config, {'openapi': '3.1.0'})) == ['ApiClient.kt']
+
+
+def test_path_level_parameters_merged(make_config):
+    spec = {'openapi': '3.0.0', 'paths': {'/a/{id}': {
+        'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+        'get': {'operationId': 'getA', 'responses': {'204': {'description': ''}}},
+    }}}
+    assert '@Path("id") id: Int' in generate(make_config, spec)['api/DefaultApi.kt']
+
+
+@pytest.mark.parametrize('spec, message', [
+    ({'servers': {}}, 'Expected an array at #/servers'),
+    ({'servers': ['x']}, 'Expected an object at #/servers/0'),
+    ({'servers': [{'url': 5}]}, 'Expected a string at #/servers/0/url'),
+    ({'servers': [{'url': '/{v}', 'variables': {'v': 3}}]}, 'Expected an object at #/servers/0/variables/v'),
+    ({'paths': []}, 'Expected an object at #/paths'),
+    ({'paths': {'/a': 'x'}}, 'Expected an object at #/paths/~1a'),
+    ({'paths': {'/a': {'parameters': 'x', 'get': {'responses': {}}}}}, 'Expected an array at #/paths/~1a/parameters'),
+    ({'paths': {'/a': {'get': 'x'}}}, 'Expected an object at #/paths/~1a/get'),
+    ({'paths': {'/a': {'get': {'tags': 'x', 'responses': {}}}}}, 'Expected an array at #/paths/~1a/get/tags'),
+    ({'paths': {'/a/{b}': {'get': {'parameters': [{'in': 'query'}], 'responses': {}}}}},
+     'Parameter at #/paths/~1a~1{b}/get/parameters/0 needs a name'),
+    ({'paths': {'/a~b': {'get': {'parameters': [5], 'responses': {}}}}},
+     'Expected an object at #/paths/~1a~0b/get/parameters/0'),
+    ({'paths': {'/a': {'get': {'responses': []}}}}, 'Expected an object at #/paths/~1a/get/responses'),
+    ({'paths': {'/a': {'get': {'responses': {'200': 5}}}}}, 'Expected an object at #/paths/~1a/get/responses/200'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'content': {'application/json': 1}}}}}}},
+     'Expected an object at #/paths/~1a/get/responses/200/content/application~1json'),
+    ({'paths': {'/a': {'post': {'requestBody': [], 'responses': {}}}}},
+     'Expected an object at #/paths/~1a/post/requestBody'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'content': {'application/json': {'schema': {
+        'type': 'object', 'properties': [1]}}}}}}}}}, 'properties must be an object'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'content': {'application/json': {'schema': {
+        'allOf': [1]}}}}}}}}}, 'allOf must be an array of objects'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'content': {'application/json': {'schema': {
+        'type': 'object', 'properties': {'a': {}}, 'required': [{}]}}}}}}}}}, 'required an array of names'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'$ref': '#/components/responses/Missing'}}}}}},
+     'Unresolvable $ref'),
+    ({'paths': {'/a': {'get': {'responses': {'200': {'$ref': 'other.json#/x'}}}}}}, 'Only local $ref'),
+])
+def test_malformed(make_config, spec, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        generate(make_config, {'openapi': '3.0.0', **spec})
+
+
+def test_circular_ref():
+    spec = ApiSpec({'openapi': '3.0.0', 'components': {'schemas': {
+        'A': {'$ref': '#/components/schemas/B'}, 'B': {'$ref': '#/components/schemas/A'},
+    }}})
+    with pytest.raises(ValueError, match='Circular'):
+        spec.resolve({'$ref': '#/components/schemas/A'})
+
+
+def test_swagger_2_rejected():
+    with pytest.raises(ValueError, match='OpenAPI 3'):
+        ApiSpec({'swagger': '2.0', 'paths': {}})
+
+
+@pytest.mark.parametrize('content, filename, message', [
+    (b'{not json', 'api.json', 'Invalid OpenAPI JSON'),
+    (b'openapi: 3.0.0', 'api.txt', 'must be a .json, .yaml or .yml file'),
+])
+def test_load_invalid(content, filename, message):
+    with pytest.raises(ValueError, match=message):
+        load_openapi(io.BytesIO(content), filename)
+
+
+def test_load_json(make_config):
+    spec = load_openapi(io.BytesIO(json.dumps(SPEC).encode('utf-8')), 'api.json')
+    assert ApiGenerator(spec, make_config()).files() == generate(make_config, SPEC)
+
+
+@pytest.mark.parametrize('configuration, message', [
+    ({'networking': 'none'}, 'networking set to retrofit or ktor'),
+    ({'networking': 'ktor', 'language': 'java', 'uiToolkit': 'xml'}, 'Ktor clients'),
+])
+def test_unsupported_project(make_config, configuration, message):
+    with pytest.raises(ValueError, match=message):
+        generate(make_config, SPEC, **configuration)
+
+
+def test_malformed_upload_is_422(generate, config_data):
+    response = generate(config_data, openapi={'openapi': '3.0.0', 'paths': {'/a': {'get': 'x'}}})
+    assert response.status_code == 422
+    assert response.json()['detail'] == 'Expected an object at #/paths/~1a/get'
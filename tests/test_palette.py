@@ -0,0 +1,35 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from generator.skeleton import SkeletonEngine
+
+
+@pytest.mark.parametrize('color', ['#6750A4', '#FF6750a4'])
+def test_theme_color(make_config, color):
+    config = make_config(themeColors={'primary': color, 'secondary': '#625B71', 'tertiary': '#7D5260'})
+    assert config.configuration.themeColors.primary == color
+
+
+@pytest.mark.parametrize('color', ['6750A4', '#6750A', '#GG50A4', 'blue'])
+def test_invalid_theme_color(validation_error, color):
+    found = validation_error(themeColors={'primary': '#6750A4', 'secondary': color, 'tertiary': '#7D5260'})
+    assert found['type'] == 'color'
+    assert found['loc'] == ('configuration', 'themeColors', 'secondary')
+
+
+@pytest.mark.parametrize('primary, literal', [('#112233', '0xFF112233'), ('#80112233', '0x80112233')])
+def test_seed_color_literals(make_config, primary, literal):
+    config = make_config(themeColors={'primary': primary, 'secondary': '#625B71', 'tertiary': '#7D5260'})
+    color_file = 'MyApp/app/src/main/kotlin/com/example/myapp/ui/theme/Color.kt'
+    files = AndroidProjectBuilder(config).render_files()
+    text = files[color_file].decode()
+    assert f'val Primary = Color({literal})' in text
+    assert 'val Secondary = Color(0xFF625B71)' in text
+    assert SkeletonEngine().render_files(config) == files
+
+
+def test_invalid_color_is_422(generate, config_data):
+    config_data['configuration']['themeColors']['primary'] = '#12345'
+    response = generate(config_data)
+    assert response.status_code == 422
+    assert response.json()['detail'][0]['loc'] == ['configuration', 'themeColors', 'primary']
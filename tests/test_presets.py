@@ -0,0 +1,44 @@
+import io
+import zipfile
+
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from generator.presets import PresetRegistry
+
+OVERRIDES = [
+    ('Weather Now', 'io.weather.now'),
+    ('My App', 'org.other.app'),
+    ('Todo-List_2', None),
+]
+
+
+@pytest.fixture(scope='module')
+def registry():
+    return PresetRegistry()
+
+
+def unzip(archive: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+@pytest.mark.parametrize('name', [
+    'compose-hilt-retrofit-room', 'compose-koin-ktor', 'compose-minimal', 'xml-koin', 'java-xml',
+])
+def test_unchanged_preset_matches_build(registry, name):
+    config, archive = registry.archive(name)
+    assert unzip(archive) == unzip(AndroidProjectBuilder(config).build_bytes())
+
+
+@pytest.mark.parametrize('name', ['compose-hilt-retrofit-room', 'java-xml'])
+@pytest.mark.parametrize('project_name, package', OVERRIDES)
+def test_rewrite_matches_build(registry, name, project_name, package):
+    config, archive = registry.archive(name, project_name, package)
+    assert config.project.name == project_name
+    assert unzip(archive) == unzip(AndroidProjectBuilder(config).build_bytes())
+
+
+def test_invalid_override(registry):
+    with pytest.raises(ValueError):
+        registry.archive('compose-minimal', package='Not A Package')
@@ -0,0 +1,107 @@
+import pytest
+
+from generator import readiness
+from generator.builder import template_environment
+from generator.readiness import BuildTracker, ReadinessCheck
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(readiness, 'time', fake)
+    return fake
+
+
+def build(tracker: BuildTracker, clock: FakeClock, seconds: float):
+    with tracker.build():
+        clock.now += seconds
+
+
+def test_p95(clock):
+    tracker = BuildTracker()
+    for seconds in range(1, 21):
+        build(tracker, clock, seconds)
+    assert tracker.p95 == 20
+    assert tracker.stats()['p95_build_ms'] == 20000.0
+
+
+def test_p95_expires(clock):
+    tracker = BuildTracker(max_age=60)
+    build(tracker, clock, 30)
+    clock.now += 30
+    build(tracker, clock, 1)
+    assert tracker.p95 == 30
+    # The slow build leaves the window first, then the fast one
+    clock.now += 40
+    assert tracker.p95 == 1
+    clock.now += 60
+    assert tracker.p95 == 0.0
+
+
+def test_queue_depth():
+    tracker = BuildTracker()
+    for _ in range(3):
+        tracker.request_started()
+    with tracker.build():
+        assert (tracker.in_flight, tracker.building, tracker.queue_depth) == (3, 1, 2)
+    tracker.request_finished()
+    assert tracker.queue_depth == 2
+
+
+@pytest.mark.parametrize('in_flight, building, p95, reasons', [
+    (2, 1, 1.0, []),
+    (5, 4, 1.0, ['in_flight']),
+    (4, 0, 1.0, ['queue_depth']),
+    (1, 1, 9.0, ['p95_build_latency']),
+    (6, 0, 9.0, ['in_flight', 'queue_depth', 'p95_build_latency']),
+])
+def test_thresholds(in_flight, building, p95, reasons):
+    tracker = BuildTracker()
+    tracker.in_flight, tracker.building, tracker._p95 = in_flight, building, p95
+    status = ReadinessCheck(tracker, max_in_flight=4, max_queue_depth=3, max_p95=5.0).status()
+    assert status['reasons'] == reasons
+    assert status['ready'] is not reasons
+
+
+def test_zero_disables_thresholds():
+    tracker = BuildTracker()
+    tracker.in_flight, tracker._p95 = 100, 100.0
+    assert ReadinessCheck(tracker, max_in_flight=0, max_queue_depth=0, max_p95=0).status()['ready']
+
+
+def test_checks_and_info():
+    check = ReadinessCheck(BuildTracker(), checks={'loaded': lambda: False}, info={'warm': lambda: False})
+    status = check.status()
+    assert status['reasons'] == ['loaded']
+    assert status['loaded'] is False and status['warm'] is False
+    assert ReadinessCheck(BuildTracker(), info={'warm': lambda: False}).status()['ready']
+
+
+def test_ready_while_prewarming(client, make_config, monkeypatch):
+    import main
+    template_environment(make_config())
+    monkeypatch.setattr(main.prewarmer, 'state', 'running')
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.json()['ready'] is True
+    assert response.json()['cache_warm'] is False
+
+
+def test_not_ready_past_threshold(client, make_config, monkeypatch):
+    import main
+    template_environment(make_config())
+    monkeypatch.setattr(main.builds, 'in_flight', main.readiness.max_in_flight + 1)
+    response = client.get('/ready')
+    assert response.status_code == 503
+    assert 'in_flight' in response.json()['reasons']
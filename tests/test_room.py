@@ -0,0 +1,65 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+
+
+def entity(name='Team', columns=None, **fields) -> dict:
+    columns = columns or [{'name': 'id', 'type': 'long', 'primaryKey': True, 'autoGenerate': True}]
+    return {'name': name, 'columns': columns, **fields}
+
+
+def test_room_schema(make_config):
+    config = make_config(roomSchema={'entities': [
+        entity('Team', indices=[{'columns': ['id']}]),
+        entity('Player', [
+            {'name': 'id', 'type': 'long', 'primaryKey': True},
+            {'name': 'team_id', 'type': 'long'},
+        ], relations=[{'column': 'team_id', 'entity': 'Team', 'parentColumn': 'id'}]),
+    ]})
+    assert len(config.configuration.roomSchema.entities) == 2
+
+
+@pytest.mark.parametrize('entities, message', [
+    ([entity(columns=[{'name': 'name', 'type': 'string'}])], 'at least one primary key'),
+    ([entity(columns=[{'name': 'id', 'type': 'long', 'primaryKey': True, 'nullable': True}])], 'cannot be nullable'),
+    ([entity(columns=[{'name': 'id', 'type': 'string', 'primaryKey': True, 'autoGenerate': True}])], 'auto-generated'),
+    ([entity(columns=[{'name': 'a', 'type': 'long', 'primaryKey': True, 'autoGenerate': True},
+                      {'name': 'b', 'type': 'long', 'primaryKey': True}])], 'auto-generated'),
+    ([entity(columns=[{'name': 'team_id', 'type': 'long', 'primaryKey': True},
+                      {'name': 'teamId', 'type': 'long'}])], 'reserved or duplicated'),
+    ([entity(columns=[{'name': 'id', 'type': 'long', 'primaryKey': True}, {'name': 'class', 'type': 'string'}])],
+     'reserved or duplicated'),
+    ([entity('Team'), entity('Team')], 'Duplicate entity'),
+    ([entity('Team'), entity('Squad', tableName='team')], 'Duplicate entity'),
+    ([entity('TeamDao')], 'reserved'),
+    ([entity('AppDatabase')], 'reserved'),
+    ([entity(indices=[{'columns': ['missing']}])], 'unknown column'),
+    ([entity('Team', [{'name': 'id', 'type': 'long', 'primaryKey': True}, {'name': 'name', 'type': 'string'}]),
+      entity('Player', [{'name': 'id', 'type': 'long', 'primaryKey': True}, {'name': 'team', 'type': 'string'}],
+             relations=[{'column': 'team', 'entity': 'Team', 'parentColumn': 'name'}])], 'unique column'),
+    ([entity(relations=[{'column': 'id', 'entity': 'Missing', 'parentColumn': 'id'}])], 'unique column'),
+])
+def test_invalid_room_schema(validation_error, entities, message):
+    found = validation_error(roomSchema={'entities': entities})
+    assert found['type'] == 'room_schema'
+    assert message in found['msg']
+
+
+def test_room_schema_requires_room(validation_error):
+    found = validation_error(enableRoom=False, roomSchema={'entities': [entity()]})
+    assert found['msg'] == 'roomSchema requires enableRoom'
+
+
+@pytest.mark.parametrize('build_format, script', [('kts', 'build.gradle.kts'), ('gradle', 'build.gradle')])
+def test_java_schema_uses_annotation_processor(make_config, build_format, script):
+    config = make_config(
+        language='java', uiToolkit='xml', buildFormat=build_format,
+        roomSchema={'entities': [entity('Team')]},
+    )
+    files = AndroidProjectBuilder(config).render_files()
+    app = files[f'MyApp/app/{script}'].decode()
+    assert any('room' in line and 'compiler' in line for line in app.splitlines() if 'annotationProcessor' in line)
+    assert 'ksp' not in app and 'kapt' not in app.lower()
+    assert 'kotlin' not in app.split('android {')[0].lower()
+    assert 'ksp' not in files[f'MyApp/{script}'].decode()
+    assert 'MyApp/app/src/main/java/com/example/myapp/data/local/AppDatabase.java' in files
@@ -0,0 +1,68 @@
+import itertools
+
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from generator.skeleton import SkeletonEngine
+from models.config_model import ProjectConfig
+
+IDENTITIES = [
+    ('My App', 'com.example.myapp'),
+    ('Other-Thing_2', 'org.x.y'),
+    ('Zed!', 'a.b'),
+]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return SkeletonEngine()
+
+
+def renamed(config: ProjectConfig, name: str, package: str) -> ProjectConfig:
+    data = config.model_dump(mode='json')
+    data['project'].update(name=name, package=package)
+    data['configuration'].update(projectName=name, projectId=package)
+    return ProjectConfig(**data)
+
+
+@pytest.mark.parametrize('ui, language, build_format, i18n', list(itertools.product(
+    ['jetpack-compose', 'xml'], ['kotlin', 'java'], ['kts', 'gradle'], [True, False],
+)))
+def test_matches_builder(engine, make_config, ui, language, build_format, i18n):
+    base = make_config(
+        uiToolkit=ui, language=language, buildFormat=build_format,
+        internationalization={'enabled': i18n, 'languages': ['en', 'fr', 'pt-BR']},
+        themeColors={'primary': '#112233', 'secondary': '#625B71', 'tertiary': '#7D5260'},
+    )
+    for name, package in IDENTITIES:
+        config = renamed(base, name, package)
+        assert engine.render_files(config) == AndroidProjectBuilder(config).render_files()
+
+
+def test_matches_builder_with_modules_and_room(engine, make_config):
+    config = make_config(
+        benchmarkModule='baselineprofile',
+        modules=[
+            {'path': ':core:common', 'type': 'jvm-library'},
+            {'path': ':core:data', 'dependencies': [':core:common']},
+            {'path': ':feature:home', 'dependencies': [':core:data']},
+        ],
+        roomSchema={'entities': [
+            {'name': 'Team', 'columns': [
+                {'name': 'id', 'type': 'long', 'primaryKey': True, 'autoGenerate': True},
+                {'name': 'name', 'type': 'string'},
+            ], 'indices': [{'columns': ['name'], 'unique': True}]},
+            {'name': 'Player', 'columns': [
+                {'name': 'id', 'type': 'long', 'primaryKey': True, 'autoGenerate': True},
+                {'name': 'team_id', 'type': 'long', 'nullable': True},
+            ], 'relations': [{'column': 'team_id', 'entity': 'Team', 'parentColumn': 'id', 'onDelete': 'SET_NULL'}]},
+        ]},
+    )
+    assert engine.render_files(config) == AndroidProjectBuilder(config).render_files()
+
+
+def test_render_file_matches_render_files(engine, make_config):
+    config = make_config()
+    files = engine.render_files(config)
+    for path in list(files)[:20]:
+        assert engine.render_file(config, path) == files[path]
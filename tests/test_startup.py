@@ -0,0 +1,36 @@
+import pytest
+
+from generator.builder import AndroidProjectBuilder
+from generator.skeleton import SkeletonEngine
+from models.config_model import ProjectConfig
+from models.naming import class_name
+
+
+@pytest.mark.parametrize('text, name', [
+    ('My App', 'MyApp'),
+    ('my-app_two', 'MyAppTwo'),
+    ("Bob's App", 'BobsApp'),
+    ('2048 Game', 'App2048Game'),
+    ('!!!', 'App'),
+])
+def test_class_name(text, name):
+    assert class_name(text) == name
+
+
+@pytest.mark.parametrize('project_name, application', [
+    ('2048 Game', 'App2048GameApplication'),
+    ("Bob's App", 'BobsAppApplication'),
+])
+@pytest.mark.parametrize('language, ui', [('kotlin', 'jetpack-compose'), ('java', 'xml')])
+def test_application_class_is_an_identifier(make_config, project_name, application, language, ui):
+    data = make_config(language=language, uiToolkit=ui).model_dump(mode='json')
+    data['project']['name'] = data['configuration']['projectName'] = project_name
+    config = ProjectConfig(**data)
+    files = AndroidProjectBuilder(config).render_files()
+    extension = 'kt' if language == 'kotlin' else 'java'
+    sources = [path for path in files if path.endswith(f'/{application}.{extension}')]
+    assert len(sources) == 1
+    assert f'class {application}' in files[sources[0]].decode()
+    manifest = next(data for path, data in files.items() if path.endswith('app/src/main/AndroidManifest.xml'))
+    assert f'android:name=".{application}"' in manifest.decode()
+    assert SkeletonEngine().render_files(config) == files